@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Cold-start-to-first-node benchmark for the launcher.
+
+Each repetition is a fresh Python process that runs
+``linkedin_news_post.launcher`` with the offline fakes of
+``benchmarks.fakes`` installed. The launcher starts the real MCP server,
+waits for it with the chosen readiness probe, builds the graph and runs it
+once. The benchmark reports the seconds from launch to each stage: server
+ready, graph built and first graph node started. Installing the fakes
+imports the graph before the launch starts, so "graph built" here excludes
+the graph's import time, which a real launch overlaps with the server's
+start anyway.
+
+Usage:
+    python -m benchmarks.bench_cold_start
+    python -m benchmarks.bench_cold_start --repeats 10 --readiness initialize
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_graph import percentile
+from benchmarks.bench_mcp import free_port
+
+
+def child(readiness: str) -> None:
+    """One cold start, in this process; prints its stages as JSON."""
+    from linkedin_news_post import launcher
+
+    # Importing bench_graph sets the offline environment the graph checks for
+    import benchmarks.bench_graph  # noqa: F401
+    from benchmarks.fakes import install_fakes
+
+    install_fakes()
+    args = launcher.parse_args(["--port", str(free_port()), "--readiness", readiness])
+    print(json.dumps(asyncio.run(launcher.launch(args, launched=time.time()))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5, help="Cold starts to measure")
+    parser.add_argument("--readiness", choices=("health", "initialize"), default="health")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args()
+
+    if args.child:
+        logging.getLogger().setLevel("WARNING")
+        child(args.readiness)
+        return
+
+    samples = []
+    for _ in range(args.repeats):
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_cold_start", "--child", "--readiness", args.readiness],
+            capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    results = {}
+    print(f"{'stage':<14} {'p50 s':>8} {'p95 s':>8} {'mean s':>8}")
+    for stage in samples[0]:
+        values = [sample[stage] for sample in samples]
+        results[stage] = {
+            "p50_s": round(percentile(values, 0.5), 3),
+            "p95_s": round(percentile(values, 0.95), 3),
+            "mean_s": round(statistics.mean(values), 3),
+        }
+        print(f"{stage:<14} {results[stage]['p50_s']:>8.3f} {results[stage]['p95_s']:>8.3f} {results[stage]['mean_s']:>8.3f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"readiness": args.readiness, "samples": samples, "stages": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end graph benchmark.
+
+Builds the real ``make_graph`` workflow on the deterministic fakes in
+``benchmarks.fakes`` (scripted chat models, fake embedder, in-memory store,
+stub Exa search and LinkedIn tool) and runs it at several concurrency
+levels. Reports per-node and end-to-end latency, peak traced memory and
+throughput. No network access or API keys are used, so the numbers measure
+the graph's own overhead and are reproducible across local runs; add
+simulated latency to see how concurrent runs overlap on I/O.
+
+Usage:
+    python -m benchmarks.bench_graph
+    python -m benchmarks.bench_graph --concurrency 1 4 16 --runs 32
+    python -m benchmarks.bench_graph --llm-latency-ms 200 --search-latency-ms 300 --output bench_graph.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from collections import defaultdict
+
+# The graph checks for these at import time; the fakes never use them
+for _name, _value in {
+    "MONGODB_URI": "mongodb://offline.invalid/",
+    "COMPOSIO_MCP_URL": "http://offline.invalid/",
+    "COMPOSIO_API_KEY": "offline",
+    "OPENAI_API_KEY": "offline",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from langchain_core.messages import ToolMessage
+
+from benchmarks.fakes import install_fakes, make_store
+from linkedin_news_post import clients
+from linkedin_news_post.graph import make_graph
+from linkedin_news_post.metrics import track_run
+from linkedin_news_post.runner import DEFAULT_INPUT
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def published(state) -> bool:
+    return any(isinstance(m, ToolMessage) and m.name == "LINKEDIN_CREATE_LINKED_IN_POST" for m in state["messages"])
+
+
+async def bench_level(concurrency, runs, rejections):
+    """Run ``runs`` graph invocations with at most ``concurrency`` in flight."""
+    clients.override("store", make_store(rejections))
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, node_times, ok = [], defaultdict(list), 0
+
+    async def run_one(graph):
+        nonlocal ok
+        async with semaphore:
+            start = time.perf_counter()
+            with track_run() as run_metrics:
+                state = await graph.ainvoke(DEFAULT_INPUT)
+            latencies.append(time.perf_counter() - start)
+            for node in run_metrics.nodes:
+                node_times[node["node"]].append(node["duration"])
+            ok += published(state)
+
+    async with make_graph() as graph:
+        tracemalloc.start()
+        start = time.perf_counter()
+        await asyncio.gather(*(run_one(graph) for _ in range(runs)))
+        wall = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "concurrency": concurrency,
+        "runs": runs,
+        "published": ok,
+        "wall_s": round(wall, 4),
+        "throughput_runs_per_s": round(runs / wall, 2),
+        "run_p50_s": round(percentile(latencies, 0.5), 4),
+        "run_p95_s": round(percentile(latencies, 0.95), 4),
+        "peak_traced_mb": round(peak / 2**20, 2),
+        "nodes": {
+            node: {
+                "visits_per_run": round(len(times) / runs, 2),
+                "p50_ms": round(percentile(times, 0.5) * 1000, 3),
+                "p95_ms": round(percentile(times, 0.95) * 1000, 3),
+                "mean_ms": round(statistics.mean(times) * 1000, 3),
+            }
+            for node, times in sorted(node_times.items())
+        },
+    }
+
+
+async def bench(args):
+    install_fakes(args.llm_latency_ms / 1000, args.search_latency_ms / 1000, args.rejections)
+    if args.warmup:
+        await bench_level(1, args.warmup, args.rejections)
+    return [await bench_level(level, args.runs, args.rejections) for level in args.concurrency]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8], help="Concurrency levels to run")
+    parser.add_argument("--runs", type=int, default=8, help="Graph runs per concurrency level")
+    parser.add_argument("--rejections", type=int, default=1, help="Drafts rejected as duplicates before one is published")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency of every chat model call")
+    parser.add_argument("--search-latency-ms", type=float, default=0.0, help="Simulated latency of every search")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before measuring")
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(args.log_level)
+
+    results = asyncio.run(bench(args))
+
+    print(f"{'conc':>4} {'runs':>5} {'ok':>4} {'wall s':>8} {'runs/s':>8} {'p50 s':>8} {'p95 s':>8} {'peak MB':>8}")
+    for row in results:
+        print(
+            f"{row['concurrency']:>4} {row['runs']:>5} {row['published']:>4} {row['wall_s']:>8.3f} "
+            f"{row['throughput_runs_per_s']:>8.2f} {row['run_p50_s']:>8.3f} {row['run_p95_s']:>8.3f} {row['peak_traced_mb']:>8.2f}"
+        )
+    print(f"\n{'conc':>4} {'node':<16} {'visits':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for row in results:
+        for node, stats in row["nodes"].items():
+            print(f"{row['concurrency']:>4} {node:<16} {stats['visits_per_run']:>6.2f} {stats['p50_ms']:>8.3f} {stats['p95_ms']:>8.3f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
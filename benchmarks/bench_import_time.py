@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Import-time budget benchmark.
+
+Imports each module in a fresh interpreter with ``python -X importtime`` and
+compares the median cumulative import time with a budget. Exits with a
+non-zero status when a module is over budget so regressions show up in CI.
+
+Usage:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --budget-ms 1200 --repeat 7 --top 15
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    "linkedin_news_post.graph",
+    "linkedin_news_post.nodes",
+    "linkedin_news_post.chains",
+]
+
+LINE = re.compile(r"import time:\s+(-?\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(module):
+    """Return ({module: (self_us, cumulative_us)}, top-level cumulative us) for one import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=os.environ.copy(),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+    timings = {}
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            timings[name] = (int(self_us), int(cumulative_us))
+    return timings, timings[module][1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--budget-ms", type=float, default=float(os.environ.get("IMPORT_TIME_BUDGET_MS", 1500)))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Show the slowest N imports by cumulative time")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        median_ms = statistics.median(total for _, total in runs) / 1000
+        status = "OK" if median_ms <= args.budget_ms else "OVER BUDGET"
+        over_budget |= median_ms > args.budget_ms
+        print(f"{module}: median {median_ms:.0f} ms over {args.repeat} runs (budget {args.budget_ms:.0f} ms) {status}")
+
+        timings, _ = runs[-1]
+        slowest = sorted(
+            ((name, cumulative) for name, (_, cumulative) in timings.items() if name != module),
+            key=lambda item: item[1], reverse=True,
+        )[:args.top]
+        for name, cumulative in slowest:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for concurrent MCP tool calls.
+
+Starts the real MCP server over SSE in-process on a free local port, with
+``benchmarks.fakes.FakeExa`` in place of Exa, and connects N clients at each
+concurrency level. Each client opens its own MCP session and makes
+``--calls`` sequential ``search_and_content`` calls, so N clients keep N
+calls in flight against one shared server. A "direct" row calls the tool
+function without any transport, to show what the protocol itself costs.
+
+The search cache and news corpus are off unless ``--cache`` is given, so
+every call reaches the (fake) Exa client.
+
+Usage:
+    python -m benchmarks.bench_mcp
+    python -m benchmarks.bench_mcp --clients 1 8 32 --calls 50 --search-latency-ms 100
+"""
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import time
+
+import uvicorn
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+from benchmarks.bench_graph import percentile
+from benchmarks.fakes import FakeExa
+from linkedin_news_post import clients
+from linkedin_news_post.mcp_server import mcp, search_and_content_tool
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def summarize(name, concurrency, latencies, wall):
+    return {
+        "transport": name,
+        "clients": concurrency,
+        "calls": len(latencies),
+        "wall_s": round(wall, 4),
+        "calls_per_s": round(len(latencies) / wall, 1),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+    }
+
+
+async def bench_direct(concurrency, calls):
+    latencies = []
+
+    async def client(index):
+        for call in range(calls):
+            start = time.perf_counter()
+            await search_and_content_tool(f"mro news {index}-{call}")
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    return summarize("direct", concurrency, latencies, time.perf_counter() - start)
+
+
+async def bench_sse(url, concurrency, calls):
+    latencies = []
+    connected = asyncio.Barrier(concurrency + 1)
+
+    async def client(index):
+        async with sse_client(url) as (read, write), ClientSession(read, write) as session:
+            await session.initialize()
+            await connected.wait()
+            for call in range(calls):
+                start = time.perf_counter()
+                result = await session.call_tool("search_and_content", {"query": f"mro news {index}-{call}"})
+                latencies.append(time.perf_counter() - start)
+                if result.isError:
+                    raise RuntimeError(result.content[0].text)
+
+    tasks = [asyncio.create_task(client(i)) for i in range(concurrency)]
+    # Only the tool calls are timed, not the connection handshakes
+    await connected.wait()
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return summarize("sse", concurrency, latencies, time.perf_counter() - start)
+
+
+async def bench(args):
+    exa = FakeExa(args.search_latency_ms / 1000)
+    clients.override("exa", exa)
+    if not args.cache:
+        clients.override("search_cache", None)
+        clients.override("news_corpus", None)
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(mcp.sse_app(), host="127.0.0.1", port=port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    results = []
+    try:
+        for level in args.clients:
+            results.append(await bench_direct(level, args.calls))
+            results.append(await bench_sse(f"http://127.0.0.1:{port}/sse", level, args.calls))
+    finally:
+        server.should_exit = True
+        await serving
+    return results, exa.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16], help="Concurrent client sessions")
+    parser.add_argument("--calls", type=int, default=20, help="Sequential tool calls per client")
+    parser.add_argument("--search-latency-ms", type=float, default=50.0, help="Simulated latency of every Exa search")
+    parser.add_argument("--cache", action="store_true", help="Keep the search cache and news corpus on")
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(args.log_level)
+
+    results, exa_calls = asyncio.run(bench(args))
+
+    print(f"{'transport':<10} {'clients':>7} {'calls':>6} {'wall s':>8} {'calls/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for row in results:
+        print(
+            f"{row['transport']:<10} {row['clients']:>7} {row['calls']:>6} {row['wall_s']:>8.3f} "
+            f"{row['calls_per_s']:>8.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}"
+        )
+    print(f"\nExa searches: {exa_calls}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Per-node model routing benchmark.
+
+Invokes every chain on a fixed sample transcript under one or more model
+configurations and records latency and token usage per node. This calls
+the live OpenAI API.
+
+Usage:
+    python -m benchmarks.bench_models
+    python -m benchmarks.bench_models --config single --config routed --repeat 5
+    python -m benchmarks.bench_models --config my_configs.json --output bench_models.json
+
+A JSON configuration file maps configuration names to per-node overrides of
+``config.NODE_MODELS``, e.g. ``{"mini-writer": {"writer": {"model": "gpt-4o-mini"}}}``.
+"""
+import argparse
+import json
+import statistics
+import time
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.messages import AIMessage, HumanMessage
+
+from linkedin_news_post.config import DEFAULT_MODEL, NODE_MODELS
+from linkedin_news_post.chains.supervisor_chain import make_supervisor_chain
+from linkedin_news_post.chains.researcher_chain import make_researcher_chain
+from linkedin_news_post.chains.writer_chain import make_writer_chain
+from linkedin_news_post.chains.quality_chain import make_quality_chain
+from linkedin_news_post.chains.publisher_chain import make_publisher_chain
+from linkedin_news_post.runtime import RunSettings
+
+CHAIN_FACTORIES = {
+    "supervisor": make_supervisor_chain,
+    "researcher": make_researcher_chain,
+    "writer": make_writer_chain,
+    "quality": make_quality_chain,
+    "publisher": make_publisher_chain,
+}
+
+SAMPLE_ARTICLE = (
+    "Title: Airline MRO shops adopt predictive maintenance platforms\n"
+    "Published: 2025-03-28\n\n"
+    "A survey of 120 MRO providers found that 38% now run predictive maintenance "
+    "analytics on engine data, cutting unscheduled removals by up to 25%."
+)
+SAMPLE_POST = (
+    "38% of MRO providers now use predictive analytics on engine data, cutting "
+    "unscheduled removals by up to 25%.\n\n#AviationMaintenance #MRO"
+)
+
+SAMPLE_INPUTS = {
+    "supervisor": {"messages": [
+        HumanMessage(content="Publish a linkedin article"),
+        HumanMessage(content=SAMPLE_ARTICLE, name="researcher_node"),
+    ]},
+    "researcher": {"messages": [
+        HumanMessage(content="Publish a linkedin article"),
+        HumanMessage(content="Tell me news about aviation maintenance picking 3 distinct topics of your choice"),
+    ]},
+    "writer": {"messages": [
+        HumanMessage(content="Publish a linkedin article"),
+        HumanMessage(content=SAMPLE_ARTICLE, name="researcher_node"),
+    ]},
+    "quality": {
+        "messages": [HumanMessage(content=SAMPLE_POST, name="writer_node")],
+        "past_articles": [],
+    },
+    "publisher": {"messages": [
+        AIMessage(content=SAMPLE_POST, name="writer_node"),
+        HumanMessage(content="Approved: the article is distinct from past articles.", name="quality_node"),
+    ]},
+}
+
+
+def builtin_configs():
+    """Baseline with every node on the default model, and the per-node registry."""
+    single = {node: {"model": DEFAULT_MODEL, "fallbacks": []} for node in CHAIN_FACTORIES}
+    return {"single": single, "routed": {}}
+
+
+def load_configs(names):
+    configs = {}
+    available = builtin_configs()
+    for name in names:
+        if name in available:
+            configs[name] = available[name]
+        else:
+            with open(name) as f:
+                configs.update(json.load(f))
+    return configs
+
+
+def bench_node(node, overrides, repeat):
+    chain = CHAIN_FACTORIES[node](overrides or None)
+    latencies, input_tokens, output_tokens = [], 0, 0
+    for _ in range(repeat):
+        usage = UsageMetadataCallbackHandler()
+        start = time.perf_counter()
+        chain.invoke(RunSettings().chain_input(SAMPLE_INPUTS[node]), config={"callbacks": [usage]})
+        latencies.append(time.perf_counter() - start)
+        for metadata in usage.usage_metadata.values():
+            input_tokens += metadata.get("input_tokens", 0)
+            output_tokens += metadata.get("output_tokens", 0)
+    return {
+        "model": {**NODE_MODELS[node], **(overrides or {})}["model"],
+        "latency_median_s": round(statistics.median(latencies), 3),
+        "latency_max_s": round(max(latencies), 3),
+        "input_tokens_per_call": input_tokens / repeat,
+        "output_tokens_per_call": output_tokens / repeat,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", action="append", help="'single', 'routed' or a JSON file (repeatable)")
+    parser.add_argument("--node", action="append", choices=sorted(CHAIN_FACTORIES), help="Nodes to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args()
+
+    configs = load_configs(args.config or ["single", "routed"])
+    nodes = args.node or list(CHAIN_FACTORIES)
+
+    results = {}
+    for name, config in configs.items():
+        results[name] = {node: bench_node(node, config.get(node), args.repeat) for node in nodes}
+
+    print(f"{'config':<12} {'node':<12} {'model':<16} {'median s':>9} {'max s':>8} {'in tok':>8} {'out tok':>8}")
+    for name, per_node in results.items():
+        for node, row in per_node.items():
+            print(
+                f"{name:<12} {node:<12} {row['model']:<16} {row['latency_median_s']:>9.3f} "
+                f"{row['latency_max_s']:>8.3f} {row['input_tokens_per_call']:>8.0f} {row['output_tokens_per_call']:>8.0f}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Prompt-prefix stability check.
+
+Renders every chain prompt for two successive calls of one run (a later date,
+a longer transcript with quality feedback, different past articles) and
+measures how much of the rendered prompt is byte-identical between them.
+Only that shared prefix can be served from the provider's prompt cache, and
+only once it reaches the provider's minimum (1024 tokens for OpenAI). Token
+counts are estimated at four characters per token. Exits with a non-zero
+status if a chain's stable prefix is shorter than its static instructions,
+i.e. something volatile was interpolated into them.
+
+Usage:
+    python -m benchmarks.bench_prompt_prefix
+"""
+import argparse
+import sys
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from linkedin_news_post.chains.supervisor_chain import systemPrompt as supervisor_prompt, system as supervisor_system
+from linkedin_news_post.chains.researcher_chain import systemPrompt as researcher_prompt, system as researcher_system
+from linkedin_news_post.chains.writer_chain import systemPrompt as writer_prompt, system as writer_system
+from linkedin_news_post.chains.quality_chain import systemPrompt as quality_prompt, system as quality_system
+from linkedin_news_post.chains.publisher_chain import systemPrompt as publisher_prompt, system as publisher_system
+from linkedin_news_post.runtime import RunSettings
+
+PROMPTS = {
+    "supervisor": (supervisor_prompt, supervisor_system),
+    "researcher": (researcher_prompt, researcher_system),
+    "writer": (writer_prompt, writer_system),
+    "quality": (quality_prompt, quality_system),
+    "publisher": (publisher_prompt, publisher_system),
+}
+
+FIRST_CALL = [
+    HumanMessage(content="Publish a linkedin article"),
+    AIMessage(content="Title: MRO shops adopt predictive maintenance\n38% of providers now run analytics.", name="researcher_node"),
+]
+LATER_CALL = FIRST_CALL + [
+    AIMessage(content="38% of MRO providers now use predictive analytics.\n\n#MRO #Aviation", name="writer_node"),
+    AIMessage(content="Rejected: same news as a past article; research sustainability instead.", name="quality_node"),
+]
+
+
+def render(prompt, messages, today, past_articles):
+    values = RunSettings().chain_input({"messages": messages, "past_articles": past_articles, "today": today})
+    return "".join(f"<{m.type}>{m.content}" for m in prompt.invoke(values).to_messages())
+
+
+def common_prefix(a, b):
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-cached-tokens", type=int, default=1024, help="Provider minimum for prompt caching")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'chain':<12} {'prompt tok':>10} {'stable tok':>10} {'stable %':>8} {'static tok':>10}  cacheable")
+    for name, (prompt, static) in PROMPTS.items():
+        first = render(prompt, FIRST_CALL, "2026-01-05", ["Past article A"])
+        later = render(prompt, LATER_CALL, "2026-01-06", ["Past article B"])
+        stable = common_prefix(first, later) // 4
+        # The instructions before the first template variable must all be shared
+        static_tokens = len(static.split("{")[0]) // 4
+        failed |= stable < static_tokens
+        print(
+            f"{name:<12} {len(later) // 4:>10} {stable:>10} {stable / (len(later) // 4):>8.0%} {static_tokens:>10}  "
+            f"{'yes' if stable >= args.min_cached_tokens else 'no (below provider minimum)'}"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
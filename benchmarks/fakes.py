@@ -0,0 +1,241 @@
+"""
+Deterministic offline stand-ins for the graph's external dependencies.
+
+``install_fakes`` swaps the chains, memory model, embeddings, store, Exa
+search and LinkedIn tools in the client registry, so the real ``make_graph``
+workflow runs without network access. Chains keep their real prompt
+templates; only the chat model behind them is scripted:
+
+    supervisor  routes on the last worker message and returns a ``Handout``
+                tool call, parsed like ``with_structured_output``
+    researcher  emits ``RESEARCH_QUERY_COUNT`` parallel search tool calls
+    writer      writes draft N on the run's N-th visit
+    quality     approves (the score-based gate decides most drafts anyway)
+    publisher   calls the LinkedIn tool
+
+The store is an ``InMemoryStore`` with a deterministic embedder. It is seeded
+with the first ``rejections`` drafts, so the quality gate rejects those
+drafts as duplicates and the loop runs that many extra times.
+"""
+import asyncio
+import hashlib
+import json
+import re
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, List, Optional
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.output_parsers.openai_tools import PydanticToolsParser
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+from langgraph.store.memory import InMemoryStore
+
+from linkedin_news_post import clients
+from linkedin_news_post.config import RESEARCH_QUERY_COUNT, SEARCH_NUM_RESULTS
+from linkedin_news_post.metrics import METRICS_CALLBACK
+
+EMBEDDING_DIMS = 256
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model whose reply is computed from the prompt by a script, after a fixed latency."""
+
+    script: Callable[[List[BaseMessage]], AIMessage]
+    latency: float = 0.0
+    model_name: str = "scripted"
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        message = self.script(messages)
+        prompt_tokens = sum(len(str(m.content)) for m in messages) // 4
+        completion_tokens = max(1, (len(str(message.content)) + len(json.dumps(message.tool_calls))) // 4)
+        message.usage_metadata = {
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)], llm_output={"model_name": self.model_name})
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._result(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._result(messages)
+
+    def bind_tools(self, tools, **kwargs):
+        # trustcall (langmem) unwraps ``.bound``, so return a binding like real chat models do
+        return self.bind()
+
+
+def _transcript(messages: List[BaseMessage]) -> str:
+    # Some prompts render the graph messages into one user turn (as their repr,
+    # including name='...'); others pass them through a placeholder
+    return "\n".join(str(m.content) + (f" name='{m.name}'" if m.name else "") for m in messages)
+
+
+def _count(transcript: str, node: str) -> int:
+    return transcript.count(f"name='{node}'")
+
+
+def _route(messages: List[BaseMessage]) -> AIMessage:
+    transcript = _transcript(messages)
+    names = re.findall(r"name='([A-Za-z_]+)'", transcript)
+    last = next((name for name in reversed(names) if name != "supervisor_node"), None)
+    if last == "researcher_node":
+        next_node = "writer_node"
+    elif last == "writer_node":
+        next_node = "quality_node"
+    elif last == "quality_node":
+        verdicts = re.findall(r"content=['\"](Approved|Rejected)", transcript)
+        next_node = "publisher_node" if verdicts and verdicts[-1] == "Approved" else "researcher_node"
+    elif last == "LINKEDIN_CREATE_LINKED_IN_POST":
+        next_node = "end_node"
+    else:
+        next_node = "researcher_node"
+    return AIMessage(content="", tool_calls=[{"name": "Handout", "args": {"next_node": next_node}, "id": "handout"}])
+
+
+def _research(messages: List[BaseMessage]) -> AIMessage:
+    round_ = _count(_transcript(messages), "search_and_content") // RESEARCH_QUERY_COUNT
+    return AIMessage(content="", tool_calls=[
+        {
+            "name": "search_and_content",
+            "args": {"query": f"aviation maintenance topic {round_}-{i}"},
+            "id": f"search-{round_}-{i}",
+        }
+        for i in range(RESEARCH_QUERY_COUNT)
+    ])
+
+
+def draft(index: int) -> str:
+    """The writer's deterministic post for its ``index``-th visit in a run."""
+    return (
+        f"Draft {index}: predictive maintenance analytics cut unscheduled engine removals "
+        f"by {20 + index}% across surveyed MRO shops.\n\n#AviationMaintenance #MRO"
+    )
+
+
+def _write(messages: List[BaseMessage]) -> AIMessage:
+    return AIMessage(content=draft(_count(_transcript(messages), "writer_node")))
+
+
+def _check_quality(messages: List[BaseMessage]) -> AIMessage:
+    return AIMessage(content="Approved: the article offers a new angle.")
+
+
+def _publish(messages: List[BaseMessage]) -> AIMessage:
+    return AIMessage(content="", tool_calls=[{
+        "name": "LINKEDIN_CREATE_LINKED_IN_POST",
+        "args": {"params": {"author": "urn:li:organization:0000000", "commentary": draft(0)}},
+        "id": "publish",
+    }])
+
+
+def _remember(messages: List[BaseMessage]) -> AIMessage:
+    return AIMessage(content="Nothing to extract.")
+
+
+@tool
+def LINKEDIN_CREATE_LINKED_IN_POST(params: dict) -> str:
+    """Stub of the Composio LinkedIn post tool."""
+    return json.dumps({"successful": True, "data": {"id": "urn:li:share:0"}})
+
+
+def fake_response(query: str) -> SimpleNamespace:
+    """Exa-like response with ``SEARCH_NUM_RESULTS`` results, half of them shared across queries."""
+    digest = hashlib.sha1(query.encode()).hexdigest()[:8]
+    results = []
+    for i in range(SEARCH_NUM_RESULTS):
+        url = f"https://news.example.com/{'shared' if i % 2 else digest}/{i}"
+        results.append(SimpleNamespace(
+            url=url,
+            title=f"MRO story {i} for {query}",
+            published_date="2026-10-01T00:00:00.000Z",
+            author="Newsroom",
+            text=f"Story {i} about {query}: maintenance programs, regulations and MRO software.",
+            score=1.0 - i / (SEARCH_NUM_RESULTS + 1),
+        ))
+    return SimpleNamespace(results=results)
+
+
+def fake_search(latency: float = 0.0) -> Callable[..., Any]:
+    """Stub of the in-process ``search_and_content``."""
+    def search_and_content(query: str, start_published_date: Optional[str] = None, end_published_date: Optional[str] = None):
+        if latency:
+            time.sleep(latency)
+        return fake_response(query)
+    return search_and_content
+
+
+def fake_asearch(latency: float = 0.0) -> Callable[..., Any]:
+    """Stub of the in-process ``asearch_and_content``."""
+    async def asearch_and_content(query: str, start_published_date: Optional[str] = None, end_published_date: Optional[str] = None):
+        if latency:
+            await asyncio.sleep(latency)
+        return fake_response(query)
+    return asearch_and_content
+
+
+class FakeExa:
+    """Stub of ``PooledExa`` for the MCP server's tools."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def search_and_contents(self, query: str, **options: Any) -> SimpleNamespace:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return fake_response(query)
+
+    async def asearch_and_contents(self, query: str, **options: Any) -> SimpleNamespace:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return fake_response(query)
+
+
+def make_store(rejections: int = 0) -> InMemoryStore:
+    """Local store with a deterministic embedder, seeded so the first ``rejections`` drafts are duplicates."""
+    embeddings = DeterministicFakeEmbedding(size=EMBEDDING_DIMS)
+    store = InMemoryStore(index={"dims": EMBEDDING_DIMS, "embed": embeddings, "fields": ["content.article"]})
+    for index in range(rejections):
+        # Same layout as the entries langmem's memory manager writes
+        store.put(("articles",), f"seed-{index}", {"kind": "Article", "content": {"article": draft(index)}})
+    return store
+
+
+def install_fakes(llm_latency: float = 0.0, search_latency: float = 0.0, rejections: int = 0) -> None:
+    """Replace every external dependency of the graph in the client registry."""
+    from linkedin_news_post.chains.supervisor_chain import Handout, systemPrompt as supervisor_prompt
+    from linkedin_news_post.chains.researcher_chain import systemPrompt as researcher_prompt
+    from linkedin_news_post.chains.writer_chain import systemPrompt as writer_prompt
+    from linkedin_news_post.chains.quality_chain import systemPrompt as quality_prompt
+    from linkedin_news_post.chains.publisher_chain import systemPrompt as publisher_prompt
+
+    def model(script, name):
+        return ScriptedChatModel(script=script, latency=llm_latency, model_name=f"scripted-{name}", callbacks=[METRICS_CALLBACK])
+
+    clients.reset()
+    clients.override("supervisor_chain", supervisor_prompt | model(_route, "supervisor") | PydanticToolsParser(tools=[Handout], first_tool_only=True))
+    clients.override("researcher_chain", researcher_prompt | model(_research, "researcher"))
+    clients.override("writer_chain", writer_prompt | model(_write, "writer"))
+    clients.override("quality_chain", quality_prompt | model(_check_quality, "quality"))
+    clients.override("publisher_chain", publisher_prompt | model(_publish, "publisher"))
+    clients.override("memory_model", model(_remember, "memory"))
+    clients.override("embeddings", DeterministicFakeEmbedding(size=EMBEDDING_DIMS))
+    clients.override("store", make_store(rejections))
+    clients.override("search", fake_search(search_latency))
+    clients.override("asearch", fake_asearch(search_latency))
+    clients.override("linkedin_tools", [LINKEDIN_CREATE_LINKED_IN_POST])
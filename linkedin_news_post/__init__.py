@@ -1,2 +1,11 @@
-from .state import State
-from .mongo_store import MongoDBBaseStore
+import importlib
+
+# Re-exports are imported on first use, so processes that never touch the
+# graph state or the MongoDB store (the MCP server) start without LangGraph
+_EXPORTS = {"State": ".state", "SearchTask": ".state", "MongoDBBaseStore": ".mongo_store"}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,149 @@
+"""
+Per-run budgets for the supervisor loop.
+
+A run may spend a bounded number of node visits, tokens, seconds, dollars
+and quality rejections. The supervisor checks the budget before every
+decision; once a limit is reached the run publishes the last approved draft
+if there is one, or stops with a report. Limits default to ``config.py`` and
+can be overridden per run through ``config["configurable"]``.
+
+Usage is read from the graph state (``run_usage``, reported by every node),
+so budgets hold however the graph is invoked: ``langgraph dev``, a direct
+``graph.ainvoke`` or the runners, with or without ``track_run``.
+"""
+import json
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import AnyMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+from linkedin_news_post.chains.quality_chain import APPROVED, REJECTED
+from linkedin_news_post.config import (
+    COMPOSIO_LINKEDIN_TOOL, RUN_MAX_NODE_VISITS, RUN_MAX_TOKENS, RUN_MAX_SECONDS, RUN_MAX_COST_USD, RUN_MAX_QUALITY_REJECTIONS
+)
+from linkedin_news_post.metrics import REGISTRY, RunMetrics, node_usage
+from linkedin_news_post.state import merge_usage
+
+
+@dataclass(frozen=True)
+class RunBudget:
+    max_node_visits: int = RUN_MAX_NODE_VISITS
+    max_tokens: int = RUN_MAX_TOKENS
+    max_seconds: float = RUN_MAX_SECONDS
+    max_cost_usd: float = RUN_MAX_COST_USD
+    max_quality_rejections: int = RUN_MAX_QUALITY_REJECTIONS
+
+
+# Usage key checked against each limit
+_LIMITS = {
+    "max_node_visits": "node_visits",
+    "max_tokens": "tokens",
+    "max_seconds": "seconds",
+    "max_cost_usd": "cost_usd",
+    "max_quality_rejections": "quality_rejections",
+}
+
+
+def get_run_budget(config: Optional[RunnableConfig] = None) -> RunBudget:
+    """Read budget overrides from ``config["configurable"]``."""
+    configurable = (config or {}).get("configurable", {})
+    overrides = {f.name: configurable[f.name] for f in fields(RunBudget) if configurable.get(f.name) is not None}
+    return RunBudget(**overrides)
+
+
+def is_approval(content: str) -> bool:
+    """True if a quality_node message approves the draft; the quality node writes every verdict with a fixed prefix."""
+    return content.startswith(APPROVED)
+
+
+def is_rejection(content: str) -> bool:
+    """True if a quality_node message rejects the draft; errors of the quality check carry no verdict."""
+    return content.startswith(REJECTED)
+
+
+def quality_rejections(messages: List[AnyMessage]) -> int:
+    return sum(
+        1 for message in messages
+        if getattr(message, "name", None) == "quality_node" and is_rejection(message.content)
+    )
+
+
+def measure_usage(messages: List[AnyMessage], run_usage: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+    """
+    Measure what the run has consumed so far.
+
+    ``run_usage`` is the usage accumulated in state; the node being executed
+    is added to it. Without any, as for a graph built without
+    ``instrument_node``, node visits are counted from the named messages.
+    """
+    usage = {"quality_rejections": quality_rejections(messages)}
+    current = merge_usage(run_usage, node_usage())
+    if current["started_at"] is None:
+        usage["node_visits"] = sum(1 for message in messages if (getattr(message, "name", None) or "").endswith("_node"))
+        return usage
+    usage.update(
+        node_visits=current["node_visits"],
+        tokens=current["tokens"],
+        seconds=round(time.time() - current["started_at"], 3),
+        cost_usd=round(current["cost_usd"], 6),
+    )
+    return usage
+
+
+def exhausted(budget: RunBudget, usage: Dict[str, float]) -> Optional[str]:
+    """Return a description of the first limit reached, or None while within budget."""
+    for limit, key in _LIMITS.items():
+        if key in usage and usage[key] >= getattr(budget, limit):
+            return f"{key} {usage[key]:g}/{getattr(budget, limit):g}"
+    return None
+
+
+def record_budget(run: Optional[RunMetrics], budget: RunBudget, usage: Dict[str, float], reason: Optional[str]) -> None:
+    """Store the budget consumption on the run's metrics."""
+    already_exhausted = run is not None and run.budget is not None and run.budget["exhausted"]
+    if reason and not already_exhausted:
+        REGISTRY.inc("budget_exhausted_total", help="Runs stopped by a budget limit", limit=reason.split()[0])
+    if run is not None:
+        run.budget = {"limits": asdict(budget), "usage": usage, "exhausted": reason}
+
+
+def format_usage(budget: RunBudget, usage: Dict[str, float]) -> str:
+    return ", ".join(
+        f"{key} {usage[key]:g}/{getattr(budget, limit):g}"
+        for limit, key in _LIMITS.items() if key in usage
+    )
+
+
+def is_published(message: AnyMessage) -> bool:
+    """True if the message is the result of a LinkedIn post that went through."""
+    if not isinstance(message, ToolMessage) or message.name != COMPOSIO_LINKEDIN_TOOL or message.status == "error":
+        return False
+    try:
+        result = json.loads(message.content)
+    except (TypeError, ValueError):
+        return not str(message.content).startswith("Error")
+    return not isinstance(result, dict) or (result.get("successful", True) is not False and not result.get("error"))
+
+
+def approved_draft(messages: List[AnyMessage]) -> Optional[Dict[str, Any]]:
+    """
+    Find the draft approved by the most recent quality check.
+
+    Returns:
+        ``{"draft": str, "published": bool}`` or None when the latest quality
+        check did not approve a draft
+    """
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if getattr(message, "name", None) != "quality_node":
+            continue
+        if not is_approval(message.content):
+            return None
+        drafts = [m for m in messages[:index] if getattr(m, "name", None) == "writer_node"]
+        if not drafts:
+            return None
+        published = any(is_published(m) for m in messages[index + 1:])
+        return {"draft": drafts[-1].content, "published": published}
+    return None
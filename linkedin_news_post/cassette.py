@@ -0,0 +1,350 @@
+"""
+Record/replay cassettes for the graph's external calls.
+
+A cassette records every chat model generation, Exa search, embedding call
+and Composio tool call of a run, keyed by a hash of the normalized request,
+and replays them later without any network access. Replaying a recorded run
+reproduces its traffic exactly, so latency and behaviour can be profiled and
+regression-tested offline; with ``realtime=True`` each replayed call also
+waits for its recorded duration.
+
+The on-disk format is gzip-compressed JSON Lines, one interaction per line:
+
+    {"k": kind, "h": request hash, "ms": recorded duration, "r": response}
+
+Requests are normalized before hashing: message and run ids are dropped,
+ISO dates are masked and whitespace is collapsed, so a run recorded on one
+day replays on another. Identical requests are replayed in recording order.
+"""
+import asyncio
+import atexit
+import base64
+import functools
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from array import array
+from collections import defaultdict, deque
+from types import SimpleNamespace
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from linkedin_news_post.config import logger
+
+MODES = ("off", "record", "replay")
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?Z?)?")
+# Keys whose values differ between otherwise identical requests
+_VOLATILE_KEYS = {"id", "run_id"}
+
+
+class CassetteMiss(LookupError):
+    """Raised when a replayed run makes a request that was never recorded."""
+
+
+def normalize(value: Any) -> Any:
+    """Strip ids, mask dates and collapse whitespace so equivalent requests hash alike."""
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in sorted(value.items()) if k not in _VOLATILE_KEYS}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    if isinstance(value, str):
+        return _DATE.sub("<date>", " ".join(value.split()))
+    return value
+
+
+def request_hash(kind: str, request: Any) -> str:
+    payload = json.dumps([kind, normalize(request)], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+class Cassette:
+    """
+    A recording of a run's external calls.
+
+    Args:
+        path: The ``.jsonl.gz`` file to record to or replay from
+        mode: "record" calls the live dependency and appends to the file;
+            "replay" answers from the file and raises ``CassetteMiss`` for
+            unrecorded requests
+        realtime: When replaying, wait for each call's recorded duration
+    """
+
+    def __init__(self, path: str, mode: str = "replay", realtime: bool = False):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode '{mode}'")
+        self.path = path
+        self.mode = mode
+        self.realtime = realtime
+        self.llm_cache = CassetteLLMCache(self)
+        self._entries: Dict[str, Deque[Tuple[float, Any]]] = defaultdict(deque)
+        self._last: Dict[str, Tuple[float, Any]] = {}
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._file = None
+        if mode == "replay":
+            self._load()
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Appending adds a new gzip member, which gzip readers concatenate
+            self._file = gzip.open(path, "at", encoding="utf-8")
+            atexit.register(self.close)
+        logger.info(f"Cassette {mode} {'from' if mode == 'replay' else 'to'} {path}")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["h"]].append((entry.get("ms", 0) / 1000, entry["r"]))
+            except (EOFError, json.JSONDecodeError):
+                # A recording interrupted before it was closed ends mid-stream
+                logger.warning(f"Cassette {self.path} is truncated; replaying the calls before the cut")
+        logger.info(f"Loaded {sum(len(e) for e in self._entries.values())} recorded calls from {self.path}")
+
+    def record(self, kind: str, key: str, response: Any, duration: float) -> None:
+        line = json.dumps({"k": kind, "h": key, "ms": round(duration * 1000), "r": response}, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._counts[f"{kind}_recorded"] += 1
+
+    def replay(self, kind: str, key: str) -> Tuple[float, Any]:
+        """Return the next recorded ``(duration, response)`` for a request hash."""
+        with self._lock:
+            queue = self._entries.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            elif key not in self._last:
+                self._counts[f"{kind}_missed"] += 1
+                raise CassetteMiss(f"No recorded {kind} call for request {key} in {self.path}")
+            # Requests repeated more often than recorded reuse the last response
+            self._counts[f"{kind}_replayed"] += 1
+            return self._last[key]
+
+    def wrap(
+        self,
+        func: Callable,
+        kind: str,
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+    ) -> Callable:
+        """
+        Wrap a blocking or async call so it is recorded or replayed.
+
+        Args:
+            func: The live call
+            kind: Dependency kind, part of the request hash, e.g. "exa"
+            encode: Turns the live result into JSON-serializable data
+            decode: Rebuilds a result from the recorded data
+        """
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = request_hash(kind, {"args": args, "kwargs": kwargs})
+                if self.replaying:
+                    duration, response = self.replay(kind, key)
+                    if self.realtime and duration:
+                        await asyncio.sleep(duration)
+                    return decode(response)
+                start = time.perf_counter()
+                result = await func(*args, **kwargs)
+                self.record(kind, key, encode(result), time.perf_counter() - start)
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = request_hash(kind, {"args": args, "kwargs": kwargs})
+            if self.replaying:
+                duration, response = self.replay(kind, key)
+                if self.realtime and duration:
+                    time.sleep(duration)
+                return decode(response)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.record(kind, key, encode(result), time.perf_counter() - start)
+            return result
+        return wrapper
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        logger.info(f"Cassette {self.path} closed: {self.stats()}")
+
+
+class CassetteLLMCache(BaseCache):
+    """
+    LangChain cache that records or replays chat model generations.
+
+    Chat models check their cache before calling the API, so setting this as
+    a model's ``cache`` routes every generation through the cassette. The
+    duration of a recorded generation is measured from the cache miss to the
+    matching update.
+    """
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+        self._pending: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return request_hash("llm", {"prompt": json.loads(prompt), "llm": llm_string})
+
+    def _lookup(self, prompt: str, llm_string: str) -> Tuple[float, Optional[List[Generation]]]:
+        key = self._key(prompt, llm_string)
+        if not self.cassette.replaying:
+            with self._lock:
+                self._pending[key].append(time.perf_counter())
+            return 0.0, None
+        duration, response = self.cassette.replay("llm", key)
+        return duration, decode_generations(response)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[List[Generation]]:
+        duration, generations = self._lookup(prompt, llm_string)
+        if self.cassette.realtime and duration:
+            time.sleep(duration)
+        return generations
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[List[Generation]]:
+        duration, generations = self._lookup(prompt, llm_string)
+        if self.cassette.realtime and duration:
+            await asyncio.sleep(duration)
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: List[Generation]) -> None:
+        if self.cassette.replaying:
+            return
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            starts = self._pending.get(key)
+            start = starts.pop(0) if starts else time.perf_counter()
+        self.cassette.record("llm", key, encode_generations(return_val), time.perf_counter() - start)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: List[Generation]) -> None:
+        self.update(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._pending.clear()
+
+
+def encode_generations(generations: List[Generation]) -> List[Dict[str, Any]]:
+    return [
+        {"message": message_to_dict(g.message), "info": g.generation_info} if isinstance(g, ChatGeneration)
+        else {"text": g.text, "info": g.generation_info}
+        for g in generations
+    ]
+
+
+def decode_generations(data: List[Dict[str, Any]]) -> List[Generation]:
+    return [
+        ChatGeneration(message=messages_from_dict([g["message"]])[0], generation_info=g.get("info"))
+        if "message" in g else Generation(text=g["text"], generation_info=g.get("info"))
+        for g in data
+    ]
+
+
+# Fields of an Exa result used by the research helpers and the MCP formatting
+_EXA_FIELDS = ("id", "url", "title", "published_date", "author", "text", "score", "highlights", "summary")
+
+
+def encode_exa(response: Any) -> Dict[str, Any]:
+    """Keep the result fields of an Exa response (errors are returned as dicts and kept as-is)."""
+    if not hasattr(response, "results"):
+        return {"value": response}
+    return {"results": [
+        {name: getattr(result, name) for name in _EXA_FIELDS if getattr(result, name, None) is not None}
+        for result in response.results
+    ]}
+
+
+def decode_exa(data: Dict[str, Any]) -> Any:
+    if "results" not in data:
+        return data["value"]
+    return SimpleNamespace(results=[
+        SimpleNamespace(**{**dict.fromkeys(_EXA_FIELDS), **result}) for result in data["results"]
+    ])
+
+
+def encode_vectors(vectors: Any) -> Any:
+    """Store embeddings as base64 float32 arrays, a quarter of their JSON size."""
+    if vectors and isinstance(vectors[0], (int, float)):
+        return base64.b64encode(array("f", vectors).tobytes()).decode()
+    return [encode_vectors(vector) for vector in vectors]
+
+
+def decode_vectors(data: Any) -> Any:
+    if isinstance(data, str):
+        return array("f", base64.b64decode(data)).tolist()
+    return [decode_vectors(vector) for vector in data]
+
+
+def _tool_schema(tool) -> Dict[str, Any]:
+    schema = tool.args_schema
+    if hasattr(schema, "model_json_schema"):
+        schema = schema.model_json_schema()
+    return {"name": tool.name, "description": tool.description, "args_schema": schema}
+
+
+def record_tools(cassette: Cassette, tools: List[Any]) -> List[Any]:
+    """Record the tools' schemas and wrap each tool so its calls are recorded."""
+    from langchain_core.tools import StructuredTool
+
+    cassette.record("tool_schemas", request_hash("tool_schemas", {}), [_tool_schema(t) for t in tools], 0.0)
+    return [
+        StructuredTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            func=cassette.wrap(functools.partial(_invoke_tool, tool), f"tool:{tool.name}"),
+        )
+        for tool in tools
+    ]
+
+
+def _invoke_tool(tool, **kwargs):
+    return tool.invoke(kwargs)
+
+
+def replay_tools(cassette: Cassette) -> List[Any]:
+    """Rebuild the recorded tools from their schemas, answering every call from the cassette."""
+    from langchain_core.tools import StructuredTool
+
+    _, schemas = cassette.replay("tool_schemas", request_hash("tool_schemas", {}))
+
+    def unrecorded(**kwargs):
+        raise CassetteMiss("Tool call was not recorded")
+
+    return [
+        StructuredTool(
+            name=schema["name"],
+            description=schema["description"],
+            args_schema=schema["args_schema"],
+            func=cassette.wrap(unrecorded, f"tool:{schema['name']}"),
+        )
+        for schema in schemas
+    ]
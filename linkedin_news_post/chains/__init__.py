@@ -1,6 +1,57 @@
 # linkedin_news_post/chains/__init__.py
-from .writer_chain import writer_chain
-from .researcher_chain import researcher_chain
-from .supervisor_chain import supervisor_chain
-from .quality_chain import quality_chain
-from .publisher_chain import publisher_chain
+"""
+Chains are built lazily through the client registry: importing this package
+creates no LLM clients. Call ``get_chain("writer_chain")`` (etc.) at
+invocation time; the chain is constructed once and then reused.
+"""
+import importlib
+
+from linkedin_news_post import clients
+from linkedin_news_post.config import RESPONSE_CACHE_CHAINS, logger
+
+# Chain name -> factory function in the module of the same name
+CHAIN_FACTORIES = {
+    "writer_chain": "make_writer_chain",
+    "researcher_chain": "make_researcher_chain",
+    "supervisor_chain": "make_supervisor_chain",
+    "quality_chain": "make_quality_chain",
+    "publisher_chain": "make_publisher_chain",
+}
+
+
+def _chain_factory(name: str):
+    def build():
+        module = importlib.import_module(f"{__name__}.{name}")
+        try:
+            chain = getattr(module, CHAIN_FACTORIES[name])()
+            logger.info(f"{name} successfully created")
+        except Exception as e:
+            logger.error(f"Failed to create {name}: {str(e)}")
+            raise
+        cache = clients.get_response_cache() if name in RESPONSE_CACHE_CHAINS else None
+        if cache is not None:
+            from linkedin_news_post.chains.models import node_settings
+            from linkedin_news_post.response_cache import cached_chain
+
+            chain = cached_chain(chain, name, cache, node_settings(name.removesuffix("_chain")))
+        return chain
+    return build
+
+
+def _memory_model_factory():
+    from linkedin_news_post.chains.models import get_chat_model
+
+    return get_chat_model("memory")
+
+
+for _name in CHAIN_FACTORIES:
+    clients.register(_name, _chain_factory(_name))
+# Chat model used by the publisher's memory manager
+clients.register("memory_model", _memory_model_factory)
+
+
+def get_chain(name: str):
+    """Return the named chain, building it on first use."""
+    if name not in CHAIN_FACTORIES:
+        raise KeyError(f"Unknown chain '{name}'")
+    return clients.get(name)
@@ -0,0 +1,90 @@
+"""
+Chat model factory backed by the per-node registry in ``config.NODE_MODELS``.
+"""
+from typing import Any, Callable, Dict, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+
+from linkedin_news_post.clients import get_cassette, get_http_client, get_async_http_client, openai_credentials
+from linkedin_news_post.config import NODE_MODELS, RESILIENCE_POLICIES, logger
+from linkedin_news_post.metrics import METRICS_CALLBACK
+from linkedin_news_post.resilience import CircuitBreakerCallback, retrying_model
+
+
+def node_settings(node: str, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Return the registry entry for a node, with any overrides applied."""
+    if node not in NODE_MODELS:
+        raise KeyError(f"No model configured for node '{node}'")
+    return {**NODE_MODELS[node], **(settings or {})}
+
+
+def create_chat_model(model: str, settings: Dict[str, Any], max_retries: int = 0) -> BaseChatModel:
+    """
+    Create a chat model using the sampling and timeout settings of a registry entry.
+
+    The OpenAI SDK does not retry by default: ``build_llm`` retries with
+    ``retrying_model`` instead, so each attempt is recorded.
+    """
+    from langchain_openai import ChatOpenAI
+
+    cassette = get_cassette()
+    return ChatOpenAI(
+        model=model,
+        temperature=settings.get("temperature"),
+        max_tokens=settings.get("max_tokens"),
+        timeout=settings.get("timeout"),
+        max_retries=max_retries,
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
+        # Report token usage for streamed responses too
+        stream_usage=True,
+        # The breaker comes first so an open circuit fails before anything is recorded
+        callbacks=[CircuitBreakerCallback(model), METRICS_CALLBACK],
+        # Record or replay generations through the active cassette
+        cache=cassette.llm_cache if cassette is not None else None,
+        **openai_credentials(),
+    )
+
+
+def get_chat_model(node: str, settings: Optional[Dict[str, Any]] = None) -> BaseChatModel:
+    """
+    Return the primary chat model for a node, without fallbacks.
+
+    Callers such as langmem need the bare model rather than a retrying
+    runnable, so this one keeps the OpenAI SDK's retries.
+    """
+    settings = node_settings(node, settings)
+    return create_chat_model(settings["model"], settings, max_retries=RESILIENCE_POLICIES["llm"]["retries"])
+
+
+def build_llm(
+    node: str,
+    settings: Optional[Dict[str, Any]] = None,
+    configure: Optional[Callable[[BaseChatModel], Runnable]] = None,
+) -> Runnable:
+    """
+    Build the LLM runnable for a node from the model registry.
+
+    Args:
+        node: Registry key, e.g. "supervisor" or "writer"
+        settings: Optional overrides for the registry entry
+        configure: Optional hook applied to the primary and every fallback
+            model, e.g. to bind tools or structured output
+
+    Returns:
+        The configured model, wrapped with its fallback chain if one is set
+    """
+    settings = node_settings(node, settings)
+    models = [create_chat_model(name, settings) for name in [settings["model"], *settings["fallbacks"]]]
+    if configure:
+        models = [configure(model) for model in models]
+    # Each model retries transient errors before its fallbacks take over
+    models = [retrying_model(model) for model in models]
+
+    primary, fallbacks = models[0], models[1:]
+    logger.info(
+        f"Initialized {node} LLM with model: {settings['model']}"
+        + (f" (fallbacks: {', '.join(settings['fallbacks'])})" if fallbacks else "")
+    )
+    return primary.with_fallbacks(fallbacks) if fallbacks else primary
@@ -1,18 +1,18 @@
 #!/usr/bin/env python3
 import os
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
 # Import configuration
 from linkedin_news_post.config import (
-    ORGANIZATION_URN, VISIBILITY_ENUM, LIFECYCLE_STATE, DEFAULT_MODEL, logger,
+    VISIBILITY_ENUM, LIFECYCLE_STATE, logger,
     COMPOSIO_LINKEDIN_TOOL
 )
+from linkedin_news_post.chains.models import build_llm
 
 # Load environment variables
 load_dotenv()
@@ -41,27 +41,16 @@ class LinkedinPostParams(BaseModel):
 class LINKEDIN_CREATE_LINKED_IN_POST(BaseModel):
     params: LinkedinPostParams
 
-# Bind the tool to your LLM
-try:
-    llm = ChatOpenAI(model=DEFAULT_MODEL)
-    logger.info(f"Initialized publisher chain LLM with model: {DEFAULT_MODEL}")
-    
-    llm_with_tools = llm.bind_tools([LINKEDIN_CREATE_LINKED_IN_POST])
-    logger.info(f"Tool {COMPOSIO_LINKEDIN_TOOL} bound to LLM")
-    logger.info("Tool schema: %s", LINKEDIN_CREATE_LINKED_IN_POST.schema())
-except Exception as e:
-    logger.error(f"Failed to initialize publisher chain LLM or bind tools: {str(e)}")
-    raise
-
 
 # Craft your system message: Note that we state the expected values for author,
 # visibility, and lifecycleState based on our environment variables
 system = (
+    f"Always use the tool {COMPOSIO_LINKEDIN_TOOL} to publish the post.\n\n"
     f"Publish this post with the following parameters: \n\n"
-    f"### Author: {ORGANIZATION_URN} (must follow the urn:li:organization: format)\n\n"
     f"### Visibility: {VISIBILITY_ENUM}\n\n"
     f"### LifecycleState: {LIFECYCLE_STATE}\n\n"
-    f"Always use the tool {COMPOSIO_LINKEDIN_TOOL} to publish the post."
+    # The tenant's author goes after the shared instructions to keep the prefix stable
+    "### Author: {organization_urn} (must follow the urn:li:organization: format)"
 )
 
 # Create the system prompt – note that we use a placeholder for additional messages
@@ -71,10 +60,11 @@ systemPrompt = ChatPromptTemplate.from_messages(
         ("user", "Publish the text of the most recent article written by the writer_node and approved by the quality_node on LinkedIn. Use as the commentary the last article written by the writer_node.\n\n# Messages:\n\n{messages}"),
     ]
 )
-# Create the publisher chain using the system prompt with tools
-try:
-    publisher_chain = systemPrompt | llm_with_tools
-    logger.info("Publisher chain successfully created")
-except Exception as e:
-    logger.error(f"Failed to create publisher chain: {str(e)}")
-    raise
\ No newline at end of file
+
+def make_publisher_chain(settings: Optional[Dict[str, Any]] = None):
+    """Create the publisher chain using the "publisher" model registry entry, with optional overrides."""
+    # Bind the tool to the LLM and every fallback model
+    llm_with_tools = build_llm("publisher", settings, configure=lambda llm: llm.bind_tools([LINKEDIN_CREATE_LINKED_IN_POST]))
+    logger.info(f"Tool {COMPOSIO_LINKEDIN_TOOL} bound to LLM")
+    logger.debug("Tool schema: %s", LINKEDIN_CREATE_LINKED_IN_POST.schema())
+    return systemPrompt | llm_with_tools
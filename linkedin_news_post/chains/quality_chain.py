@@ -1,17 +1,12 @@
 import logging
+import re
+from typing import Any, Dict, Optional, Tuple
+
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 
 # Import configuration
-from linkedin_news_post.config import DEFAULT_MODEL, logger, DOMAIN_FOCUS
-
-# Initialize LLM with configurable model
-try:
-    llm = ChatOpenAI(model=DEFAULT_MODEL)
-    logger.info(f"Initialized quality chain LLM with model: {DEFAULT_MODEL}")
-except Exception as e:
-    logger.error(f"Failed to initialize quality chain LLM: {str(e)}")
-    raise
+from linkedin_news_post.config import logger
+from linkedin_news_post.chains.models import build_llm
 
 system = """
 # Content Detection Loop Prompt
@@ -33,8 +28,39 @@ You are an expert quality checker informing the supervisor if the writer's new c
 
 ### Efficiency
  - Avoid rejecting it more than three times after that approve or give clear next steps.
+
+### Verdict
+ - Start your reply with exactly "APPROVE:" or "REJECT:", then give your explanation.
 """
 
+# Verdict prefixes of the quality_node messages in state; budget.is_approval reads them
+APPROVED, REJECTED = "Approved:", "Rejected:"
+_VERDICT = re.compile(r"^\W*(approved?|reject(?:ed)?)\b\W*", re.IGNORECASE)
+
+
+def parse_verdict(content: str) -> Tuple[Optional[bool], str]:
+    """
+    Read the verdict the quality chain's reply starts with.
+
+    Returns:
+        True for approve, False for reject or None if the reply does not
+        start with a verdict, and the explanation that follows it
+    """
+    match = _VERDICT.match(content)
+    if not match:
+        return None, content.strip()
+    return match.group(1).lower().startswith("approv"), content[match.end():].strip()
+
+
+def verdict_message(content: str) -> str:
+    """Rewrite the chain's reply with a canonical prefix; a reply without a verdict counts as a rejection."""
+    approved, explanation = parse_verdict(content)
+    if approved is None:
+        return f"{REJECTED} the quality check gave no verdict ({explanation})"
+    return f"{APPROVED if approved else REJECTED} {explanation}".rstrip()
+
+# The system prompt is a stable, cacheable prefix; the transcript and the past
+# articles retrieved for this draft change on every call and go last
 systemPrompt = ChatPromptTemplate.from_messages(
     [
         ("system", system),
@@ -43,9 +69,6 @@ systemPrompt = ChatPromptTemplate.from_messages(
     ]
 )
 
-try:
-    quality_chain = systemPrompt | llm
-    logger.info("Quality chain successfully created")
-except Exception as e:
-    logger.error(f"Failed to create quality chain: {str(e)}")
-    raise
\ No newline at end of file
+def make_quality_chain(settings: Optional[Dict[str, Any]] = None):
+    """Create the quality chain using the "quality" model registry entry, with optional overrides."""
+    return systemPrompt | build_llm("quality", settings)
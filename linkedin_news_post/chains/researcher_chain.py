@@ -1,38 +1,25 @@
 import logging
 from datetime import date
+from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
 # Import configuration
-from linkedin_news_post.config import DEFAULT_MODEL, logger, DOMAIN_FOCUS
-
-today = date.today()
+from linkedin_news_post.config import logger, RESEARCH_QUERY_COUNT
+from linkedin_news_post.chains.models import build_llm
+from linkedin_news_post.search_window import rolling_window
 
 class search_and_content(BaseModel):
     query: str = Field(description="Query for the search")
-    start_published_date: str = Field(description="Start range of publishing range")
-    end_published_date: str = Field(description="End range of publishing range")
-
-# Initialize LLM with configurable model
-try:
-    llm = ChatOpenAI(model=DEFAULT_MODEL)
-    logger.info(f"Initialized researcher chain LLM with model: {DEFAULT_MODEL}")
-except Exception as e:
-    logger.error(f"Failed to initialize researcher chain LLM: {str(e)}")
-    raise
+    start_published_date: str = Field(description="Start of the publishing range, within the search window")
+    end_published_date: str = Field(description="End of the publishing range, within the search window")
 
-try:
-    llm_with_tools = llm.bind_tools([search_and_content])
-    logger.info("Successfully bound tools to researcher chain LLM")
-except Exception as e:
-    logger.error(f"Failed to bind tools to researcher chain LLM: {str(e)}")
-    raise
+# The system prompt is identical on every call for a tenant, so the provider can
+# serve it from its prompt cache; the run's dates and the transcript follow it
+system = f"""You are an expert researcher tasked with finding the latest news in the domain focus described below, published within the search window given at the end, tailored for aviation maintenance professionals and MRO operators.
 
-system = f"""You are an expert researcher tasked with finding the latest news in {DOMAIN_FOCUS} in the 1 to 3 months noting that today is {today} in the United States, tailored for aviation maintenance professionals and MRO operators. 
-
-Select a topic and always call the tool "search_and_content" to find relevant content and output the result.
+Select {RESEARCH_QUERY_COUNT} distinct topics and always call the tool "search_and_content" once per topic, all in the same response, so the searches run in parallel. Make the queries as diverse as possible so they surface different stories.
 
 Focus on topics like:
 - Regulatory changes affecting aircraft maintenance
@@ -44,6 +31,9 @@ Focus on topics like:
 - Supply chain developments affecting MRO operations
 
 If the supervisor provides you with information, always try a different query to generate results that are as distinct as possible from the previous query.
+
+# Domain focus
+{{domain_focus}}
 """
 
 # Use placeholder instead of messages since we are working with create_react_agent
@@ -51,12 +41,16 @@ systemPrompt = ChatPromptTemplate.from_messages(
     [
         ("system", system),
         ("placeholder", "{messages}"),
+        ("system", "Today is {today} in the United States. Search window: news published from {search_start} to {search_end}."),
     ]
+).partial(
+    # Computed per call for callers outside a graph run; the researcher node passes its run's window
+    today=lambda: date.today().isoformat(),
+    search_start=lambda: rolling_window().start_date,
+    search_end=lambda: rolling_window().end_date,
 )
 
-try:
-    researcher_chain = systemPrompt | llm_with_tools
-    logger.info("Researcher chain successfully created")
-except Exception as e:
-    logger.error(f"Failed to create researcher chain: {str(e)}")
-    raise
+def make_researcher_chain(settings: Optional[Dict[str, Any]] = None):
+    """Create the researcher chain using the "researcher" model registry entry, with optional overrides."""
+    llm_with_tools = build_llm("researcher", settings, configure=lambda llm: llm.bind_tools([search_and_content]))
+    return systemPrompt | llm_with_tools
@@ -1,20 +1,15 @@
 import logging
+from typing import Any, Dict, Optional
 
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
 # Import configuration
-from linkedin_news_post.config import DEFAULT_MODEL, logger, DOMAIN_FOCUS
+from linkedin_news_post.config import logger
+from linkedin_news_post.chains.models import build_llm
 
-# Initialize LLM with configurable model
-try:
-    llm = ChatOpenAI(model=DEFAULT_MODEL)
-    logger.info(f"Initialized writer chain LLM with model: {DEFAULT_MODEL}")
-except Exception as e:
-    logger.error(f"Failed to initialize writer chain LLM: {str(e)}")
-    raise
-
-system = f"""You are an expert writer tasked with crafting a two-sentence, engaging LinkedIn post about {DOMAIN_FOCUS}. 
+# Feedback from the quality_node arrives in the transcript after this prompt,
+# keeping the prompt itself a cacheable prefix
+system = """You are an expert writer tasked with crafting a two-sentence, engaging LinkedIn post about the domain focus described below.
 
 You'll receive an article from a supervisor and need to craft a concise, engaging post based on it, weaving in data and numbers while keeping it captivating, followed by two line breaks, two relevant hashtags, and do not include the article's image URL. 
 
@@ -28,6 +23,9 @@ Focus on topics that would interest aviation maintenance professionals, such as:
 - Supply chain innovations for aviation parts
 
 Incorporate any feedback that the quality_node checker provides. If it says that the content is not unique, write an article based on a different news source.
+
+# Domain focus
+{domain_focus}
 """
 
 systemPrompt = ChatPromptTemplate.from_messages(
@@ -37,9 +35,6 @@ systemPrompt = ChatPromptTemplate.from_messages(
     ]
 )
 
-try:
-    writer_chain = systemPrompt | llm
-    logger.info("Writer chain successfully created")
-except Exception as e:
-    logger.error(f"Failed to create writer chain: {str(e)}")
-    raise
\ No newline at end of file
+def make_writer_chain(settings: Optional[Dict[str, Any]] = None):
+    """Create the writer chain using the "writer" model registry entry, with optional overrides."""
+    return systemPrompt | build_llm("writer", settings)
@@ -0,0 +1,357 @@
+"""
+Lazy registry for shared clients.
+
+Expensive objects (HTTP connection pools, embeddings, the MongoDB store,
+the Composio tool registry and the chains) are created on first use rather than at import time, and every
+OpenAI and Exa client shares the same pooled HTTP clients. Factories can be replaced
+with ``register`` and instances pinned with ``override``, e.g. to swap in
+fakes for benchmarks. When a cassette is active (``CASSETTE_MODE``), the
+embeddings, search and Composio tools built here record or replay their calls.
+Every external call made through these clients follows its dependency's
+timeout, retry, hedging and circuit breaker policy (see ``resilience.py``).
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from linkedin_news_post.config import (
+    EXA_API_KEY, MONGODB_URI, DB_NAME, COLLECTION_NAME, MONGODB_MAX_POOL_SIZE, HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE, COMPOSIO_LINKEDIN_APP, CASSETTE_MODE, CASSETTE_PATH,
+    CASSETTE_REALTIME, RESPONSE_CACHE_CHAINS, RESPONSE_CACHE_BACKEND, RESPONSE_CACHE_PATH,
+    RESPONSE_CACHE_COLLECTION, RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES, RESILIENCE_POLICIES,
+    SEARCH_CACHE_ENABLED, SEARCH_CACHE_PATH, SEARCH_CACHE_MEMORY_ENTRIES, SEARCH_CACHE_DISK_ENTRIES,
+    SEARCH_CACHE_OPEN_TTL_SECONDS, SEARCH_CACHE_CLOSED_TTL_SECONDS, SEARCH_CACHE_STALE_SECONDS, CORPUS_ENABLED,
+    CORPUS_PATH, SEARCH_WINDOW_STATE_PATH, logger
+)
+
+_factories: Dict[str, Callable[[], Any]] = {}
+_instances: Dict[str, Any] = {}
+_lock = threading.RLock()
+
+
+def register(name: str, factory: Callable[[], Any]) -> None:
+    """Register (or replace) the factory used to build a named client."""
+    with _lock:
+        _factories[name] = factory
+        _instances.pop(name, None)
+
+
+def override(name: str, instance: Any) -> None:
+    """Pin a ready-made instance for a named client."""
+    with _lock:
+        _instances[name] = instance
+
+
+def reset(name: Optional[str] = None) -> None:
+    """Drop cached instances so they are rebuilt on next use."""
+    with _lock:
+        if name is None:
+            _instances.clear()
+        else:
+            _instances.pop(name, None)
+
+
+def get(name: str) -> Any:
+    """Return the named client, building it on first use."""
+    try:
+        return _instances[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _instances:
+            if name not in _factories:
+                raise KeyError(f"No client registered under '{name}'")
+            _instances[name] = _factories[name]()
+        return _instances[name]
+
+
+def _http_limits():
+    import httpx
+
+    return httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_KEEPALIVE)
+
+
+def _make_http_client():
+    import httpx
+
+    return httpx.Client(limits=_http_limits())
+
+
+def _make_async_http_client():
+    import httpx
+
+    return httpx.AsyncClient(limits=_http_limits())
+
+
+def _make_cassette():
+    if CASSETTE_MODE == "off":
+        return None
+    from linkedin_news_post.cassette import Cassette
+
+    return Cassette(CASSETTE_PATH, CASSETTE_MODE, realtime=CASSETTE_REALTIME)
+
+
+def _make_response_cache():
+    if not RESPONSE_CACHE_CHAINS:
+        return None
+    if get_cassette() is not None:
+        # Cache hits would skip calls the cassette needs to record or replay
+        logger.info("Response cache disabled while a cassette is active")
+        return None
+    from linkedin_news_post.response_cache import MongoResponseCache, SQLiteResponseCache
+
+    if RESPONSE_CACHE_BACKEND == "mongo":
+        if not MONGODB_URI:
+            raise ValueError("The mongo response cache needs MONGODB_URI.")
+        cache = MongoResponseCache(
+            MONGODB_URI, DB_NAME, RESPONSE_CACHE_COLLECTION, RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES
+        )
+    else:
+        cache = SQLiteResponseCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES)
+    logger.info(f"Response cache ({RESPONSE_CACHE_BACKEND}) enabled for {', '.join(RESPONSE_CACHE_CHAINS)}")
+    return cache
+
+
+def _make_search_cache():
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    if get_cassette() is not None:
+        # A recording should hold the searches Exa actually answered
+        logger.info("Search cache disabled while a cassette is active")
+        return None
+    from linkedin_news_post.search_cache import SearchCache
+
+    return SearchCache(
+        SEARCH_CACHE_PATH,
+        memory_entries=SEARCH_CACHE_MEMORY_ENTRIES,
+        disk_entries=SEARCH_CACHE_DISK_ENTRIES,
+        open_ttl=SEARCH_CACHE_OPEN_TTL_SECONDS,
+        closed_ttl=SEARCH_CACHE_CLOSED_TTL_SECONDS,
+        stale_seconds=SEARCH_CACHE_STALE_SECONDS,
+    )
+
+
+def _make_news_corpus():
+    if not CORPUS_ENABLED:
+        return None
+    from linkedin_news_post.news_corpus import NewsCorpus
+
+    corpus = NewsCorpus(CORPUS_PATH)
+    logger.info(f"News corpus at {CORPUS_PATH}: {corpus.stats()}")
+    return corpus
+
+
+def openai_credentials() -> Dict[str, Any]:
+    """Placeholder API key for replayed runs, which never reach OpenAI."""
+    cassette = get_cassette()
+    if cassette is not None and cassette.replaying and not os.getenv("OPENAI_API_KEY"):
+        return {"api_key": "cassette-replay"}
+    return {}
+
+
+def _make_embeddings():
+    from langchain_openai import OpenAIEmbeddings
+
+    # Retries and timeouts are applied around the embed calls by the "embedding" policy
+    return OpenAIEmbeddings(
+        http_client=get_http_client(), http_async_client=get_async_http_client(), max_retries=0,
+        **openai_credentials()
+    )
+
+
+def _instrumented_embed_fns(embeddings):
+    from linkedin_news_post.metrics import instrument_call, measure_embedding
+    from linkedin_news_post.resilience import resilient
+
+    measure = measure_embedding(getattr(embeddings, "model", None))
+    embed_query, embed_documents = embeddings.embed_query, embeddings.embed_documents
+    cassette = get_cassette()
+    if cassette is not None:
+        from linkedin_news_post.cassette import decode_vectors, encode_vectors
+
+        embed_query = cassette.wrap(embed_query, "embed_query", encode_vectors, decode_vectors)
+        embed_documents = cassette.wrap(embed_documents, "embed_documents", encode_vectors, decode_vectors)
+    return (
+        instrument_call(resilient(embed_query, "embedding", idempotent=True), "embedding", "embed_query", measure),
+        instrument_call(resilient(embed_documents, "embedding", idempotent=True), "embedding", "embed_documents", measure),
+    )
+
+
+def _make_store():
+    from linkedin_news_post.metrics import MongoCommandListener
+    from linkedin_news_post.mongo_store import MongoDBBaseStore
+
+    if not MONGODB_URI:
+        raise ValueError("MongoDB store is not initialized. Check MONGODB_URI environment variable.")
+
+    embed, embed_batch = _instrumented_embed_fns(get_embeddings())
+    # The driver bounds every operation, retries included, and retries reads and writes once
+    timeout = RESILIENCE_POLICIES["mongo"]["timeout"]
+    timeouts = {"timeoutMS": int(timeout * 1000)} if timeout else {}
+    index_config = {
+        "embed": embed,
+        "embed_batch": embed_batch,
+        "fields": ["content.article", "summary"],
+        "index_name": "store_index",
+    }
+    store = MongoDBBaseStore(
+        mongo_url=MONGODB_URI,
+        db_name=DB_NAME,
+        collection_name=COLLECTION_NAME,
+        index_config=index_config,
+        ttl_support=True,
+        client_options={
+            "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+            "event_listeners": [MongoCommandListener()],
+            "retryReads": True,
+            "retryWrites": True,
+            **timeouts,
+        }
+    )
+    logger.info(f"MongoDB store initialized with database '{DB_NAME}' and collection '{COLLECTION_NAME}'")
+    return store
+
+
+def _make_exa():
+    if not EXA_API_KEY:
+        return None
+    from linkedin_news_post.exa_client import PooledExa
+
+    # Abandoned requests are bounded by the "exa" policy's timeout on the async path too
+    exa = PooledExa(
+        EXA_API_KEY, get_http_client(), get_async_http_client(), timeout=RESILIENCE_POLICIES["exa"]["timeout"]
+    )
+    logger.info("Exa client initialized on the shared HTTP pool")
+    return exa
+
+
+def _wrap_search(search):
+    """Add the cassette, resilience policy and metrics of Exa searches to a blocking or async search."""
+    from linkedin_news_post.metrics import instrument_call, measure_exa
+    from linkedin_news_post.resilience import resilient
+
+    cassette = get_cassette()
+    if cassette is not None:
+        from linkedin_news_post.cassette import decode_exa, encode_exa
+
+        search = cassette.wrap(search, "exa", encode_exa, decode_exa)
+    # search_and_content reports Exa errors as an {"error": ...} dict rather than raising
+    search = resilient(search, "exa", idempotent=True, failed=lambda result: isinstance(result, dict) and "error" in result)
+    return instrument_call(search, "exa", "search_and_content", measure_exa)
+
+
+def _make_search():
+    from linkedin_news_post.mcp_server import search_and_content
+
+    return _wrap_search(search_and_content)
+
+
+def _make_asearch():
+    from linkedin_news_post.mcp_server import asearch_and_content
+
+    return _wrap_search(asearch_and_content)
+
+
+def _make_window_cursor():
+    from linkedin_news_post.search_window import WindowCursor
+
+    return WindowCursor(SEARCH_WINDOW_STATE_PATH)
+
+
+def _make_tool_registry():
+    from linkedin_news_post.tool_registry import ToolRegistry
+
+    return ToolRegistry()
+
+
+def _make_linkedin_tools():
+    """Build the LinkedIn tools for the graph's tool node from the cached Composio schemas."""
+    cassette = get_cassette()
+    if cassette is not None and cassette.replaying:
+        from linkedin_news_post.cassette import replay_tools
+
+        return replay_tools(cassette)
+
+    from linkedin_news_post.resilience import resilient_tools
+
+    # Composio is only asked when the registry's snapshot is stale
+    tools = get_tool_registry().tools()
+    logger.info(f"LinkedIn tools for app '{COMPOSIO_LINKEDIN_APP}': {[t.name for t in tools]}")
+    if cassette is not None:
+        from linkedin_news_post.cassette import record_tools
+
+        tools = record_tools(cassette, tools)
+    # Publishing is not idempotent, so tool calls get the timeout and breaker but no retries
+    return resilient_tools(tools, "composio")
+
+
+register("cassette", _make_cassette)
+register("response_cache", _make_response_cache)
+register("search_cache", _make_search_cache)
+register("news_corpus", _make_news_corpus)
+register("http_client", _make_http_client)
+register("http_async_client", _make_async_http_client)
+register("exa", _make_exa)
+register("embeddings", _make_embeddings)
+register("store", _make_store)
+register("search", _make_search)
+register("asearch", _make_asearch)
+register("window_cursor", _make_window_cursor)
+register("tool_registry", _make_tool_registry)
+register("linkedin_tools", _make_linkedin_tools)
+
+
+def get_cassette():
+    return get("cassette")
+
+
+def get_response_cache():
+    return get("response_cache")
+
+
+def get_search_cache():
+    return get("search_cache")
+
+
+def get_news_corpus():
+    return get("news_corpus")
+
+
+def get_http_client():
+    return get("http_client")
+
+
+def get_async_http_client():
+    return get("http_async_client")
+
+
+def get_exa():
+    return get("exa")
+
+
+def get_embeddings():
+    return get("embeddings")
+
+
+def get_store():
+    return get("store")
+
+
+def get_search():
+    return get("search")
+
+
+def get_asearch():
+    return get("asearch")
+
+
+def get_window_cursor():
+    return get("window_cursor")
+
+
+def get_tool_registry():
+    return get("tool_registry")
+
+
+def get_linkedin_tools():
+    return get("linkedin_tools")
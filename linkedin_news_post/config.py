@@ -5,7 +5,6 @@ throughout the application.
 """
 import os
 import logging
-from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,6 +19,33 @@ logger = logging.getLogger(__name__)
 
 # Model configuration
 DEFAULT_MODEL = os.environ.get("DEFAULT_MODEL", "gpt-4o")
+DEFAULT_FAST_MODEL = os.environ.get("DEFAULT_FAST_MODEL", "gpt-4o-mini")
+
+
+def _node_model(node, model, temperature, max_tokens=None, timeout=60, fallbacks=()):
+    """Build one model registry entry, letting <NODE>_* environment variables override it."""
+    prefix = node.upper()
+    max_tokens = os.environ.get(f"{prefix}_MAX_TOKENS", max_tokens)
+    fallbacks = os.environ.get(f"{prefix}_FALLBACK_MODELS", ",".join(fallbacks))
+    return {
+        "model": os.environ.get(f"{prefix}_MODEL", model),
+        "temperature": float(os.environ.get(f"{prefix}_TEMPERATURE", temperature)),
+        "max_tokens": int(max_tokens) if max_tokens else None,
+        "timeout": float(os.environ.get(f"{prefix}_TIMEOUT", timeout)),
+        "fallbacks": [name.strip() for name in fallbacks.split(",") if name.strip()],
+    }
+
+
+# Per-node model registry. Routing and yes/no checks run on the fast model and
+# fall back to the default one; writing keeps the strong model.
+NODE_MODELS = {
+    "supervisor": _node_model("supervisor", DEFAULT_FAST_MODEL, 0.0, max_tokens=50, timeout=30, fallbacks=[DEFAULT_MODEL]),
+    "researcher": _node_model("researcher", DEFAULT_MODEL, 0.7, max_tokens=500, timeout=60, fallbacks=[DEFAULT_FAST_MODEL]),
+    "writer": _node_model("writer", DEFAULT_MODEL, 0.7, max_tokens=400, timeout=90, fallbacks=[DEFAULT_FAST_MODEL]),
+    "quality": _node_model("quality", DEFAULT_FAST_MODEL, 0.0, max_tokens=300, timeout=30, fallbacks=[DEFAULT_MODEL]),
+    "publisher": _node_model("publisher", DEFAULT_MODEL, 0.0, max_tokens=800, timeout=60, fallbacks=[DEFAULT_FAST_MODEL]),
+    "memory": _node_model("memory", DEFAULT_MODEL, 0.0, timeout=60),
+}
 
 # MongoDB configuration
 try:
@@ -31,12 +57,49 @@ except KeyError:
 DB_NAME = os.environ.get("DB_NAME", "checkpointing_db")
 COLLECTION_NAME = os.environ.get("COLLECTION_NAME", "store")
 DEFAULT_TTL_MINUTES = int(os.environ.get("DEFAULT_TTL_MINUTES", 10))
+# Size of the MongoDB connection pool shared by all concurrent runs
+MONGODB_MAX_POOL_SIZE = int(os.environ.get("MONGODB_MAX_POOL_SIZE", 50))
 
 # Search configuration
 DEFAULT_SEARCH_LIMIT = int(os.environ.get("DEFAULT_SEARCH_LIMIT", 3))
 DEFAULT_LIST_LIMIT = int(os.environ.get("DEFAULT_LIST_LIMIT", 10))
 DEFAULT_MAX_LIST_LIMIT = int(os.environ.get("DEFAULT_MAX_LIST_LIMIT", 100))
 
+def _call_policy(dependency, timeout=None, retries=0, hedge_after=None, breaker_threshold=5, breaker_reset_seconds=30):
+    """Build one resilience policy entry, letting <DEPENDENCY>_* environment variables override it."""
+    prefix = dependency.upper()
+    timeout = os.environ.get(f"{prefix}_CALL_TIMEOUT", timeout)
+    hedge_after = os.environ.get(f"{prefix}_HEDGE_AFTER", hedge_after)
+    return {
+        "timeout": float(timeout) if timeout else None,
+        "retries": int(os.environ.get(f"{prefix}_RETRIES", retries)),
+        "backoff_base": float(os.environ.get("RETRY_BACKOFF_BASE", 0.5)),
+        "backoff_max": float(os.environ.get("RETRY_BACKOFF_MAX", 8.0)),
+        "hedge_after": float(hedge_after) if hedge_after else None,
+        "breaker_threshold": int(os.environ.get(f"{prefix}_BREAKER_THRESHOLD", breaker_threshold)),
+        "breaker_reset_seconds": float(os.environ.get(f"{prefix}_BREAKER_RESET_SECONDS", breaker_reset_seconds)),
+    }
+
+
+# Timeouts, retries with jittered exponential backoff, hedged reads and circuit
+# breakers per external dependency (see resilience.py). Chat model timeouts are
+# set per node in NODE_MODELS; they retry through resilience.retrying_model. Only
+# idempotent calls are retried or hedged: LinkedIn posts get a timeout and a
+# breaker only.
+RESILIENCE_POLICIES = {
+    "llm": _call_policy("llm", retries=2, breaker_threshold=5, breaker_reset_seconds=60),
+    "embedding": _call_policy("embedding", timeout=15, retries=2, hedge_after=2.0),
+    "exa": _call_policy("exa", timeout=30, retries=2, hedge_after=8.0, breaker_reset_seconds=60),
+    "mongo": _call_policy("mongo", timeout=10),
+    "composio": _call_policy("composio", timeout=30, retries=2, breaker_reset_seconds=60),
+}
+# Worker threads for bounded and hedged calls; a timed-out call keeps its thread until it returns
+RESILIENCE_MAX_WORKERS = int(os.environ.get("RESILIENCE_MAX_WORKERS", 32))
+
+# Shared HTTP connection pool used by the OpenAI and Exa clients
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE = int(os.environ.get("HTTP_MAX_KEEPALIVE", 20))
+
 # Exa API configuration
 try:
     EXA_API_KEY = os.environ["EXA_API_KEY"]
@@ -46,14 +109,145 @@ except KeyError:
 
 # Search parameters
 SEARCH_DAYS_BACK = int(os.environ.get("SEARCH_DAYS_BACK", 30))
+# Search date windows are computed per run (see linkedin_news_post/search_window.py).
+# "rolling" searches the last SEARCH_DAYS_BACK days on every run; "advancing"
+# starts each tenant's window where its previous run's ended, spanning at least
+# SEARCH_WINDOW_MIN_HOURS. Advancing cursors are kept in SEARCH_WINDOW_STATE_PATH.
+SEARCH_WINDOW_STRATEGY = os.environ.get("SEARCH_WINDOW_STRATEGY", "rolling")
+SEARCH_WINDOW_MIN_HOURS = float(os.environ.get("SEARCH_WINDOW_MIN_HOURS", 24))
+SEARCH_WINDOW_STATE_PATH = os.environ.get("SEARCH_WINDOW_STATE_PATH", "search_windows.json")
 SEARCH_NUM_RESULTS = int(os.environ.get("SEARCH_NUM_RESULTS", 10))
 SEARCH_MAX_CHARACTERS = int(os.environ.get("SEARCH_MAX_CHARACTERS", 400))
 SEARCH_CATEGORY = os.environ.get("SEARCH_CATEGORY", "news")
+# MCP server transport: "stdio" serves one client per process; "sse" serves
+# many concurrent clients over HTTP from one long-lived process
+MCP_TRANSPORT = os.environ.get("MCP_TRANSPORT", "stdio")
+MCP_HOST = os.environ.get("MCP_HOST", "127.0.0.1")
+MCP_PORT = int(os.environ.get("MCP_PORT", 8000))
+# The launcher waits for the MCP server with a readiness probe instead of a
+# fixed sleep: "health" polls /health, "initialize" completes an MCP handshake.
+# Probes back off exponentially from the first delay up to the maximum.
+LAUNCH_READINESS = os.environ.get("LAUNCH_READINESS", "health")
+LAUNCH_READY_TIMEOUT_SECONDS = float(os.environ.get("LAUNCH_READY_TIMEOUT_SECONDS", 30))
+LAUNCH_PROBE_FIRST_DELAY = float(os.environ.get("LAUNCH_PROBE_FIRST_DELAY", 0.05))
+LAUNCH_PROBE_MAX_DELAY = float(os.environ.get("LAUNCH_PROBE_MAX_DELAY", 0.2))
+# Compact output of the MCP search tools: fields kept per result (any of url,
+# title, published, author, snippet, score, sources, queries) and the snippet
+# length in characters; callers can override both per call
+SEARCH_RESULT_FIELDS = [
+    name.strip() for name in os.environ.get("SEARCH_RESULT_FIELDS", "url,title,published,snippet,sources").split(",")
+    if name.strip()
+]
+SEARCH_SNIPPET_CHARS = int(os.environ.get("SEARCH_SNIPPET_CHARS", 280))
+# Queries of one multi_search MCP call that are sent to Exa at the same time
+SEARCH_MULTI_CONCURRENCY = int(os.environ.get("SEARCH_MULTI_CONCURRENCY", 5))
+
+# Search result cache in the MCP search tool: an in-memory LRU in front of a
+# SQLite file (SEARCH_CACHE_PATH="" keeps it in memory only). Searches whose
+# date window reaches today stay fresh for SEARCH_CACHE_OPEN_TTL_SECONDS, those
+# over a window that has ended for SEARCH_CACHE_CLOSED_TTL_SECONDS; stale
+# results are served for SEARCH_CACHE_STALE_SECONDS more while being refreshed
+SEARCH_CACHE_ENABLED = os.environ.get("SEARCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+SEARCH_CACHE_PATH = os.environ.get("SEARCH_CACHE_PATH", "search_cache.sqlite")
+SEARCH_CACHE_MEMORY_ENTRIES = int(os.environ.get("SEARCH_CACHE_MEMORY_ENTRIES", 256))
+SEARCH_CACHE_DISK_ENTRIES = int(os.environ.get("SEARCH_CACHE_DISK_ENTRIES", 5000))
+SEARCH_CACHE_OPEN_TTL_SECONDS = float(os.environ.get("SEARCH_CACHE_OPEN_TTL_SECONDS", 3600))
+SEARCH_CACHE_CLOSED_TTL_SECONDS = float(os.environ.get("SEARCH_CACHE_CLOSED_TTL_SECONDS", 7 * 24 * 3600))
+SEARCH_CACHE_STALE_SECONDS = float(os.environ.get("SEARCH_CACHE_STALE_SECONDS", 6 * 3600))
+
+# Local news corpus: every fetched search result is kept in a SQLite file with a
+# full-text and a date index. With CORPUS_LOCAL_MIN_RESULTS > 0, a search is
+# answered from the corpus without calling Exa when it finds at least that many
+# matching stories in the date window
+CORPUS_ENABLED = os.environ.get("CORPUS_ENABLED", "true").lower() in ("1", "true", "yes")
+CORPUS_PATH = os.environ.get("CORPUS_PATH", "news_corpus.sqlite")
+CORPUS_LOCAL_MIN_RESULTS = int(os.environ.get("CORPUS_LOCAL_MIN_RESULTS", 0))
 
-# Calculate date ranges for search
-TODAY = datetime.now()
-DEFAULT_START_DATE = (TODAY - timedelta(days=SEARCH_DAYS_BACK)).isoformat() + ".000Z"
-DEFAULT_END_DATE = TODAY.isoformat() + ".000Z"
+# Near-duplicate clustering of search results: results whose title and snippet
+# reach this estimated Jaccard similarity of word shingles are reported as one
+# story with a source count (DEDUP_NUM_PERM MinHash values, a multiple of 4)
+DEDUP_SIMILARITY_THRESHOLD = float(os.environ.get("DEDUP_SIMILARITY_THRESHOLD", 0.6))
+DEDUP_NUM_PERM = int(os.environ.get("DEDUP_NUM_PERM", 128))
+
+# Research fan-out configuration
+RESEARCH_QUERY_COUNT = int(os.environ.get("RESEARCH_QUERY_COUNT", 3))
+RESEARCH_POOL_SIZE = int(os.environ.get("RESEARCH_POOL_SIZE", 10))
+
+# Novelty pre-screen: candidates scoring at or above this similarity to a past
+# article are dropped before writing (same scale as the Atlas cosine searchScore)
+NOVELTY_SIMILARITY_THRESHOLD = float(os.environ.get("NOVELTY_SIMILARITY_THRESHOLD", 0.95))
+# Most recent past articles the novelty pre-screen compares against; their
+# embeddings are fetched in one capped query and compared exactly on the client.
+# The quality check searches every past article through the vector index instead.
+NOVELTY_MAX_STORED = int(os.environ.get("NOVELTY_MAX_STORED", 2000))
+
+# Tiered quality gate: drafts whose best match against past articles scores below
+# the first threshold are approved, at or above the second rejected, and only
+# scores in between are escalated to the quality_chain LLM
+QUALITY_AUTO_APPROVE_BELOW = float(os.environ.get("QUALITY_AUTO_APPROVE_BELOW", 0.90))
+QUALITY_AUTO_REJECT_ABOVE = float(os.environ.get("QUALITY_AUTO_REJECT_ABOVE", 0.97))
+
+# Maximum number of graph runs executing concurrently on one event loop
+RUN_CONCURRENCY = int(os.environ.get("RUN_CONCURRENCY", 4))
+# Post daemon (python -m linkedin_news_post.daemon): runs in flight at once,
+# queued jobs before submissions are refused, finished jobs kept for /jobs,
+# and where the job API listens
+DAEMON_CONCURRENCY = int(os.environ.get("DAEMON_CONCURRENCY", RUN_CONCURRENCY))
+DAEMON_QUEUE_SIZE = int(os.environ.get("DAEMON_QUEUE_SIZE", 100))
+DAEMON_JOB_HISTORY = int(os.environ.get("DAEMON_JOB_HISTORY", 200))
+DAEMON_HOST = os.environ.get("DAEMON_HOST", "127.0.0.1")
+DAEMON_PORT = int(os.environ.get("DAEMON_PORT", 8100))
+# A long-lived daemon steps through fresh date ranges rather than re-searching the last month
+DAEMON_SEARCH_WINDOW = os.environ.get("DAEMON_SEARCH_WINDOW", "advancing")
+
+# Per-run budgets for the supervisor loop; when one is reached the run
+# publishes the last approved draft or stops with a report
+RUN_MAX_NODE_VISITS = int(os.environ.get("RUN_MAX_NODE_VISITS", 40))
+RUN_MAX_TOKENS = int(os.environ.get("RUN_MAX_TOKENS", 150000))
+RUN_MAX_SECONDS = float(os.environ.get("RUN_MAX_SECONDS", 600))
+RUN_MAX_COST_USD = float(os.environ.get("RUN_MAX_COST_USD", 1.0))
+RUN_MAX_QUALITY_REJECTIONS = int(os.environ.get("RUN_MAX_QUALITY_REJECTIONS", 3))
+# Hard stop for LangGraph supersteps, above the node visit budget
+GRAPH_RECURSION_LIMIT = int(os.environ.get("GRAPH_RECURSION_LIMIT", 60))
+
+# Per-tenant rate limits for multi-tenant batches (overridable per tenant)
+TENANT_MAX_CONCURRENT_RUNS = int(os.environ.get("TENANT_MAX_CONCURRENT_RUNS", 1))
+TENANT_MIN_INTERVAL_SECONDS = float(os.environ.get("TENANT_MIN_INTERVAL_SECONDS", 0))
+
+# Metrics: estimated USD prices per million tokens (dated model snapshots are
+# matched by prefix; "cached" is the price of prompt tokens served from the
+# provider's prompt cache), the estimated cost of one Exa search with contents,
+# and where per-run JSON summaries and Prometheus snapshots are written
+MODEL_PRICES = {
+    "gpt-4o": {"prompt": 2.50, "cached": 1.25, "completion": 10.00},
+    "gpt-4o-mini": {"prompt": 0.15, "cached": 0.075, "completion": 0.60},
+    "gpt-4.1": {"prompt": 2.00, "cached": 0.50, "completion": 8.00},
+    "gpt-4.1-mini": {"prompt": 0.40, "cached": 0.10, "completion": 1.60},
+    "text-embedding-ada-002": {"prompt": 0.10},
+    "text-embedding-3-small": {"prompt": 0.02},
+    "text-embedding-3-large": {"prompt": 0.13},
+}
+EXA_COST_PER_SEARCH = float(os.environ.get("EXA_COST_PER_SEARCH", 0.005))
+METRICS_DIR = os.environ.get("METRICS_DIR")
+
+# Opt-in response cache for deterministic chains, e.g.
+# RESPONSE_CACHE_CHAINS="supervisor_chain,quality_chain". Entries live in a local
+# SQLite file or a MongoDB collection, expire after the TTL and are evicted
+# least recently used first beyond RESPONSE_CACHE_MAX_ENTRIES
+RESPONSE_CACHE_CHAINS = [name.strip() for name in os.environ.get("RESPONSE_CACHE_CHAINS", "").split(",") if name.strip()]
+RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND", "sqlite")
+RESPONSE_CACHE_PATH = os.environ.get("RESPONSE_CACHE_PATH", "response_cache.sqlite")
+RESPONSE_CACHE_COLLECTION = os.environ.get("RESPONSE_CACHE_COLLECTION", "response_cache")
+RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", 24 * 3600))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", 10000))
+
+# Record/replay cassette for chat models, Exa, embeddings and Composio tools:
+# "off", "record" (call live services and append to CASSETTE_PATH) or "replay"
+# (answer from CASSETTE_PATH without network access, optionally waiting for
+# each call's recorded duration)
+CASSETTE_MODE = os.environ.get("CASSETTE_MODE", "off")
+CASSETTE_PATH = os.environ.get("CASSETTE_PATH", "cassettes/run.jsonl.gz")
+CASSETTE_REALTIME = os.environ.get("CASSETTE_REALTIME", "false").lower() in ("1", "true", "yes")
 
 # LinkedIn API configuration
 try:
@@ -70,6 +264,8 @@ except KeyError as e:
     VISIBILITY_ENUM = os.environ.get("VISIBILITY_ENUM", "PUBLIC")
     LIFECYCLE_STATE = os.environ.get("LIFECYCLE_STATE", "PUBLISHED")
     COMPOSIO_LINKEDIN_TOOL = os.environ.get("COMPOSIO_LINKEDIN_TOOL", "LINKEDIN_CREATE_LINKED_IN_POST")
+    COMPOSIO_LINKEDIN_APP = os.environ.get("COMPOSIO_LINKEDIN_APP", "LINKEDIN")
+    COMPOSIO_LINKEDIN_ENTITY = os.environ.get("COMPOSIO_LINKEDIN_ENTITY")
 
 # MCP configuration
 try:
@@ -78,6 +274,15 @@ except KeyError:
     logger.error("COMPOSIO_MCP_URL environment variable is not set")
     COMPOSIO_MCP_URL = None
 
+# Composio tool registry: the LinkedIn tool schemas and connection status are
+# fetched once and cached in this JSON file for TOOL_REGISTRY_TTL_SECONDS
+# (refresh with `python -m linkedin_news_post.tool_registry refresh`). With
+# COMPOSIO_OFFLINE the graph builds from the cache, or from a local stub of the
+# post tool, and never calls Composio; stub posts are not published.
+TOOL_REGISTRY_PATH = os.environ.get("TOOL_REGISTRY_PATH", "tool_registry.json")
+TOOL_REGISTRY_TTL_SECONDS = float(os.environ.get("TOOL_REGISTRY_TTL_SECONDS", "86400"))
+COMPOSIO_OFFLINE = os.environ.get("COMPOSIO_OFFLINE", "false").lower() in ("1", "true", "yes")
+
 
 # Domain focus configuration
 
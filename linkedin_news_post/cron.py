@@ -0,0 +1,104 @@
+"""
+Five-field cron expressions for the scheduler daemon.
+
+Supports the usual syntax of ``minute hour day-of-month month day-of-week``:
+``*``, lists (``1,15``), ranges (``1-5``), steps (``*/15``, ``0-30/10``) and
+three-letter month and weekday names. Sunday is 0 or 7. As in cron, when both
+day fields are restricted a day matches if either does. Times are local.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import FrozenSet, Tuple
+
+_MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+_DAYS = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+
+# (name, lowest, highest, names starting at lowest)
+_FIELDS = (
+    ("minute", 0, 59, ()),
+    ("hour", 0, 23, ()),
+    ("day of month", 1, 31, ()),
+    ("month", 1, 12, _MONTHS),
+    ("day of week", 0, 7, _DAYS),
+)
+
+
+def _value(text: str, name: str, low: int, high: int, names: Tuple[str, ...]) -> int:
+    lowered = text.lower()
+    if lowered in names:
+        return names.index(lowered) + low
+    if not text.isdigit() or not low <= int(text) <= high:
+        raise ValueError(f"Invalid {name} '{text}' (expected {low}-{high})")
+    return int(text)
+
+
+def _parse_field(text: str, name: str, low: int, high: int, names: Tuple[str, ...]) -> FrozenSet[int]:
+    values = set()
+    for part in text.split(","):
+        spec, _, step_text = part.partition("/")
+        step = int(step_text) if step_text.isdigit() and int(step_text) > 0 else None
+        if step_text and step is None:
+            raise ValueError(f"Invalid step in {name} '{part}'")
+        if spec == "*":
+            first, last = low, high
+        elif "-" in spec:
+            start, _, end = spec.partition("-")
+            first, last = _value(start, name, low, high, names), _value(end, name, low, high, names)
+        else:
+            first = _value(spec, name, low, high, names)
+            # "5/15" means every 15 from 5
+            last = high if step else first
+        if first > last:
+            raise ValueError(f"Invalid range in {name} '{part}'")
+        values.update(range(first, last + 1, step or 1))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    expression: str
+    minutes: FrozenSet[int]
+    hours: FrozenSet[int]
+    days: FrozenSet[int]
+    months: FrozenSet[int]
+    weekdays: FrozenSet[int]
+    any_day: bool
+    any_weekday: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression '{expression}' must have 5 fields, got {len(fields)}")
+        minutes, hours, days, months, weekdays = (
+            _parse_field(text, *spec) for text, spec in zip(fields, _FIELDS)
+        )
+        return cls(
+            expression, minutes, hours, days, months, frozenset(d % 7 for d in weekdays),
+            any_day=fields[2] == "*", any_weekday=fields[4] == "*",
+        )
+
+    def _day_matches(self, moment: datetime) -> bool:
+        in_days = moment.day in self.days
+        in_weekdays = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, moment: datetime) -> datetime:
+        """The first matching minute strictly after ``moment``."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression '{self.expression}' never matches")
@@ -0,0 +1,311 @@
+"""
+Long-running post daemon: a cron-like scheduler in front of a job queue.
+
+A one-shot ``python main.py`` pays for every post again: the LangChain and
+LangGraph imports, the chat, embedding and MongoDB clients, the Composio
+connection check and the LinkedIn tool fetch. The daemon pays once. It
+enters ``make_graph()`` at startup and keeps the compiled graph, its clients
+and its tool schemas warm. Scheduled and submitted post jobs then go through
+one queue to a fixed pool of workers, so at most ``concurrency`` runs are in
+flight.
+
+Each tenant with a ``schedule`` (a cron expression, see
+``linkedin_news_post.cron``) gets ``tenant.runs`` jobs at every match; a
+fire time missed while the daemon was down is not caught up. Each tenant
+keeps one rate limiter for the daemon's lifetime, so ``max_concurrent_runs``
+and ``min_interval_seconds`` hold across jobs. By default each job's searches
+cover the news published since the tenant's previous job ("advancing"
+windows, see ``linkedin_news_post.search_window``), so repeated jobs do not
+re-fetch stories already covered. A small HTTP API
+(``DAEMON_PORT``) accepts jobs and reports the queue:
+
+    POST /jobs   {"tenant_id": "airnxt", "runs": 2}   queue jobs
+    GET  /jobs                                        recent jobs
+    GET  /health                                      workers and queue depth
+"""
+import argparse
+import asyncio
+import itertools
+import signal
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from linkedin_news_post.config import (
+    DAEMON_CONCURRENCY,
+    DAEMON_HOST,
+    DAEMON_JOB_HISTORY,
+    DAEMON_PORT,
+    DAEMON_QUEUE_SIZE,
+    DAEMON_SEARCH_WINDOW,
+    logger,
+)
+from linkedin_news_post.cron import CronSchedule
+from linkedin_news_post.metrics import REGISTRY
+from linkedin_news_post.search_window import STRATEGIES
+from linkedin_news_post.tenants import TenantConfig, TenantRateLimiter, load_tenants
+
+
+class QueueFull(RuntimeError):
+    """The job queue is at ``DAEMON_QUEUE_SIZE``."""
+
+
+def parse_job_request(body: Any) -> Tuple[Optional[str], int]:
+    """
+    Read the tenant and number of runs of a ``POST /jobs`` body.
+
+    Raises:
+        ValueError: The body is not an object, ``tenant_id`` is not a string
+            or ``runs`` is not a positive integer
+    """
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object")
+    tenant_id, runs = body.get("tenant_id"), body.get("runs", 1)
+    if tenant_id is not None and not isinstance(tenant_id, str):
+        raise ValueError("'tenant_id' must be a string")
+    if isinstance(runs, str) and runs.strip().isdigit():
+        runs = int(runs)
+    if isinstance(runs, bool) or not isinstance(runs, int) or runs < 1:
+        raise ValueError(f"'runs' must be a positive integer, got {runs!r}")
+    return tenant_id, runs
+
+
+@dataclass
+class Job:
+    job_id: int
+    tenant_id: Optional[str]
+    source: str
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    status: str = "queued"
+    error: Optional[str] = None
+
+
+class PostDaemon:
+    """
+    Scheduler, job queue and worker pool around one warm compiled graph.
+
+    Args:
+        tenants: Tenant configurations; those with a ``schedule`` are scheduled
+        concurrency: Number of workers, i.e. runs in flight at most
+        default_schedule: Cron expression for scheduled runs without a tenant
+        queue_size: Maximum number of queued jobs
+        window_strategy: Search date windows of the jobs, "advancing" or "rolling"
+    """
+
+    def __init__(
+        self,
+        tenants: Optional[List[TenantConfig]] = None,
+        concurrency: int = DAEMON_CONCURRENCY,
+        default_schedule: Optional[str] = None,
+        queue_size: int = DAEMON_QUEUE_SIZE,
+        window_strategy: str = DAEMON_SEARCH_WINDOW,
+    ):
+        self.tenants = {tenant.tenant_id: tenant for tenant in tenants or []}
+        self.concurrency = max(1, concurrency)
+        # Parsed up front, so a bad expression fails at startup rather than at fire time
+        self.schedules = {
+            tenant_id: CronSchedule.parse(tenant.schedule)
+            for tenant_id, tenant in self.tenants.items() if tenant.schedule
+        }
+        if default_schedule:
+            self.schedules[None] = CronSchedule.parse(default_schedule)
+        for tenant_id in self.schedules:
+            if tenant_id is not None and self.tenants[tenant_id].runs < 1:
+                raise ValueError(f"Tenant '{tenant_id}' is scheduled for {self.tenants[tenant_id].runs} runs")
+        self.limiters = {tenant_id: TenantRateLimiter.for_tenant(tenant) for tenant_id, tenant in self.tenants.items()}
+        self.queue: "asyncio.Queue[Job]" = asyncio.Queue(queue_size)
+        self.jobs: Deque[Job] = deque(maxlen=DAEMON_JOB_HISTORY)
+        self.window_strategy = window_strategy
+        self.graph = None
+        self.running = 0
+        self._ids = itertools.count(1)
+        self._tasks: List[asyncio.Task] = []
+
+    def submit(self, tenant_id: Optional[str] = None, runs: int = 1, source: str = "api") -> List[Job]:
+        """Queue ``runs`` post jobs for a tenant (None for the default organization)."""
+        if tenant_id is not None and tenant_id not in self.tenants:
+            raise KeyError(f"Unknown tenant '{tenant_id}'")
+        if runs < 1:
+            raise ValueError(f"Cannot queue {runs} runs")
+        if self.queue.qsize() + runs > self.queue.maxsize > 0:
+            raise QueueFull(f"Job queue is full ({self.queue.maxsize} jobs)")
+        jobs = [Job(next(self._ids), tenant_id, source) for _ in range(runs)]
+        for job in jobs:
+            self.queue.put_nowait(job)
+            self.jobs.append(job)
+        REGISTRY.inc("daemon_jobs_submitted_total", len(jobs), help="Post jobs queued", source=source)
+        logger.info(f"Queued {len(jobs)} {source} job(s) for {tenant_id or 'the default organization'}")
+        return jobs
+
+    async def _run(self, job: Job) -> None:
+        from linkedin_news_post.runner import DEFAULT_INPUT, run_concurrently
+
+        tenant = self.tenants.get(job.tenant_id)
+        config = tenant.to_run_config() if tenant else None
+        limiter = self.limiters.get(job.tenant_id)
+        job.status, job.started_at = "running", time.time()
+        REGISTRY.observe("daemon_job_wait_seconds", job.started_at - job.submitted_at, help="Time jobs spent queued")
+        [result] = await run_concurrently(
+            self.graph, [DEFAULT_INPUT], 1, [config], [limiter], window_strategy=self.window_strategy
+        )
+        job.finished_at = time.time()
+        if isinstance(result, Exception):
+            job.status, job.error = "failed", repr(result)
+        else:
+            job.status = "done"
+        REGISTRY.inc("daemon_jobs_total", help="Post jobs finished", status=job.status, source=job.source)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self.queue.get()
+            self.running += 1
+            try:
+                await self._run(job)
+            except Exception as e:
+                job.status, job.error = "failed", repr(e)
+                logger.error(f"Job {job.job_id} failed: {e}", exc_info=True)
+            finally:
+                self.running -= 1
+                self.queue.task_done()
+
+    async def _schedule(self, tenant_id: Optional[str], schedule: CronSchedule) -> None:
+        runs = self.tenants[tenant_id].runs if tenant_id is not None else 1
+        while True:
+            fire_at = schedule.next_after(datetime.now())
+            logger.info(f"Next scheduled run for {tenant_id or 'the default organization'} at {fire_at:%Y-%m-%d %H:%M}")
+            # Sleep in bounded steps so clock changes and suspends do not delay a run by hours
+            while (remaining := (fire_at - datetime.now()).total_seconds()) > 0:
+                await asyncio.sleep(min(remaining, 60))
+            try:
+                self.submit(tenant_id, runs, source="schedule")
+            except QueueFull as e:
+                REGISTRY.inc("daemon_jobs_dropped_total", runs, help="Scheduled jobs dropped on a full queue")
+                logger.error(f"Skipped scheduled run for {tenant_id or 'the default organization'}: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        status = {
+            "workers": self.concurrency,
+            "running": self.running,
+            "queued": self.queue.qsize(),
+            "graph_ready": self.graph is not None,
+            "schedules": {tenant_id or "default": s.expression for tenant_id, s in self.schedules.items()},
+            "search_window": self.window_strategy,
+        }
+        if self.window_strategy == "advancing":
+            from linkedin_news_post.clients import get_window_cursor
+
+            status["searched_until"] = get_window_cursor().positions()
+        return status
+
+    def api(self):
+        """Starlette app of the job API."""
+        from starlette.applications import Starlette
+        from starlette.responses import JSONResponse
+        from starlette.routing import Route
+
+        async def health(request):
+            return JSONResponse(self.status())
+
+        async def list_jobs(request):
+            return JSONResponse([asdict(job) for job in reversed(self.jobs)])
+
+        async def submit_jobs(request):
+            try:
+                tenant_id, runs = parse_job_request(await request.json() if await request.body() else {})
+            except ValueError as e:
+                # Malformed JSON raises a ValueError too
+                return JSONResponse({"error": str(e)}, status_code=400)
+            try:
+                jobs = self.submit(tenant_id, runs)
+            except KeyError as e:
+                return JSONResponse({"error": str(e.args[0])}, status_code=404)
+            except QueueFull as e:
+                return JSONResponse({"error": str(e)}, status_code=503)
+            return JSONResponse([asdict(job) for job in jobs], status_code=202)
+
+        return Starlette(routes=[
+            Route("/health", health),
+            Route("/jobs", list_jobs, methods=["GET"]),
+            Route("/jobs", submit_jobs, methods=["POST"]),
+        ])
+
+    async def serve(self, host: Optional[str] = DAEMON_HOST, port: int = DAEMON_PORT) -> None:
+        """
+        Build the graph once, then run the workers, schedules and API until cancelled.
+
+        With ``host`` None the API is not served; jobs come from the
+        schedules and from ``submit``.
+        """
+        from linkedin_news_post.graph import make_graph
+
+        start = time.perf_counter()
+        async with make_graph() as graph:
+            self.graph = graph
+            logger.info(f"Graph ready in {time.perf_counter() - start:.1f}s; starting {self.concurrency} workers")
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+            self._tasks += [asyncio.create_task(self._schedule(t, s)) for t, s in self.schedules.items()]
+            server = serving = None
+            if host is not None:
+                import uvicorn
+
+                server = uvicorn.Server(uvicorn.Config(self.api(), host=host, port=port, log_level="warning"))
+                serving = asyncio.create_task(server.serve())
+                logger.info(f"Job API on http://{host}:{port}")
+            try:
+                # Unlike gather, wait leaves the API server running when this is cancelled
+                done, _ = await asyncio.wait([*self._tasks, *filter(None, [serving])], return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+            finally:
+                for task in self._tasks:
+                    task.cancel()
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+                if server is not None:
+                    # Let uvicorn finish its shutdown rather than cancelling it mid-lifespan
+                    server.should_exit = True
+                    await asyncio.gather(serving, return_exceptions=True)
+                self.graph = None
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait until every queued job has finished."""
+        await asyncio.wait_for(self.queue.join(), timeout)
+
+
+async def run_daemon(args: argparse.Namespace) -> None:
+    tenants = load_tenants(args.tenants) if args.tenants else []
+    daemon = PostDaemon(tenants, args.concurrency, args.schedule, window_strategy=args.window)
+    # Jobs queued now start as soon as the graph is built
+    for tenant_id in args.submit or []:
+        daemon.submit(None if tenant_id == "default" else tenant_id)
+    serving = asyncio.create_task(daemon.serve(None if args.no_api else args.host, args.port))
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, serving.cancel)
+    try:
+        await serving
+    except asyncio.CancelledError:
+        logger.info("Daemon stopped")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Keep the graph warm and run scheduled or queued post jobs.")
+    parser.add_argument("--tenants", help="JSON tenants file; tenants with a schedule are scheduled")
+    parser.add_argument("--schedule", help="Cron expression for runs for the default organization")
+    parser.add_argument("--concurrency", type=int, default=DAEMON_CONCURRENCY, help="Runs in flight at most")
+    parser.add_argument("--host", default=DAEMON_HOST)
+    parser.add_argument("--port", type=int, default=DAEMON_PORT)
+    parser.add_argument("--no-api", action="store_true", help="Do not serve the job API")
+    parser.add_argument("--window", choices=STRATEGIES, default=DAEMON_SEARCH_WINDOW,
+                        help="Search each job from where the tenant's last job ended, or the last SEARCH_DAYS_BACK days")
+    parser.add_argument("--submit", nargs="*", metavar="TENANT_ID",
+                        help="Queue one job per tenant id at startup ('default' for the default organization)")
+    asyncio.run(run_daemon(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
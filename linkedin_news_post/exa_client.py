@@ -0,0 +1,99 @@
+"""
+Exa client on the shared, pooled HTTP clients, with an async search.
+
+exa-py sends every request through ``requests.post`` without a session, so
+each search opens a new TLS connection, and it has no async client.
+``PooledExa`` keeps the SDK's option validation and response types but sends
+requests through the registry's ``httpx`` clients: sync calls reuse pooled
+keep-alive connections, and ``asearch_and_contents`` lets an event loop run
+many searches concurrently without a thread per search.
+"""
+from typing import Any, Dict, Optional
+
+import httpx
+from exa_py import Exa
+from exa_py.api import (
+    CONTENTS_ENDPOINT_OPTIONS_TYPES,
+    CONTENTS_OPTIONS_TYPES,
+    SEARCH_OPTIONS_TYPES,
+    Result,
+    SearchResponse,
+    nest_fields,
+    parse_cost_dollars,
+    to_camel_case,
+    to_snake_case,
+    validate_search_options,
+)
+
+# Options exa-py sends nested under "contents"
+_CONTENTS_FIELDS = [
+    "text", "highlights", "summary", "subpages", "subpage_target", "livecrawl", "livecrawl_timeout", "extras",
+]
+
+
+def search_options(query: str, **kwargs: Any) -> Dict[str, Any]:
+    """Build the ``/search`` payload exactly as ``Exa.search_and_contents`` does."""
+    options = {k: v for k, v in {"query": query, **kwargs}.items() if v is not None}
+    if not any(name in options for name in ("text", "highlights", "summary", "extras")):
+        options["text"] = True
+    validate_search_options(options, {**SEARCH_OPTIONS_TYPES, **CONTENTS_OPTIONS_TYPES, **CONTENTS_ENDPOINT_OPTIONS_TYPES})
+    return to_camel_case(nest_fields(options, list(_CONTENTS_FIELDS), "contents"))
+
+
+def search_response(data: Dict[str, Any]) -> SearchResponse:
+    return SearchResponse(
+        [Result(**to_snake_case(result)) for result in data["results"]],
+        data.get("autopromptString"),
+        data.get("resolvedSearchType"),
+        data.get("autoDate"),
+        cost_dollars=parse_cost_dollars(data.get("costDollars")),
+    )
+
+
+def _json(response: httpx.Response) -> Dict[str, Any]:
+    if response.status_code >= 400:
+        raise ValueError(f"Request failed with status code {response.status_code}: {response.text}")
+    return response.json()
+
+
+class PooledExa(Exa):
+    """
+    ``Exa`` sending its requests through shared ``httpx`` clients.
+
+    Args:
+        api_key: Exa API key
+        http_client: Pooled client for blocking calls
+        http_async_client: Pooled client for ``asearch_and_contents``
+        timeout: Seconds before a request is abandoned (None: no limit)
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        http_client: httpx.Client,
+        http_async_client: httpx.AsyncClient,
+        timeout: Optional[float] = None,
+    ):
+        super().__init__(api_key)
+        self.http_client = http_client
+        self.http_async_client = http_async_client
+        self.timeout = timeout
+
+    def request(self, endpoint: str, data=None, method="POST", params=None):
+        if data and data.get("stream"):
+            # Streaming answers are read through requests' raw response objects
+            return super().request(endpoint, data, method, params)
+        response = self.http_client.request(
+            method.upper(), self.base_url + endpoint, json=data, params=params, headers=self.headers, timeout=self.timeout
+        )
+        return _json(response)
+
+    async def arequest(self, endpoint: str, data=None, method="POST", params=None) -> Dict[str, Any]:
+        response = await self.http_async_client.request(
+            method.upper(), self.base_url + endpoint, json=data, params=params, headers=self.headers, timeout=self.timeout
+        )
+        return _json(response)
+
+    async def asearch_and_contents(self, query: str, **kwargs: Any) -> SearchResponse:
+        """Async ``search_and_contents`` taking the same options."""
+        return search_response(await self.arequest("/search", search_options(query, **kwargs)))
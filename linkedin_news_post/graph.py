@@ -1,22 +1,25 @@
 import asyncio
 import logging
-import os
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph, START
 from langgraph.prebuilt import ToolNode
-from composio_langchain import ComposioToolSet # Try importing from langchain adapter
-from langchain_openai import OpenAIEmbeddings
+from langgraph.utils.runnable import RunnableCallable
+from typing import Literal, get_args, get_type_hints
 
-from linkedin_news_post import State
+from linkedin_news_post import State, SearchTask
 from linkedin_news_post.nodes import (
-    publisher_node, supervisor_node, researcher_node, writer_node, quality_node
+    publisher_node, supervisor_node, researcher_node, writer_node, quality_node,
+    search_node, ranker_node, apublisher_node, asupervisor_node, aresearcher_node,
+    awriter_node, aquality_node, asearch_node, aranker_node
 )
-from linkedin_news_post.mongo_store import MongoDBBaseStore
+from linkedin_news_post.clients import get_store, get_linkedin_tools
+from linkedin_news_post.metrics import instrument_node
+from linkedin_news_post.runtime import RunConfiguration
 from linkedin_news_post.config import (
-    MONGODB_URI, COMPOSIO_MCP_URL, DB_NAME, COLLECTION_NAME, logger, DOMAIN_FOCUS,
-    COMPOSIO_LINKEDIN_TOOL, ORGANIZATION_URN, COMPOSIO_LINKEDIN_APP, COMPOSIO_LINKEDIN_ENTITY
+    MONGODB_URI, COMPOSIO_MCP_URL, DB_NAME, COLLECTION_NAME, logger,
+    COMPOSIO_LINKEDIN_TOOL, COMPOSIO_LINKEDIN_APP, GRAPH_RECURSION_LIMIT, COMPOSIO_LINKEDIN_ENTITY
 )
 
 # Load environment variables
@@ -32,35 +35,29 @@ if not COMPOSIO_MCP_URL:
 if not COMPOSIO_LINKEDIN_TOOL:
     logger.error("COMPOSIO_LINKEDIN_TOOL environment variable is not set. LinkedIn integration will not function correctly.")
 
-# Initialize OpenAI embeddings
-openai_embeddings = OpenAIEmbeddings()
-logger.info(f"Configured for domain focus: {DOMAIN_FOCUS}")
+# The OpenAI embeddings and the MongoDB store are created lazily by
+# linkedin_news_post.clients the first time a graph is built.
 
-def embed_text(text: str) -> list[float]:
-    return openai_embeddings.embed_query(text)
+# Removed verify_linkedin_integration function
 
-index_config = {
-    "embed": embed_text,     
-    "fields": ["content.article", "summary"],
-    "index_name": "store_index",
-}
+def dual_node(func, afunc) -> RunnableCallable:
+    """
+    Wrap a node's sync and async implementations in one runnable.
 
-# Initialize MongoDB store if connection string is available
-mongo_store = None
-if MONGODB_URI:
-    try:
-        mongo_store = MongoDBBaseStore(
-            mongo_url=MONGODB_URI,
-            db_name=DB_NAME,
-            collection_name=COLLECTION_NAME,
-            index_config=index_config,
-            ttl_support=True
-        )
-        logger.info(f"MongoDB store initialized with database '{DB_NAME}' and collection '{COLLECTION_NAME}'")
-    except Exception as e:
-        logger.error(f"Failed to initialize MongoDB store: {str(e)}")
+    ``graph.invoke`` runs ``func`` and ``graph.ainvoke``/``astream`` run
+    ``afunc`` natively on the event loop instead of in a worker thread.
+    Both are instrumented so their wall time is recorded under the node name.
+    """
+    name = func.__name__
+    return RunnableCallable(instrument_node(func, name), instrument_node(afunc, name), name=name, trace=False)
 
-# Removed verify_linkedin_integration function
+def node_destinations(func) -> tuple:
+    """Read the Command[Literal[...]] return annotation used to draw the graph."""
+    try:
+        command = get_type_hints(func).get("return")
+        return get_args(get_args(command)[0])
+    except (IndexError, TypeError, NameError):
+        return ()
 
 @asynccontextmanager
 async def make_graph():
@@ -70,53 +67,41 @@ async def make_graph():
     Returns:
         A compiled workflow graph ready for execution.
     """
-    if not mongo_store:
-        logger.error("Cannot create graph: MongoDB store is not initialized")
-        raise ValueError("MongoDB store is not initialized. Check MONGODB_URI environment variable.")
-        
-    if not COMPOSIO_MCP_URL:
-        logger.error("Cannot create graph: COMPOSIO_MCP_URL is not set")
-        raise ValueError("COMPOSIO_MCP_URL is not set. Check environment variables.")
-
-    # Initialize Composio ToolSet using API Key from environment
-    composio_api_key = os.getenv("COMPOSIO_API_KEY")
-    if not composio_api_key:
-        logger.error("COMPOSIO_API_KEY environment variable not set. Cannot initialize ComposioToolSet.")
-        raise ValueError("COMPOSIO_API_KEY environment variable not set.")
-    # Initialize ComposioToolSet (removed apps filter based on warning)
-    mcp_client = ComposioToolSet(api_key=composio_api_key)
-    logger.info(f"Composio ToolSet initialized.")
-
-    # Fetch tools for the specified LinkedIn app using get_tools
-    tools = [] # Default to empty list
     try:
-        # Attempt to get tools filtered by app name
-        # Assuming get_tools exists on the ComposioToolSet from composio_langchain
-        tools = mcp_client.get_tools(apps=[COMPOSIO_LINKEDIN_APP])
-        logger.info(f"Successfully fetched tools for app '{COMPOSIO_LINKEDIN_APP}': {[t.name for t in tools]}")
+        mongo_store = get_store()
     except Exception as e:
-         logger.error(f"Failed to get tools for app '{COMPOSIO_LINKEDIN_APP}': {e}", exc_info=True)
-         # Continue with empty tools list if fetching fails
+        logger.error(f"Cannot create graph: MongoDB store is not initialized: {str(e)}")
+        raise ValueError("MongoDB store is not initialized. Check MONGODB_URI environment variable.") from e
 
-    # Create workflow graph
-    workflow = StateGraph(State)
+    tools = get_linkedin_tools()
 
-    # Add nodes
-    workflow.add_node("supervisor_node", supervisor_node)
+    # Create workflow graph
+    # Tenant settings arrive per run through config["configurable"]
+    workflow = StateGraph(State, config_schema=RunConfiguration)
+
+    # Add nodes with native sync and async implementations
+    for func, afunc in [
+        (supervisor_node, asupervisor_node),
+        (publisher_node, apublisher_node),
+        (researcher_node, aresearcher_node),
+        (quality_node, aquality_node),
+        (writer_node, awriter_node),
+        (ranker_node, aranker_node),
+    ]:
+        workflow.add_node(func.__name__, dual_node(func, afunc), destinations=node_destinations(func))
+    workflow.add_node("search_node", dual_node(search_node, asearch_node), input=SearchTask)
     # Pass the fetched list of tools to ToolNode
     workflow.add_node("tool_node", ToolNode(tools))
-    workflow.add_node("publisher_node", publisher_node)
-    workflow.add_node("researcher_node", researcher_node)
-    workflow.add_node("quality_node", quality_node)
-    workflow.add_node("writer_node", writer_node)
 
     # Add edges
     workflow.add_edge(START, "supervisor_node")
     workflow.add_edge("tool_node", "supervisor_node")
+    # Parallel search tasks from the researcher fan-out join at the ranker
+    workflow.add_edge("search_node", "ranker_node")
 
     # Compile graph with MongoDB store
-    graph = workflow.compile(store=mongo_store)
-    logger.info(f"Graph compiled successfully for {DOMAIN_FOCUS} content")
+    graph = workflow.compile(store=mongo_store).with_config(recursion_limit=GRAPH_RECURSION_LIMIT)
+    logger.info("Graph compiled successfully")
     yield graph
 
 # Removed the orphaned except block and fixed indentation
@@ -0,0 +1,229 @@
+"""
+Process manager for the MCP server and the graph.
+
+``python -m linkedin_news_post.launcher`` starts the MCP server over SSE as
+a child process, waits until it is ready, runs the graph in this process and
+stops the server once the runs are done (or keeps serving with ``--serve``).
+
+Readiness is a handshake, not a fixed sleep. Either the server's ``/health``
+endpoint answers, or a complete MCP ``initialize`` round trip succeeds.
+Probes back off exponentially (``LAUNCH_PROBE_FIRST_DELAY`` up to
+``LAUNCH_PROBE_MAX_DELAY``). They fail at once if the server exits, and give
+up after ``LAUNCH_READY_TIMEOUT_SECONDS``.
+
+Every launch reports its cold start: the seconds from launch until the
+server was ready, until the graph was built and until the first graph node
+started.
+"""
+import time
+
+# Cold-start latency is measured from here, before the heavier imports
+LAUNCHED = time.time()
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from linkedin_news_post.config import (
+    LAUNCH_PROBE_FIRST_DELAY,
+    LAUNCH_PROBE_MAX_DELAY,
+    LAUNCH_READINESS,
+    LAUNCH_READY_TIMEOUT_SECONDS,
+    MCP_HOST,
+    MCP_PORT,
+    RUN_CONCURRENCY,
+    logger,
+)
+
+READINESS_PROBES = ("health", "initialize")
+
+
+class ServerNotReady(RuntimeError):
+    """The MCP server exited or did not become ready in time."""
+
+
+class ManagedProcess:
+    """A child process that is terminated on stop, and killed if it does not exit in time."""
+
+    def __init__(self, name: str, argv: List[str], env: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.argv = argv
+        self.env = env
+        self.process: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        self.process = subprocess.Popen(self.argv, env=self.env)
+        logger.info(f"Started {self.name} with PID {self.process.pid}")
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.process.poll() if self.process else None
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def wait(self) -> int:
+        return self.process.wait()
+
+    def stop(self, grace: float = 5.0) -> None:
+        if not self.running:
+            return
+        logger.info(f"Stopping {self.name} (PID {self.process.pid})")
+        self.process.terminate()
+        try:
+            self.process.wait(grace)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"{self.name} did not exit within {grace}s; killing it")
+            self.process.kill()
+            self.process.wait()
+
+
+def mcp_server_process(host: str = MCP_HOST, port: int = MCP_PORT) -> ManagedProcess:
+    """The MCP server as a child process, serving SSE on ``host:port``."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    argv = [sys.executable, "-m", "linkedin_news_post.mcp_server", "--transport", "sse", "--host", host, "--port", str(port)]
+    return ManagedProcess("MCP server", argv, env)
+
+
+def health_probe(base_url: str, timeout: float = 1.0) -> Callable[[], Awaitable[bool]]:
+    """Probe that succeeds once ``/health`` answers 200."""
+    async def probe() -> bool:
+        async with httpx.AsyncClient(timeout=timeout) as http:
+            return (await http.get(f"{base_url}/health")).status_code == 200
+    return probe
+
+
+def initialize_probe(base_url: str, timeout: float = 5.0) -> Callable[[], Awaitable[bool]]:
+    """Probe that succeeds once an MCP client completes ``initialize`` over SSE."""
+    async def probe() -> bool:
+        from mcp import ClientSession
+        from mcp.client.sse import sse_client
+
+        async with asyncio.timeout(timeout):
+            async with sse_client(f"{base_url}/sse", timeout=timeout) as (read, write), ClientSession(read, write) as session:
+                await session.initialize()
+        return True
+    return probe
+
+
+async def wait_until_ready(
+    probe: Callable[[], Awaitable[bool]],
+    process: Optional[ManagedProcess] = None,
+    timeout: float = LAUNCH_READY_TIMEOUT_SECONDS,
+    first_delay: float = LAUNCH_PROBE_FIRST_DELAY,
+    max_delay: float = LAUNCH_PROBE_MAX_DELAY,
+) -> float:
+    """
+    Probe until the server is ready, backing off exponentially between probes.
+
+    Returns:
+        Seconds spent waiting
+
+    Raises:
+        ServerNotReady: If ``process`` exits or ``timeout`` passes first
+    """
+    start = time.monotonic()
+    delay, attempts, last_error = first_delay, 0, None
+    while True:
+        if process is not None and process.process is not None and not process.running:
+            raise ServerNotReady(f"{process.name} exited with code {process.returncode} before it was ready")
+        attempts += 1
+        try:
+            if await probe():
+                waited = time.monotonic() - start
+                logger.info(f"Server ready after {waited:.2f}s ({attempts} probes)")
+                return waited
+        except Exception as e:
+            last_error = e
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
+            raise ServerNotReady(f"Server not ready after {timeout:.0f}s ({attempts} probes); last error: {last_error!r}")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+def report_cold_start(stages: Dict[str, float]) -> str:
+    from linkedin_news_post.metrics import REGISTRY
+
+    for stage, seconds in stages.items():
+        REGISTRY.observe("cold_start_seconds", seconds, help="Seconds from launch to each startup stage", stage=stage)
+    return "Cold start: " + ", ".join(f"{stage.replace('_', ' ')} {seconds:.2f}s" for stage, seconds in stages.items())
+
+
+async def launch(args: argparse.Namespace, launched: Optional[float] = None) -> Dict[str, float]:
+    """
+    Start the server, run the graph and return the cold-start stages.
+
+    Stages are in seconds from ``launched``, by default the time this module
+    was imported.
+    """
+    launched = launched or LAUNCHED
+    stages: Dict[str, float] = {}
+    server = None if args.no_server else mcp_server_process(args.host, args.port)
+    try:
+        if server is not None:
+            server.start()
+        # The graph's imports take about as long as the server's start, so they overlap
+        from linkedin_news_post.graph import make_graph
+        from linkedin_news_post.metrics import first_node_at
+        from linkedin_news_post.runner import DEFAULT_INPUT, run_concurrently
+
+        if server is not None:
+            base_url = f"http://{args.host}:{args.port}"
+            probe = initialize_probe(base_url) if args.readiness == "initialize" else health_probe(base_url)
+            await wait_until_ready(probe, server, args.ready_timeout)
+            stages["server_ready"] = time.time() - launched
+
+        async with make_graph() as graph:
+            stages["graph_built"] = time.time() - launched
+            results = await run_concurrently(graph, [DEFAULT_INPUT] * args.runs, args.concurrency)
+        if first_node_at() is not None:
+            stages["first_node"] = first_node_at() - launched
+        logger.info(report_cold_start(stages))
+        failed = [r for r in results if isinstance(r, Exception)]
+        logger.info(f"{args.runs - len(failed)} of {args.runs} runs completed successfully")
+
+        if server is not None and args.serve:
+            logger.info("Runs finished; the MCP server keeps serving until interrupted")
+            await asyncio.to_thread(server.wait)
+        return stages
+    finally:
+        if server is not None:
+            server.stop()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Start the MCP server, then generate posts once it is ready.")
+    parser.add_argument("--runs", type=int, default=1, help="Number of independent posts to generate")
+    parser.add_argument("--concurrency", type=int, default=RUN_CONCURRENCY, help="Maximum runs executing at once")
+    parser.add_argument("--host", default=MCP_HOST)
+    parser.add_argument("--port", type=int, default=MCP_PORT)
+    parser.add_argument("--readiness", choices=READINESS_PROBES, default=LAUNCH_READINESS,
+                        help="Probe /health, or complete an MCP initialize handshake")
+    parser.add_argument("--ready-timeout", type=float, default=LAUNCH_READY_TIMEOUT_SECONDS)
+    parser.add_argument("--serve", action="store_true", help="Keep the MCP server running after the runs finish")
+    parser.add_argument("--no-server", action="store_true", help="Run the graph without starting the MCP server")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        asyncio.run(launch(args))
+    except ServerNotReady as e:
+        logger.error(str(e))
+        return 1
+    except KeyboardInterrupt:
+        logger.info("Interrupted; shutting down")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,39 +1,251 @@
+"""
+MCP server for the LinkedIn ghostwriter's news tools.
+
+One module serves every client. Over stdio each client spawns its own
+server process; over SSE one long-lived process serves many concurrent
+clients, each in its own MCP session, while all of them share the
+process's Exa client, HTTP connection pool, search cache and news corpus.
+
+    python -m linkedin_news_post.mcp_server                     # stdio
+    python -m linkedin_news_post.mcp_server --transport sse --port 8000
+"""
 import os
+import time
+import argparse
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import anyio
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
-from exa_py import Exa
+from mcp.server.session import ServerSession
 
+from linkedin_news_post import clients
+from linkedin_news_post.research import dedupe_and_rank, normalize_results
+from linkedin_news_post.metrics import REGISTRY
+from linkedin_news_post.search_cache import CachedResponse, CachedResult
+from linkedin_news_post.search_results import shape_results
+from linkedin_news_post.search_window import rolling_window
 # Import configuration
 from linkedin_news_post.config import (
-    EXA_API_KEY,
     SEARCH_NUM_RESULTS,
     SEARCH_MAX_CHARACTERS,
     SEARCH_CATEGORY,
-    DEFAULT_START_DATE,
-    DEFAULT_END_DATE,
+    SEARCH_MULTI_CONCURRENCY,
+    SEARCH_RESULT_FIELDS,
+    CORPUS_LOCAL_MIN_RESULTS,
+    HTTP_MAX_CONNECTIONS,
+    MCP_TRANSPORT,
+    MCP_HOST,
+    MCP_PORT,
     logger
 )
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+
+@dataclass
+class SessionStats:
+    """Tool calls made by one client session."""
+
+    client: str
+    connected_at: float = field(default_factory=time.time)
+    calls: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+
+
+class _AsgiEndpoint:
+    """Wraps an ASGI callable so that Starlette routes to it as an app, not a request handler."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
+
+
+class NewsToolsServer(FastMCP):
+    """
+    FastMCP server that keeps statistics per client session.
+
+    Sessions are held weakly, so a client's entry goes away with its
+    connection.
+    """
+
+    def __init__(self, name: str, **settings: Any):
+        super().__init__(name, **settings)
+        self.started = time.time()
+        self.transport = "stdio"
+        self.connections = 0
+        self.sessions: "weakref.WeakKeyDictionary[ServerSession, SessionStats]" = weakref.WeakKeyDictionary()
+
+    def _session_stats(self) -> Optional[SessionStats]:
+        try:
+            session = self._mcp_server.request_context.session
+        except LookupError:
+            return None
+        stats = self.sessions.get(session)
+        if stats is None:
+            params = session.client_params
+            stats = self.sessions[session] = SessionStats(client=params.clientInfo.name if params else "unknown")
+        return stats
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]):
+        stats = self._session_stats()
+        start = time.perf_counter()
+        error = False
+        try:
+            return await super().call_tool(name, arguments)
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if stats is not None:
+                stats.calls += 1
+                stats.errors += error
+                stats.busy_seconds += elapsed
+            REGISTRY.inc("mcp_tool_calls_total", help="MCP tool calls", tool=name, error=str(error).lower())
+            REGISTRY.observe("mcp_tool_seconds", elapsed, help="MCP tool call duration", tool=name)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "transport": self.transport,
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "connections": self.connections,
+            "sessions": [
+                {**asdict(stats), "busy_seconds": round(stats.busy_seconds, 3)} for stats in list(self.sessions.values())
+            ],
+            "exa": clients.get_exa() is not None,
+            "http_max_connections": HTTP_MAX_CONNECTIONS,
+        }
+
+    def sse_app(self):
+        """
+        Starlette app serving the tools over SSE.
+
+        Clients open ``/sse`` and post their messages to ``/messages/``;
+        ``/health`` answers once the server accepts connections.
+        """
+        from mcp.server.sse import SseServerTransport
+        from starlette.applications import Starlette
+        from starlette.responses import JSONResponse
+        from starlette.routing import Mount, Route
+
+        self.transport = "sse"
+        sse = SseServerTransport("/messages/")
+
+        async def handle_sse(scope, receive, send):
+            # The SSE transport never closes a session's streams when its client
+            # goes away, so the session is cancelled on the client's disconnect
+            disconnected = anyio.Event()
+
+            async def watch_receive():
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                return message
+
+            async def run_session(read, write, scope):
+                await self._mcp_server.run(read, write, self._mcp_server.create_initialization_options())
+                scope.cancel()
+
+            self.connections += 1
+            try:
+                async with sse.connect_sse(scope, watch_receive, send) as (read, write):
+                    async with anyio.create_task_group() as tg:
+                        tg.start_soon(run_session, read, write, tg.cancel_scope)
+                        await disconnected.wait()
+                        tg.cancel_scope.cancel()
+            finally:
+                self.connections -= 1
+
+        async def health(request):
+            return JSONResponse({"status": "ok", "tools": len(self._tool_manager.list_tools()), "connections": self.connections})
+
+        return Starlette(
+            debug=self.settings.debug,
+            routes=[
+                # A plain ASGI app, as the SSE response is sent by the transport itself
+                Route("/sse", endpoint=_AsgiEndpoint(handle_sse)),
+                Route("/health", endpoint=health),
+                Mount("/messages/", app=sse.handle_post_message),
+            ],
+        )
+
+    async def serve_sse(self, host: str, port: int) -> None:
+        import uvicorn
+
+        config = uvicorn.Config(self.sse_app(), host=host, port=port, log_level=self.settings.log_level.lower())
+        await uvicorn.Server(config).serve()
+
+
 # Initialize MCP server
-mcp = FastMCP("linkedin_tools_stdio")
+mcp = NewsToolsServer("linkedin_tools")
+
+EXA_NOT_INITIALIZED = "Exa client not initialized. Please check EXA_API_KEY environment variable."
 
-# Initialize Exa client if API key is available
-exa = None
-if EXA_API_KEY:
+
+def _search_params(query: str, start_published_date: Optional[str], end_published_date: Optional[str]) -> Dict[str, Any]:
+    """Everything that determines a search's results, with missing dates taken from the rolling window as of now."""
+    window = rolling_window()
+    return {
+        "query": query,
+        "start_published_date": start_published_date or window.start_date,
+        "end_published_date": end_published_date or window.end_date,
+        "category": SEARCH_CATEGORY,
+        "num_results": SEARCH_NUM_RESULTS,
+        "max_characters": SEARCH_MAX_CHARACTERS,
+    }
+
+
+def _exa_options(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "use_autoprompt": False,
+        "num_results": params["num_results"],
+        "start_published_date": params["start_published_date"],
+        "end_published_date": params["end_published_date"],
+        "text": {"max_characters": params["max_characters"]},
+        "category": params["category"],
+    }
+
+
+def _serve_locally(params: Dict[str, Any]) -> Optional[CachedResponse]:
+    """Answer from the news corpus when it holds enough matching stories (see CORPUS_LOCAL_MIN_RESULTS)."""
+    corpus = clients.get_news_corpus()
+    if corpus is None or CORPUS_LOCAL_MIN_RESULTS <= 0:
+        return None
+    results = corpus.search(
+        params["query"], params["start_published_date"], params["end_published_date"], limit=params["num_results"]
+    )
+    if len(results) < CORPUS_LOCAL_MIN_RESULTS:
+        return None
+    logger.info(f"Serving '{params['query']}' from the news corpus ({len(results)} stories)")
+    return CachedResponse(results=[
+        CachedResult(**{k: v for k, v in result.items() if k != "queries"}) for result in results
+    ])
+
+
+def _add_to_corpus(response: Any, params: Dict[str, Any]) -> None:
+    corpus = clients.get_news_corpus()
+    if corpus is None:
+        return
     try:
-        exa = Exa(api_key=EXA_API_KEY)
-        logger.info("Exa client initialized successfully")
+        corpus.add(
+            normalize_results(response, params["query"]), params["query"],
+            params["start_published_date"], params["end_published_date"],
+        )
     except Exception as e:
-        logger.error(f"Failed to initialize Exa client: {str(e)}")
+        logger.warning(f"Could not add search results to the news corpus: {e}")
+
 
-@mcp.tool()
 def search_and_content(
     query: str,
     start_published_date: Optional[str] = None,
@@ -41,46 +253,265 @@ def search_and_content(
 ) -> str:
     """
     Search for webpages based on the query and return their contents.
-    
+
     Args:
         query: The search query string, focused on aviation maintenance and MRO topics
         start_published_date: Start date for published content in ISO format with .000Z suffix
         end_published_date: End date for published content in ISO format with .000Z suffix
-        
+
     Returns:
         JSON string containing search results and their contents
-        
+
     Raises:
         Exception: If the Exa API call fails or if the Exa client is not initialized
     """
+    exa = clients.get_exa()
     if not exa:
-        error_msg = "Exa client not initialized. Please check EXA_API_KEY environment variable."
+        logger.error(EXA_NOT_INITIALIZED)
+        return {"error": EXA_NOT_INITIALIZED}
+
+    try:
+        params = _search_params(query, start_published_date, end_published_date)
+
+        def fetch():
+            local = _serve_locally(params)
+            if local is not None:
+                return local
+            logger.info(f"Searching for '{query}' between {params['start_published_date']} and {params['end_published_date']}")
+            response = exa.search_and_contents(query, **_exa_options(params))
+            _add_to_corpus(response, params)
+            return response
+
+        cache = clients.get_search_cache()
+        return cache.get_or_fetch(params, fetch) if cache is not None else fetch()
+    except Exception as e:
+        error_msg = f"Error in search_and_content: {str(e)}"
         logger.error(error_msg)
         return {"error": error_msg}
-    
+
+
+async def asearch_and_content(
+    query: str,
+    start_published_date: Optional[str] = None,
+    end_published_date: Optional[str] = None
+) -> str:
+    """Async variant of :func:`search_and_content` on the pooled async HTTP client."""
+    exa = clients.get_exa()
+    if not exa:
+        logger.error(EXA_NOT_INITIALIZED)
+        return {"error": EXA_NOT_INITIALIZED}
+
     try:
-        # Use provided dates or defaults
-        start_date = start_published_date or DEFAULT_START_DATE
-        end_date = end_published_date or DEFAULT_END_DATE
-        
-        logger.info(f"Searching for '{query}' between {start_date} and {end_date}")
-        
-        return exa.search_and_contents(
-            query,
-            use_autoprompt=False,
-            num_results=SEARCH_NUM_RESULTS,
-            start_published_date=start_date,
-            end_published_date=end_date,
-            text={"max_characters": SEARCH_MAX_CHARACTERS},
-            category=SEARCH_CATEGORY,
-        )
+        params = _search_params(query, start_published_date, end_published_date)
+
+        async def afetch():
+            # The corpus is a local SQLite file; its queries and writes run off the event loop
+            local = await asyncio.to_thread(_serve_locally, params)
+            if local is not None:
+                return local
+            logger.info(f"Searching for '{query}' between {params['start_published_date']} and {params['end_published_date']}")
+            response = await exa.asearch_and_contents(query, **_exa_options(params))
+            await asyncio.to_thread(_add_to_corpus, response, params)
+            return response
+
+        cache = clients.get_search_cache()
+        return await (cache.aget_or_fetch(params, afetch) if cache is not None else afetch())
     except Exception as e:
         error_msg = f"Error in search_and_content: {str(e)}"
         logger.error(error_msg)
         return {"error": error_msg}
 
 
-if __name__ == "__main__":
-    logger.info("Starting MCP server with tools: %s", mcp.list_tools())
+def format_results(
+    response: Any,
+    query: str,
+    fields: Optional[List[str]] = None,
+    snippet_chars: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Shape a search response for MCP clients.
+
+    Results are merged by canonical URL, near-duplicate stories are
+    collapsed into one representative with a ``sources`` count, and the
+    rest is cut down to the compact schema of ``search_results``; errors
+    are passed through.
+    """
+    if isinstance(response, dict) and "error" in response:
+        return response
+    results = normalize_results(response, query)
+    return _shaped("search_and_content", dedupe_and_rank(results, len(results)), fields, snippet_chars)
+
+
+def _shaped(tool: str, results: List[Dict[str, Any]], fields, snippet_chars, errors=None) -> Dict[str, Any]:
+    try:
+        payload = shape_results(results, fields, snippet_chars, errors)
+    except ValueError as e:
+        return {"error": str(e)}
+    REGISTRY.observe(
+        "search_tool_payload_tokens", payload["token_estimate"], help="Estimated tokens of search tool output", tool=tool
+    )
+    return payload
+
+
+async def search_and_content_tool(
+    query: str,
+    start_published_date: Optional[str] = None,
+    end_published_date: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    snippet_chars: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Search for news based on the query and return compact results.
+
+    Args:
+        query: The search query string, focused on aviation maintenance and MRO topics
+        start_published_date: Start date for published content in ISO format with .000Z suffix
+        end_published_date: End date for published content in ISO format with .000Z suffix
+        fields: Fields to return per result, from url, title, published,
+            author, snippet, score, sources and queries (default: the
+            server's SEARCH_RESULT_FIELDS)
+        snippet_chars: Maximum snippet length per result (default: the
+            server's SEARCH_SNIPPET_CHARS)
+
+    Returns:
+        "results", one per story, and "token_estimate", the approximate
+        prompt tokens of the response; or "error"
+    """
+    response = await asearch_and_content(query, start_published_date, end_published_date)
+    return format_results(response, query, fields, snippet_chars)
+
+
+# The MCP tool runs on the server's event loop, so it takes the async path
+mcp.add_tool(search_and_content_tool, name="search_and_content")
+
+
+@mcp.tool()
+async def multi_search(
+    queries: List[str],
+    start_published_date: Optional[str] = None,
+    end_published_date: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    snippet_chars: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run several searches concurrently and merge their results.
+
+    Args:
+        queries: The search query strings
+        start_published_date: Start date for published content in ISO format with .000Z suffix
+        end_published_date: End date for published content in ISO format with .000Z suffix
+        max_concurrency: Searches in flight at once, capped at the server's
+            SEARCH_MULTI_CONCURRENCY
+        fields: Fields to return per result, as for search_and_content;
+            "queries", the queries that found each story, is added to the
+            default selection
+        snippet_chars: Maximum snippet length per result
+
+    Returns:
+        "results": the results of all queries, one per story, ranked by how
+        many queries found it, then by sources and relevance; "errors": the
+        error message of each failed query; "token_estimate"
+    """
+    limit = max(1, min(max_concurrency or SEARCH_MULTI_CONCURRENCY, SEARCH_MULTI_CONCURRENCY))
+    semaphore = asyncio.Semaphore(limit)
+
+    async def search(query: str):
+        async with semaphore:
+            return await asearch_and_content(query, start_published_date, end_published_date)
+
+    unique = list(dict.fromkeys(queries))
+    responses = await asyncio.gather(*(search(query) for query in unique))
+    results, errors = [], {}
+    for query, response in zip(unique, responses):
+        if isinstance(response, dict) and "error" in response:
+            errors[query] = response["error"]
+        else:
+            results.extend(normalize_results(response, query))
+    merged = dedupe_and_rank(results, len(results))
+    logger.info(f"multi_search: {len(unique)} queries, {len(merged)} unique results, {len(errors)} failed")
+    if not fields:
+        fields = list(dict.fromkeys([*SEARCH_RESULT_FIELDS, "queries"]))
+    return _shaped("multi_search", merged, fields, snippet_chars, errors)
+
+
+@mcp.tool()
+async def search_corpus(
+    query: str,
+    start_published_date: Optional[str] = None,
+    end_published_date: Optional[str] = None,
+    limit: int = SEARCH_NUM_RESULTS,
+    fields: Optional[List[str]] = None,
+    snippet_chars: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Search the news already fetched by earlier searches, without calling Exa.
+
+    Args:
+        query: Words to look for in titles and snippets; stories matching more of them rank first
+        start_published_date: Earliest publishing date, in ISO format
+        end_published_date: Latest publishing date, in ISO format
+        limit: Maximum number of stories to return
+        fields: Fields to return per result, as for search_and_content
+        snippet_chars: Maximum snippet length per result
+
+    Returns:
+        "results" and "token_estimate" as for search_and_content, and
+        "corpus" with the number of stored stories and logged searches
+    """
+    corpus = clients.get_news_corpus()
+    if corpus is None:
+        return {"error": "The news corpus is disabled (CORPUS_ENABLED=false)."}
+    # FastMCP calls tools on the event loop shared by every session; SQLite queries run off it
+    results = await asyncio.to_thread(corpus.search, query, start_published_date, end_published_date, limit=limit)
+    payload = _shaped("search_corpus", dedupe_and_rank(results, len(results)), fields, snippet_chars)
+    return {**payload, "corpus": await asyncio.to_thread(corpus.stats)}
+
+
+@mcp.tool()
+def search_cache_stats() -> Dict[str, Any]:
+    """
+    Report the search cache's lookup counts and hit rate since the server started.
+
+    Returns:
+        Counts of fresh hits, stale hits, misses and coalesced misses, the hit
+        rate and the number of entries held in memory
+    """
+    cache = clients.get_search_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
+
+
+@mcp.tool()
+def server_status() -> Dict[str, Any]:
+    """
+    Report the server's transport, uptime and connected client sessions.
+
+    Returns:
+        The transport, uptime, open connections, tool calls per client
+        session, and whether the shared Exa client is configured
+    """
+    return mcp.status()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the LinkedIn ghostwriter's news tools over MCP")
+    parser.add_argument("--transport", choices=("stdio", "sse"), default=MCP_TRANSPORT)
+    parser.add_argument("--host", default=MCP_HOST)
+    parser.add_argument("--port", type=int, default=MCP_PORT)
+    args = parser.parse_args(argv)
+
+    # Build the shared clients before the first call rather than during it
+    clients.get_exa()
+    clients.get_search_cache()
+    clients.get_news_corpus()
+    logger.info("Starting MCP server over %s with tools: %s", args.transport,
+                [tool.name for tool in mcp._tool_manager.list_tools()])
     logger.info("Server configured for aviation maintenance and MRO content")
-    mcp.run(transport="stdio")
+    if args.transport == "sse":
+        asyncio.run(mcp.serve_sse(args.host, args.port))
+    else:
+        mcp.run(transport="stdio")
+
+
+if __name__ == "__main__":
+    main()
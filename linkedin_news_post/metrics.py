@@ -0,0 +1,543 @@
+"""
+Latency, token and cost instrumentation.
+
+Every graph node and every LLM, embedding, MongoDB and Exa call is timed and
+recorded twice: in a process-wide registry exported in the Prometheus text
+format, and in the ``RunMetrics`` of the run it belongs to (tracked through a
+context variable), which yields a per-run JSON summary and a report broken
+down by supervisor loop.
+
+Every node also reports its own visit, tokens, cost and start time in its
+state update (``run_usage``), so per-run budgets can be enforced from the
+graph state however the graph was invoked, with or without ``track_run``.
+
+Hooks:
+    * nodes are wrapped with ``instrument_node`` when the graph is built
+    * chat models carry ``METRICS_CALLBACK`` (tokens, retries, fallbacks)
+    * embeddings and the Exa search are wrapped with ``instrument_call``
+    * MongoDB commands are observed by ``MongoCommandListener``
+"""
+import dataclasses
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from linkedin_news_post.config import EXA_COST_PER_SEARCH, METRICS_DIR, MODEL_PRICES, logger
+
+SUPERVISOR_NODE = "supervisor_node"
+# State key each node's usage is added under, see state.merge_usage
+USAGE_KEY = "run_usage"
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int = 0, completion_tokens: int = 0, cached_tokens: int = 0) -> float:
+    """
+    Estimate the USD cost of a model call from the per-million-token price table.
+
+    ``cached_tokens`` is the part of ``prompt_tokens`` served from the prompt
+    cache, billed at the model's cached price when it has one.
+    """
+    if not model:
+        return 0.0
+    # Dated snapshots ("gpt-4o-2024-08-06") are priced like their base model
+    matches = [name for name in MODEL_PRICES if model.startswith(name)]
+    if not matches:
+        return 0.0
+    prices = MODEL_PRICES[max(matches, key=len)]
+    cached_tokens = min(cached_tokens, prompt_tokens)
+    prompt_cost = (prompt_tokens - cached_tokens) * prices["prompt"] + cached_tokens * prices.get("cached", prices["prompt"])
+    return (prompt_cost + completion_tokens * prices.get("completion", 0.0)) / 1_000_000
+
+
+class MetricsRegistry:
+    """Process-wide counters and summaries, exported in the Prometheus text format."""
+
+    def __init__(self, prefix: str = "linkedin_news_post"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Tuple, float]] = defaultdict(lambda: defaultdict(float))
+        self._summaries: Dict[str, Dict[Tuple, List[float]]] = defaultdict(lambda: defaultdict(lambda: [0, 0.0]))
+        self._help: Dict[str, Tuple[str, str]] = {}
+
+    def inc(self, metric: str, value: float = 1.0, help: str = "", **labels: Any) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            self._help.setdefault(metric, ("counter", help))
+            self._counters[metric][key] += value
+
+    def observe(self, metric: str, value: float, help: str = "", **labels: Any) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            self._help.setdefault(metric, ("summary", help))
+            summary = self._summaries[metric][key]
+            summary[0] += 1
+            summary[1] += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        # Label values escape backslashes, double quotes and line feeds (text exposition format)
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @classmethod
+    def _labels(cls, key: Tuple) -> str:
+        if not key:
+            return ""
+        return "{" + ",".join(f'{k}="{cls._escape(v)}"' for k, v in key) + "}"
+
+    def prometheus_text(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (kind, help) in sorted(self._help.items()):
+                full = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full} {help}")
+                lines.append(f"# TYPE {full} {kind}")
+                if kind == "counter":
+                    for key, value in sorted(self._counters[name].items()):
+                        lines.append(f"{full}{self._labels(key)} {value:g}")
+                else:
+                    for key, (count, total) in sorted(self._summaries[name].items()):
+                        lines.append(f"{full}_count{self._labels(key)} {count}")
+                        lines.append(f"{full}_sum{self._labels(key)} {total:.6f}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class RunMetrics:
+    """Everything measured during one graph run."""
+
+    def __init__(self, run_id: Optional[str] = None, labels: Optional[Dict[str, Any]] = None):
+        self.run_id = run_id or uuid.uuid4().hex
+        self.labels = labels or {}
+        self.started = time.time()
+        self.finished: Optional[float] = None
+        self.loop = 0
+        self.nodes: List[Dict[str, Any]] = []
+        self.calls: List[Dict[str, Any]] = []
+        # Budget limits and consumption, filled in by the supervisor
+        self.budget: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def record_node(self, node: str, duration: float, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.nodes.append({"node": node, "loop": self.loop, "duration": duration, "error": error})
+
+    def record_call(self, call: Dict[str, Any]) -> None:
+        with self._lock:
+            self.calls.append({**call, "loop": call.get("loop", self.loop)})
+
+    def start_node(self, node: str) -> int:
+        """Note a node start; each supervisor visit opens a new loop."""
+        with self._lock:
+            if node == SUPERVISOR_NODE:
+                self.loop += 1
+            return self.loop
+
+    def totals(self) -> Dict[str, Any]:
+        """Node visits, tokens and cost so far."""
+        with self._lock:
+            return {
+                "node_visits": len(self.nodes),
+                "prompt_tokens": sum(c.get("prompt_tokens", 0) for c in self.calls),
+                "completion_tokens": sum(c.get("completion_tokens", 0) for c in self.calls),
+                "cost_usd": sum(c.get("cost", 0.0) for c in self.calls),
+            }
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-run totals, per-node and per-dependency breakdowns and the supervisor loops."""
+        def totals(calls, nodes=()):
+            prompt_tokens = sum(c.get("prompt_tokens", 0) for c in calls if c["kind"] == "llm")
+            cached_tokens = sum(c.get("cached_tokens", 0) for c in calls)
+            return {
+                "seconds": round(sum(n["duration"] for n in nodes), 4),
+                "calls": sum(1 for c in calls if not c.get("retries")),
+                "prompt_tokens": sum(c.get("prompt_tokens", 0) for c in calls),
+                "completion_tokens": sum(c.get("completion_tokens", 0) for c in calls),
+                "cached_tokens": cached_tokens,
+                # Share of LLM prompt tokens served from the provider's prompt cache
+                "cache_hit_rate": round(cached_tokens / prompt_tokens, 4) if prompt_tokens else 0.0,
+                "retries": sum(c.get("retries", 0) for c in calls),
+                "errors": sum(1 for c in calls if c.get("error")),
+                "cost_usd": round(sum(c.get("cost", 0.0) for c in calls), 6),
+            }
+
+        with self._lock:
+            nodes, calls = list(self.nodes), list(self.calls)
+
+        by_node = {}
+        for node in sorted({n["node"] for n in nodes}):
+            node_runs = [n for n in nodes if n["node"] == node]
+            by_node[node] = {
+                "visits": len(node_runs),
+                **totals([c for c in calls if c.get("node") == node], node_runs),
+            }
+
+        by_kind = {}
+        for kind in sorted({c["kind"] for c in calls}):
+            kind_calls = [c for c in calls if c["kind"] == kind]
+            by_kind[kind] = {**totals(kind_calls), "seconds": round(sum(c["duration"] for c in kind_calls), 4)}
+
+        loops = []
+        for loop in sorted({n["loop"] for n in nodes}):
+            loop_nodes = [n for n in nodes if n["loop"] == loop]
+            loops.append({
+                "loop": loop,
+                "nodes": [n["node"] for n in loop_nodes],
+                **totals([c for c in calls if c["loop"] == loop], loop_nodes),
+            })
+
+        end = self.finished or time.time()
+        return {
+            "run_id": self.run_id,
+            "labels": self.labels,
+            "wall_seconds": round(end - self.started, 4),
+            "supervisor_loops": self.loop,
+            "totals": totals(calls, nodes),
+            "nodes": by_node,
+            "dependencies": by_kind,
+            "loops": loops,
+            "budget": self.budget,
+        }
+
+
+_current_run: ContextVar[Optional[RunMetrics]] = ContextVar("current_run", default=None)
+_current_node: ContextVar[Optional[str]] = ContextVar("current_node", default=None)
+# Usage of the node being executed, returned with its state update
+_node_usage: ContextVar[Optional[Dict[str, float]]] = ContextVar("node_usage", default=None)
+_export_dir: Optional[str] = METRICS_DIR
+_first_node_at: Optional[float] = None
+
+
+def current_run() -> Optional[RunMetrics]:
+    return _current_run.get()
+
+
+def node_usage() -> Optional[Dict[str, float]]:
+    """Usage of the node being executed so far; it joins ``run_usage`` when the node returns."""
+    return _node_usage.get()
+
+
+def first_node_at() -> Optional[float]:
+    """Wall-clock time the first graph node of this process started, if any has."""
+    return _first_node_at
+
+
+def set_export_dir(directory: Optional[str]) -> None:
+    """Set where per-run JSON summaries and the Prometheus snapshot are written."""
+    global _export_dir
+    _export_dir = directory
+
+
+@contextmanager
+def track_run(run_id: Optional[str] = None, **labels: Any) -> Iterator[RunMetrics]:
+    """Collect the metrics of everything executed inside the block into one RunMetrics."""
+    run = RunMetrics(run_id, labels)
+    token = _current_run.set(run)
+    try:
+        yield run
+    finally:
+        run.finished = time.time()
+        _current_run.reset(token)
+        REGISTRY.observe("run_duration_seconds", run.finished - run.started, help="Wall time of graph runs")
+        if _export_dir:
+            export_run(run, _export_dir)
+
+
+def export_run(run: RunMetrics, directory: str) -> str:
+    """Write the run's JSON summary and the current Prometheus snapshot to ``directory``."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"run-{run.run_id}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(run.summary(), f, indent=2)
+    with open(os.path.join(directory, "metrics.prom"), "w", encoding="utf-8") as f:
+        f.write(REGISTRY.prometheus_text())
+    logger.info(f"Wrote run metrics to {path}")
+    return path
+
+
+def _record_call(kind: str, name: str, duration: float, error: Optional[str] = None, **fields: Any) -> None:
+    model = fields.get("model")
+    prompt_tokens = fields.get("prompt_tokens", 0)
+    completion_tokens = fields.get("completion_tokens", 0)
+    cost = fields.get("cost", 0.0)
+
+    REGISTRY.observe("call_duration_seconds", duration, help="Wall time of external calls", kind=kind, name=name)
+    if error:
+        REGISTRY.inc("call_errors_total", help="Failed external call attempts", kind=kind, name=name)
+    node = _current_node.get() or ""
+    if prompt_tokens:
+        REGISTRY.inc("tokens_total", prompt_tokens, help="Tokens used", kind=kind, model=model, node=node, direction="prompt")
+    if completion_tokens:
+        REGISTRY.inc("tokens_total", completion_tokens, help="Tokens used", kind=kind, model=model, node=node, direction="completion")
+    if fields.get("cached_tokens"):
+        # Divide by tokens_total{direction="prompt"} for the prompt cache hit rate
+        REGISTRY.inc("cached_tokens_total", fields["cached_tokens"], help="Prompt tokens served from the provider's prompt cache", kind=kind, model=model, node=node)
+    if cost:
+        REGISTRY.inc("cost_usd_total", cost, help="Estimated cost in USD", kind=kind, model=model or name)
+
+    usage = _node_usage.get()
+    if usage is not None:
+        usage["tokens"] += prompt_tokens + completion_tokens
+        usage["cost_usd"] += cost
+
+    run = _current_run.get()
+    if run is not None:
+        run.record_call({
+            "kind": kind, "name": name, "node": _current_node.get(),
+            "duration": duration, "error": error, **fields,
+        })
+
+
+def record_retry(kind: str, name: str) -> None:
+    """Count a retry of a failed call, where the retry is made; the failed attempt itself is recorded as an error."""
+    REGISTRY.inc("call_retries_total", help="Retries of failed external calls", kind=kind, name=name)
+    run = _current_run.get()
+    if run is not None:
+        # A marker rather than a call: it adds to the retries but not to the calls or their time
+        run.record_call({"kind": kind, "name": name, "node": _current_node.get(), "duration": 0.0, "error": None, "retries": 1})
+
+
+def _with_usage(result: Any, usage: Dict[str, float]) -> Any:
+    """Add a node's usage to its state update."""
+    from langgraph.types import Command
+
+    if isinstance(result, Command):
+        if result.update is None or isinstance(result.update, dict):
+            return dataclasses.replace(result, update={**(result.update or {}), USAGE_KEY: usage})
+        return result
+    if isinstance(result, dict):
+        return {**result, USAGE_KEY: usage}
+    return result
+
+
+def instrument_node(func: Callable, name: Optional[str] = None) -> Callable:
+    """
+    Wrap a sync or async node so its wall time is recorded; the signature is preserved.
+
+    The node's state update gains its ``run_usage``: one visit, the tokens
+    and cost of the calls it made, and when it started.
+    """
+    node = name or func.__name__
+
+    def finish(run: Optional[RunMetrics], start: float, error: Optional[str]) -> None:
+        duration = time.perf_counter() - start
+        REGISTRY.observe("node_duration_seconds", duration, help="Wall time of graph nodes", node=node)
+        if error:
+            REGISTRY.inc("node_errors_total", help="Graph nodes that raised", node=node)
+        if run is not None:
+            run.record_node(node, duration, error)
+
+    def started() -> Tuple[Optional[RunMetrics], Dict[str, float]]:
+        global _first_node_at
+        now = time.time()
+        if _first_node_at is None:
+            _first_node_at = now
+        run = _current_run.get()
+        if run is not None:
+            run.start_node(node)
+        return run, {"node_visits": 1, "tokens": 0, "cost_usd": 0.0, "started_at": now}
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            run, usage = started()
+            tokens = _current_node.set(node), _node_usage.set(usage)
+            start, error = time.perf_counter(), None
+            try:
+                return _with_usage(await func(*args, **kwargs), usage)
+            except BaseException as e:
+                error = repr(e)
+                raise
+            finally:
+                _current_node.reset(tokens[0])
+                _node_usage.reset(tokens[1])
+                finish(run, start, error)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        run, usage = started()
+        tokens = _current_node.set(node), _node_usage.set(usage)
+        start, error = time.perf_counter(), None
+        try:
+            return _with_usage(func(*args, **kwargs), usage)
+        except BaseException as e:
+            error = repr(e)
+            raise
+        finally:
+            _current_node.reset(tokens[0])
+            _node_usage.reset(tokens[1])
+            finish(run, start, error)
+    return wrapper
+
+
+def instrument_call(
+    func: Callable,
+    kind: str,
+    name: str,
+    measure: Optional[Callable[[tuple, dict, Any], Dict[str, Any]]] = None,
+) -> Callable:
+    """
+    Wrap a dependency call, blocking or async, so its wall time and errors are recorded.
+
+    Args:
+        func: The function to wrap
+        kind: Dependency kind, e.g. "embedding" or "exa"
+        name: Operation name used as a metric label
+        measure: Optional hook returning extra fields (tokens, cost, model)
+            from the call's arguments and result
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                _record_call(kind, name, time.perf_counter() - start, error=repr(e))
+                raise
+            fields = measure(args, kwargs, result) if measure else {}
+            _record_call(kind, name, time.perf_counter() - start, **fields)
+            return result
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            _record_call(kind, name, time.perf_counter() - start, error=repr(e))
+            raise
+        fields = measure(args, kwargs, result) if measure else {}
+        _record_call(kind, name, time.perf_counter() - start, **fields)
+        return result
+    return wrapper
+
+
+def measure_embedding(model: str) -> Callable[[tuple, dict, Any], Dict[str, Any]]:
+    """Estimate embedding tokens (about four characters per token) and cost from the input texts."""
+    def measure(args: tuple, kwargs: dict, result: Any) -> Dict[str, Any]:
+        texts = args[0] if args else kwargs.get("texts", kwargs.get("text", ""))
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        tokens = sum(len(text) for text in texts) // 4
+        return {"model": model, "prompt_tokens": tokens, "cost": estimate_cost(model, tokens)}
+    return measure
+
+
+def measure_exa(args: tuple, kwargs: dict, result: Any) -> Dict[str, Any]:
+    failed = isinstance(result, dict) and "error" in result
+    # Searches answered by the search cache are not billed
+    billed = not failed and not getattr(result, "from_cache", False)
+    return {"error": result["error"] if failed else None, "cost": EXA_COST_PER_SEARCH if billed else 0.0}
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """Record chat model latency, token usage, retries and cost."""
+
+    run_inline = True
+
+    def __init__(self):
+        self._starts: Dict[Any, Tuple[float, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, tags=None, **kwargs) -> None:
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model") or params.get("model_name") or (serialized or {}).get("kwargs", {}).get("model_name")
+        # Attempts after the first of a retrying_model run carry a retry tag
+        if any(tag.startswith("retry:attempt:") for tag in tags or ()):
+            record_retry("llm", model or "unknown")
+        with self._lock:
+            self._starts[run_id] = (time.perf_counter(), model)
+
+    def _finish(self, run_id) -> Tuple[float, Optional[str]]:
+        with self._lock:
+            start, model = self._starts.pop(run_id, (time.perf_counter(), None))
+        return time.perf_counter() - start, model
+
+    def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        duration, model = self._finish(run_id)
+        model = (response.llm_output or {}).get("model_name") or model
+        prompt_tokens = completion_tokens = cached_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+                cached_tokens += (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+        _record_call(
+            "llm", model or "unknown", duration, model=model,
+            prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cached_tokens=cached_tokens,
+            cost=estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens),
+        )
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        # Whether the attempt is retried is counted when the retry starts
+        duration, model = self._finish(run_id)
+        _record_call("llm", model or "unknown", duration, model=model, error=repr(error))
+
+
+METRICS_CALLBACK = MetricsCallbackHandler()
+
+
+class MongoCommandListener:
+    """pymongo command listener recording the wall time of every MongoDB command."""
+
+    def started(self, event) -> None:
+        pass
+
+    def succeeded(self, event) -> None:
+        _record_call("mongo", event.command_name, event.duration_micros / 1_000_000)
+
+    def failed(self, event) -> None:
+        _record_call("mongo", event.command_name, event.duration_micros / 1_000_000, error=str(event.failure))
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """Render a run summary as a plain-text report of where time and money went."""
+    totals = summary["totals"]
+    lines = [
+        f"Run {summary['run_id']}: {summary['wall_seconds']:.2f}s wall, "
+        f"{summary['supervisor_loops']} supervisor loops, "
+        f"{totals['prompt_tokens']}+{totals['completion_tokens']} tokens "
+        f"({totals['cache_hit_rate']:.0%} of prompt tokens cached), ${totals['cost_usd']:.4f}",
+        "",
+        f"{'loop':>4}  {'seconds':>8}  {'tokens':>8}  {'cost $':>8}  nodes",
+    ]
+    for loop in summary["loops"]:
+        tokens = loop["prompt_tokens"] + loop["completion_tokens"]
+        lines.append(
+            f"{loop['loop']:>4}  {loop['seconds']:>8.2f}  {tokens:>8}  {loop['cost_usd']:>8.4f}  "
+            + " > ".join(loop["nodes"])
+        )
+    lines += ["", f"{'node':<16}  {'visits':>6}  {'seconds':>8}  {'tokens':>8}  {'cached':>6}  {'cost $':>8}"]
+    for node, stats in summary["nodes"].items():
+        tokens = stats["prompt_tokens"] + stats["completion_tokens"]
+        lines.append(
+            f"{node:<16}  {stats['visits']:>6}  {stats['seconds']:>8.2f}  {tokens:>8}  "
+            f"{stats['cache_hit_rate']:>6.0%}  {stats['cost_usd']:>8.4f}"
+        )
+    lines += ["", f"{'dependency':<16}  {'calls':>6}  {'seconds':>8}  {'errors':>6}  {'cost $':>8}"]
+    for kind, stats in summary["dependencies"].items():
+        lines.append(f"{kind:<16}  {stats['calls']:>6}  {stats['seconds']:>8.2f}  {stats['errors']:>6}  {stats['cost_usd']:>8.4f}")
+    budget = summary.get("budget")
+    if budget:
+        used = ", ".join(f"{key} {value:g}" for key, value in budget["usage"].items())
+        lines += ["", f"budget used: {used}" + (f" (exhausted: {budget['exhausted']})" if budget["exhausted"] else "")]
+    return "\n".join(lines)
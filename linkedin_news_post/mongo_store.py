@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import numpy as np
 import pymongo
 import uuid
 from datetime import datetime, timedelta, timezone
+from contextvars import copy_context
 from functools import partial
 from typing import Optional, Dict, Any, Tuple, List, Union, Iterable
 
@@ -89,6 +91,7 @@ class MongoDBBaseStore(BaseStore):
         collection_name: str = None,
         ttl_support: bool = False,
         index_config: Optional[Dict[str, Any]] = None,
+        client_options: Optional[Dict[str, Any]] = None,
     ):
         # Import config here to avoid circular imports
         from linkedin_news_post.config import DB_NAME, COLLECTION_NAME
@@ -97,7 +100,7 @@ class MongoDBBaseStore(BaseStore):
         db_name = db_name or DB_NAME
         collection_name = collection_name or COLLECTION_NAME
         
-        self._client = pymongo.MongoClient(mongo_url)
+        self._client = pymongo.MongoClient(mongo_url, **(client_options or {}))
         self._db = self._client[db_name]
         self._collection = self._db[collection_name]
         self._ttl_support = ttl_support
@@ -113,10 +116,13 @@ class MongoDBBaseStore(BaseStore):
         if index_config and "embed" in index_config:
             self.semantic_enabled = True
             self._embedding_fn = index_config["embed"]
+            # Optional batch embedder; falls back to embedding texts one by one
+            self._embed_batch_fn = index_config.get("embed_batch")
             self.index_name = index_config.get("index_name", "langchain_vsearch_index")
         else:
             self.semantic_enabled = False
             self._embedding_fn = None
+            self._embed_batch_fn = None
             self.index_name = None
 
     def _namespace_query(self, namespace: Tuple[str, ...]) -> Dict[str, Any]:
@@ -306,6 +312,55 @@ class MongoDBBaseStore(BaseStore):
                 )
             return results
 
+    def similarity_scores(
+        self,
+        namespace_prefix: Tuple[str, ...],
+        texts: List[str],
+        max_stored: Optional[int] = None,
+    ) -> List[float]:
+        """Score each text against the stored embeddings under a namespace in one pass.
+
+        All texts are embedded in a single batch and compared with the stored
+        vectors through one matrix product. Each score is the best match for
+        that text, normalized like the Atlas cosine ``searchScore`` ((1 + cos) / 2)
+        so the same thresholds apply to both. Texts score 0.0 when the namespace
+        holds no embeddings.
+
+        The scan is capped at the ``max_stored`` most recently created
+        documents (``NOVELTY_MAX_STORED`` by default), so its cost stays bounded
+        as the namespace grows; older articles are not compared. Scores are
+        exact rather than approximate nearest neighbours from the Atlas index,
+        which matters for thresholds a few hundredths apart.
+        """
+        from linkedin_news_post.config import NOVELTY_MAX_STORED
+
+        if not texts:
+            return []
+        if not self.semantic_enabled:
+            raise ValueError("similarity_scores requires an index_config with an 'embed' function")
+
+        max_stored = max_stored or NOVELTY_MAX_STORED
+        q = self._namespace_prefix_query(namespace_prefix)
+        q["embedding"] = {"$exists": True}
+        cursor = self._collection.find(q, projection={"embedding": 1}).sort("created", pymongo.DESCENDING).limit(max_stored)
+        stored = [doc["embedding"] for doc in cursor]
+        if not stored:
+            return [0.0] * len(texts)
+        if len(stored) == max_stored:
+            logging.debug("similarity_scores compared only the %d most recent documents under %s", max_stored, namespace_prefix)
+
+        if self._embed_batch_fn:
+            vectors = self._embed_batch_fn(texts)
+        else:
+            vectors = [self._embedding_fn(text) for text in texts]
+
+        candidates = np.asarray(vectors, dtype=np.float32)
+        corpus = np.asarray(stored, dtype=np.float32)
+        candidates /= np.linalg.norm(candidates, axis=1, keepdims=True) + 1e-12
+        corpus /= np.linalg.norm(corpus, axis=1, keepdims=True) + 1e-12
+        best = (candidates @ corpus.T).max(axis=1)
+        return ((best + 1.0) / 2.0).tolist()
+
     def put(
         self,
         namespace: Tuple[str, ...],
@@ -424,9 +479,11 @@ class MongoDBBaseStore(BaseStore):
             results.append(res)
         return results
 
+    # The async methods run the sync ones in the default executor; copying the
+    # context keeps context variables (e.g. the current run's metrics) visible there.
     async def abatch(self, ops: Iterable[Any]) -> List[Any]:
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial(self.batch, ops))
+        return await loop.run_in_executor(None, partial(copy_context().run, self.batch, ops))
 
     async def aget(
         self,
@@ -437,7 +494,7 @@ class MongoDBBaseStore(BaseStore):
     ) -> Optional[Item]:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, partial(self.get, namespace, key, refresh_ttl=refresh_ttl)
+            None, partial(copy_context().run, self.get, namespace, key, refresh_ttl=refresh_ttl)
         )
 
     async def asearch(
@@ -460,6 +517,7 @@ class MongoDBBaseStore(BaseStore):
         return await loop.run_in_executor(
             None,
             partial(
+                copy_context().run,
                 self.search,
                 namespace_prefix,
                 query=query,
@@ -470,6 +528,17 @@ class MongoDBBaseStore(BaseStore):
             ),
         )
 
+    async def asimilarity_scores(
+        self,
+        namespace_prefix: Tuple[str, ...],
+        texts: List[str],
+        max_stored: Optional[int] = None,
+    ) -> List[float]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(copy_context().run, self.similarity_scores, namespace_prefix, texts, max_stored)
+        )
+
     async def aput(
         self,
         namespace: Tuple[str, ...],
@@ -481,12 +550,12 @@ class MongoDBBaseStore(BaseStore):
     ) -> None:
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(
-            None, partial(self.put, namespace, key, value, index, ttl=ttl)
+            None, partial(copy_context().run, self.put, namespace, key, value, index, ttl=ttl)
         )
 
     async def adelete(self, namespace: Tuple[str, ...], key: str) -> None:
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, partial(self.delete, namespace, key))
+        await loop.run_in_executor(None, partial(copy_context().run, self.delete, namespace, key))
 
     async def alist_namespaces(
         self,
@@ -507,6 +576,7 @@ class MongoDBBaseStore(BaseStore):
         return await loop.run_in_executor(
             None,
             partial(
+                copy_context().run,
                 self.list_namespaces,
                 prefix=prefix,
                 suffix=suffix,
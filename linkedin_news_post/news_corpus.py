@@ -0,0 +1,169 @@
+"""
+Local corpus of every news result the search tools have fetched.
+
+Exa responses used to be thrown away once their text was in the message
+list. The corpus keeps one row per story (by canonical URL) in a SQLite file
+with a full-text index over title and snippet and an index on the publishing
+date, so already-fetched news can be searched locally in milliseconds and
+kept for analytics. A search log records which queries ran over which date
+windows and how many results they returned.
+
+Local searches rank with FTS5's BM25 over any of the query's words and
+filter on the publishing date; their ``score`` is the BM25 relative to the
+best match, in (0, 1] like Exa's relevance scores.
+"""
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from linkedin_news_post.dedup import canonical_url
+
+_WORD = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    source_url TEXT NOT NULL,
+    title TEXT,
+    published_date TEXT,
+    author TEXT,
+    snippet TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    times_seen INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (published_date);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, snippet, content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, snippet) VALUES (new.id, new.title, new.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, snippet ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, snippet) VALUES ('delete', old.id, old.title, old.snippet);
+    INSERT INTO articles_fts (rowid, title, snippet) VALUES (new.id, new.title, new.snippet);
+END;
+CREATE TABLE IF NOT EXISTS searches (
+    id INTEGER PRIMARY KEY,
+    query TEXT NOT NULL,
+    start_published_date TEXT,
+    end_published_date TEXT,
+    searched_at REAL NOT NULL,
+    results INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS searches_at ON searches (searched_at);
+"""
+
+
+def _match_expression(query: str) -> Optional[str]:
+    """FTS5 query matching any of the words of ``query``, each quoted so no word is read as syntax."""
+    words = list(dict.fromkeys(word.lower() for word in _WORD.findall(query)))
+    return " OR ".join(f'"{word}"' for word in words) or None
+
+
+class NewsCorpus:
+    """
+    SQLite corpus of fetched news results.
+
+    Args:
+        path: The SQLite file (":memory:" for a throwaway corpus)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, results: List[Dict[str, Any]], query: str, start_published_date: Optional[str] = None,
+            end_published_date: Optional[str] = None) -> int:
+        """
+        Store normalized search results (see ``research.normalize_results``) and log the search.
+
+        A story seen again keeps its row; its snippet is replaced when the new
+        one is longer. Returns the number of results stored.
+        """
+        now = time.time()
+        rows = [
+            (canonical_url(r["url"]), r["url"], r.get("title"), r.get("published_date"), r.get("author"),
+             r.get("text") or "", now, now)
+            for r in results if r.get("url")
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO articles (url, source_url, title, published_date, author, snippet, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (url) DO UPDATE SET last_seen = excluded.last_seen, times_seen = times_seen + 1, "
+                    "title = COALESCE(excluded.title, title), "
+                    "snippet = CASE WHEN length(excluded.snippet) > length(snippet) THEN excluded.snippet ELSE snippet END",
+                    rows,
+                )
+                self._conn.execute(
+                    "INSERT INTO searches (query, start_published_date, end_published_date, searched_at, results) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (query, start_published_date, end_published_date, now, len(rows)),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def search(self, query: str, start_published_date: Optional[str] = None, end_published_date: Optional[str] = None,
+               limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search the corpus, best matches first, in the shape of ``research.normalize_results``.
+
+        Date bounds compare ISO strings, so "2026-10-01" and
+        "2026-10-01T00:00:00.000Z" both work; results without a publishing
+        date are left out of date-bounded searches.
+        """
+        match = _match_expression(query)
+        if match is None:
+            return []
+        sql = (
+            "SELECT a.source_url, a.title, a.published_date, a.author, a.snippet, bm25(articles_fts) AS rank "
+            "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid WHERE articles_fts MATCH ?"
+        )
+        params: List[Any] = [match]
+        if start_published_date:
+            sql += " AND a.published_date >= ?"
+            params.append(start_published_date[:10])
+        if end_published_date:
+            # Any time on the end date is included
+            sql += " AND a.published_date < ?"
+            params.append((date.fromisoformat(end_published_date[:10]) + timedelta(days=1)).isoformat())
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        # BM25 is negative, lower is better, and its scale depends on the corpus
+        best = rows[0]["rank"] if rows else 0.0
+        return [
+            {
+                "url": row["source_url"],
+                "title": row["title"],
+                "published_date": row["published_date"],
+                "author": row["author"],
+                "text": row["snippet"],
+                "score": round(row["rank"] / best, 4) if best < 0 else 1.0,
+                "queries": [query],
+            }
+            for row in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            articles, oldest, newest = self._conn.execute(
+                "SELECT count(*), min(published_date), max(published_date) FROM articles"
+            ).fetchone()
+            searches = self._conn.execute("SELECT count(*) FROM searches").fetchone()[0]
+        return {"articles": articles, "searches": searches, "oldest_published": oldest, "newest_published": newest}
@@ -1,6 +1,8 @@
 # linkedin_news_post/nodes/__init__.py
-from .writer_node import writer_node
-from .publisher_node import publisher_node
-from .researcher_node import researcher_node
-from .supervisor_node import supervisor_node
-from .quality_node import quality_node
+from .writer_node import writer_node, awriter_node
+from .publisher_node import publisher_node, apublisher_node
+from .researcher_node import researcher_node, aresearcher_node
+from .supervisor_node import supervisor_node, asupervisor_node
+from .quality_node import quality_node, aquality_node
+from .search_node import search_node, asearch_node
+from .ranker_node import ranker_node, aranker_node
@@ -1,34 +1,49 @@
 import os
 import logging
 
-from linkedin_news_post import State
-from linkedin_news_post.config import DEFAULT_MODEL, logger, DOMAIN_FOCUS
-from linkedin_news_post.chains import publisher_chain
+from linkedin_news_post import State, clients
+from linkedin_news_post.config import logger
+from linkedin_news_post.chains import get_chain
+from linkedin_news_post.runtime import RunSettings, get_run_settings
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.constants import END
 from langgraph.types import Command
 from typing import Literal
 from langgraph.store.base import BaseStore
 
 from pydantic import BaseModel, Field
-from langmem import create_memory_store_manager
 
 class Article(BaseModel):
     article: str = Field(description="Very concise description of what the published article is about")
 
-def publisher_node(state: State, store: BaseStore) -> Command[Literal["tool_node"]]:
+def _memory_manager(store: BaseStore, settings: RunSettings):
+    from langmem import create_memory_store_manager
+
+    return create_memory_store_manager(
+        clients.get("memory_model"),
+        namespace=settings.articles_namespace,
+        schemas=[Article],
+        instructions=f"Extract the information from the most recent article written by the writer_node message, which will be the newly published article about {settings.domain_focus}. Add 1 new entry for the article to the collection, including details such as dates and statistics for future reference, while avoiding content redundancy.",
+        store=store,
+        enable_inserts=True
+    )
+
+def _published(result) -> Command:
+    logger.info("Publisher chain result: %s", result)
+    return Command(
+        goto="tool_node",
+        update={
+            "messages": [result]
+        }
+    )
+
+def publisher_node(state: State, config: RunnableConfig, store: BaseStore) -> Command[Literal["tool_node"]]:
+    settings = get_run_settings(config)
+
     # Memory Management
     try:
-        manager = create_memory_store_manager(
-            DEFAULT_MODEL,
-            namespace=("articles",),
-            schemas=[Article],
-            instructions=f"Extract the information from the most recent article written by the writer_node message, which will be the newly published article about {DOMAIN_FOCUS}. Add 1 new entry for the article to the collection, including details such as dates and statistics for future reference, while avoiding content redundancy.",
-            store=store,
-            enable_inserts=True
-        )
-        
-        manager.invoke({"messages": state["messages"]})
+        _memory_manager(store, settings).invoke({"messages": state["messages"]})
         logger.info("Successfully managed memory store for articles")
     except Exception as e:
         logger.error(f"Error in memory management: {str(e)}", exc_info=True)
@@ -36,15 +51,27 @@ def publisher_node(state: State, store: BaseStore) -> Command[Literal["tool_node
 
     logger.info("Invoking publisher_chain with state")
     try:
-        result = publisher_chain.invoke(state)
-        logger.info("Publisher chain result: %s", result)
+        result = get_chain("publisher_chain").invoke(settings.chain_input(state))
     except Exception as e:
         logger.error("Error invoking publisher_chain: %s", str(e), exc_info=True)
         raise
 
-    return Command(
-        goto="tool_node",
-        update={
-            "messages": [result]
-        }
-    )
\ No newline at end of file
+    return _published(result)
+
+async def apublisher_node(state: State, config: RunnableConfig, store: BaseStore) -> Command[Literal["tool_node"]]:
+    """Async variant of :func:`publisher_node`."""
+    settings = get_run_settings(config)
+    try:
+        await _memory_manager(store, settings).ainvoke({"messages": state["messages"]})
+        logger.info("Successfully managed memory store for articles")
+    except Exception as e:
+        logger.error(f"Error in memory management: {str(e)}", exc_info=True)
+
+    logger.info("Invoking publisher_chain with state")
+    try:
+        result = await get_chain("publisher_chain").ainvoke(settings.chain_input(state))
+    except Exception as e:
+        logger.error("Error invoking publisher_chain: %s", str(e), exc_info=True)
+        raise
+
+    return _published(result)
@@ -1,56 +1,143 @@
 import logging
+from collections import Counter
 
 from linkedin_news_post import State
-from linkedin_news_post.config import DEFAULT_SEARCH_LIMIT, logger, DOMAIN_FOCUS
-from linkedin_news_post.chains import quality_chain
+from linkedin_news_post.config import (
+    DEFAULT_SEARCH_LIMIT, logger,
+    QUALITY_AUTO_APPROVE_BELOW, QUALITY_AUTO_REJECT_ABOVE
+)
+from linkedin_news_post.chains import get_chain
+from linkedin_news_post.chains.quality_chain import APPROVED, REJECTED, verdict_message
+from linkedin_news_post.runtime import RunSettings, get_run_settings
 
 from langgraph.types import Command
-from langgraph.store.base import BaseStore
+from langgraph.store.base import BaseStore, SearchItem
 from langchain_core.messages import HumanMessage
-from typing import Literal
+from langchain_core.runnables import RunnableConfig
+from typing import List, Literal, Optional
 
-def quality_node(state: State, store: BaseStore) -> Command[Literal["supervisor_node"]]:
+# Number of quality decisions taken by each tier of the gate
+QUALITY_TIER_COUNTS: Counter = Counter()
+
+def quality_gate(past_articles: List[SearchItem]) -> Optional[str]:
+    """
+    Decide uniqueness from similarity scores alone when they are conclusive.
+
+    Args:
+        past_articles: Results of the semantic search for the draft
+
+    Returns:
+        "approve" or "reject" for a clear-cut decision, None to escalate to the LLM
+    """
+    if not past_articles:
+        return "approve"
+    scores = [item.score for item in past_articles]
+    if any(score is None for score in scores):
+        return None
+    top_score = max(scores)
+    if top_score < QUALITY_AUTO_APPROVE_BELOW:
+        return "approve"
+    if top_score >= QUALITY_AUTO_REJECT_ABOVE:
+        return "reject"
+    return None
+
+def _search_query(state: State) -> str:
+    # The proposed article is the writer's message before the supervisor hand-off
+    logger.info("Performing semantic search for similar past articles")
+    return state["messages"][-2].content
+
+def _gate(past_articles: List[SearchItem]) -> Optional[str]:
+    """Run the score-based gate and record which tier decided."""
+    logger.info(f"Found {len(past_articles)} potentially similar past articles")
+    decision = quality_gate(past_articles)
+    QUALITY_TIER_COUNTS[decision or "llm"] += 1
+    logger.info(
+        "Quality gate tier: %s (counts: approve=%d, reject=%d, llm=%d)",
+        decision or "llm", QUALITY_TIER_COUNTS["approve"],
+        QUALITY_TIER_COUNTS["reject"], QUALITY_TIER_COUNTS["llm"]
+    )
+    return decision
+
+def _gate_feedback(decision: str, past_articles: List[SearchItem]) -> str:
+    if decision == "approve":
+        return f"{APPROVED} the article is distinct from past articles."
+    closest = max(past_articles, key=lambda item: item.score)
+    summary = closest.value.get("content", closest.value)
+    if isinstance(summary, dict):
+        summary = summary.get("article", summary)
+    return (
+        f"{REJECTED} the article reports the same news as a past article ({summary}). "
+        "researcher_node should explore a different topic (e.g. predictive maintenance, "
+        "MRO software innovations, sustainability in aviation maintenance)."
+    )
+
+def _checked(content: str) -> Command:
+    logger.info("Quality check completed")
+    return Command(
+        goto="supervisor_node",
+        update={"messages": [HumanMessage(content=content, name="quality_node")]}
+    )
+
+def _error(e: Exception, settings: RunSettings) -> Command:
+    error_message = f"Error in quality node: {str(e)}"
+    logger.error(error_message, exc_info=True)
+    
+    # Return error message to supervisor
+    return Command(
+        goto="supervisor_node",
+        update={"messages": [HumanMessage(
+            content=f"Error checking article uniqueness: {error_message}. Please try again with a different article about {settings.domain_focus}.",
+            name="quality_node"
+        )]}
+    )
+
+def quality_node(state: State, config: RunnableConfig, store: BaseStore) -> Command[Literal["supervisor_node"]]:
     """
     Quality node that checks if the proposed article is unique compared to past articles.
+
+    Clear-cut cases are decided from the similarity scores of the semantic
+    search; only drafts in the ambiguous band are sent to the quality chain.
     
     Args:
         state: The current state of the workflow
+        config: The runtime config carrying the tenant's run settings
         store: The store containing past articles
         
     Returns:
         Command to go to the supervisor node with the quality check result
     """
+    settings = get_run_settings(config)
     try:
         # Semantic search using proposed article
-        logger.info("Performing semantic search for similar past articles")
-        past_articles = store.search(
-            ("articles",), 
-            query=state["messages"][-2].content, 
-            limit=DEFAULT_SEARCH_LIMIT
-        )
-        logger.info(f"Found {len(past_articles)} potentially similar past articles")
-        
+        past_articles = store.search(settings.articles_namespace, query=_search_query(state), limit=DEFAULT_SEARCH_LIMIT)
+        decision = _gate(past_articles)
+        if decision:
+            return _checked(_gate_feedback(decision, past_articles))
+
         # Invoke quality chain to check uniqueness
         logger.info("Invoking quality chain to check article uniqueness")
-        result = quality_chain.invoke({
+        result = get_chain("quality_chain").invoke({
             "messages": state["messages"],
             "past_articles": past_articles
         })
-        logger.info("Quality check completed")
-        
-        return Command(
-            goto="supervisor_node",
-            update={"messages": [HumanMessage(content=result.content, name="quality_node")]}
-        )
+        return _checked(verdict_message(result.content))
     except Exception as e:
-        error_message = f"Error in quality node: {str(e)}"
-        logger.error(error_message, exc_info=True)
-        
-        # Return error message to supervisor
-        return Command(
-            goto="supervisor_node",
-            update={"messages": [HumanMessage(
-                content=f"Error checking article uniqueness: {error_message}. Please try again with a different article about {DOMAIN_FOCUS}.",
-                name="quality_node"
-            )]}
-        )
\ No newline at end of file
+        return _error(e, settings)
+
+async def aquality_node(state: State, config: RunnableConfig, store: BaseStore) -> Command[Literal["supervisor_node"]]:
+    """Async variant of :func:`quality_node`."""
+    settings = get_run_settings(config)
+    try:
+        past_articles = await store.asearch(settings.articles_namespace, query=_search_query(state), limit=DEFAULT_SEARCH_LIMIT)
+        decision = _gate(past_articles)
+        if decision:
+            return _checked(_gate_feedback(decision, past_articles))
+
+        logger.info("Invoking quality chain to check article uniqueness")
+        result = await get_chain("quality_chain").ainvoke({
+            "messages": state["messages"],
+            "past_articles": past_articles
+        })
+        return _checked(verdict_message(result.content))
+    except Exception as e:
+        return _error(e, settings)
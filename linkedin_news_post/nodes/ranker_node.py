@@ -0,0 +1,83 @@
+import logging
+
+from linkedin_news_post import State
+from linkedin_news_post.config import logger, RESEARCH_POOL_SIZE, NOVELTY_SIMILARITY_THRESHOLD
+from linkedin_news_post.research import dedupe_and_rank, format_candidate
+from linkedin_news_post.novelty import filter_novel, afilter_novel
+from linkedin_news_post.runtime import get_run_settings
+
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.types import Command
+from langgraph.store.base import BaseStore
+from typing import Literal
+
+def _rank(state: State) -> list:
+    results = state.get("research_results") or []
+    ranked = dedupe_and_rank(results, RESEARCH_POOL_SIZE)
+    logger.info(f"Ranked {len(ranked)} unique candidates from {len(results)} search results")
+    return ranked
+
+def _hand_on(ranked: list, duplicates: list) -> Command:
+    """Pass the best candidate on and keep the rest in the research pool."""
+    if not ranked:
+        if duplicates:
+            feedback = (
+                f"All {len(duplicates)} research results cover news already published "
+                f"(e.g. \"{duplicates[0].get('title')}\"). Please research a different topic."
+            )
+        else:
+            feedback = "The research queries returned no usable results. Please try different queries."
+        return Command(
+            goto="supervisor_node",
+            update={
+                "research_pool": [],
+                "messages": [HumanMessage(content=feedback, name="researcher_node")]
+            }
+        )
+
+    top, pool = ranked[0], ranked[1:]
+    return Command(
+        goto="supervisor_node",
+        update={
+            "research_pool": pool,
+            "messages": [HumanMessage(
+                content=f"Top research candidate ({len(pool)} more in the pool):\n\n{format_candidate(top)}",
+                name="researcher_node"
+            )]
+        }
+    )
+
+def ranker_node(state: State, config: RunnableConfig, store: BaseStore) -> Command[Literal["supervisor_node"]]:
+    """
+    Ranker node that merges the results of the research fan-out.
+
+    Duplicate URLs across queries are collapsed and the remaining results are
+    ranked. Candidates too similar to past articles are dropped before any
+    draft is written, then the best one is handed on while the rest stay in
+    the pool.
+
+    Args:
+        state: The current state of the workflow
+        config: The runtime config carrying the tenant's run settings
+        store: The store containing past articles
+
+    Returns:
+        Command to go to the supervisor node with the top research candidate
+    """
+    ranked, duplicates = _rank(state), []
+    try:
+        ranked, duplicates = filter_novel(store, get_run_settings(config).articles_namespace, ranked, NOVELTY_SIMILARITY_THRESHOLD)
+    except Exception as e:
+        # Fall back to the unfiltered ranking; the quality node still checks uniqueness
+        logger.error(f"Error in novelty filter: {str(e)}", exc_info=True)
+    return _hand_on(ranked, duplicates)
+
+async def aranker_node(state: State, config: RunnableConfig, store: BaseStore) -> Command[Literal["supervisor_node"]]:
+    """Async variant of :func:`ranker_node`."""
+    ranked, duplicates = _rank(state), []
+    try:
+        ranked, duplicates = await afilter_novel(store, get_run_settings(config).articles_namespace, ranked, NOVELTY_SIMILARITY_THRESHOLD)
+    except Exception as e:
+        logger.error(f"Error in novelty filter: {str(e)}", exc_info=True)
+    return _hand_on(ranked, duplicates)
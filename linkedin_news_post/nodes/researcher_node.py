@@ -1,58 +1,123 @@
 import logging
 
 from linkedin_news_post import State
-from linkedin_news_post.config import logger, DOMAIN_FOCUS
-from linkedin_news_post.chains import researcher_chain
+from linkedin_news_post.config import logger, RESEARCH_QUERY_COUNT
+from linkedin_news_post.chains import get_chain
+from linkedin_news_post.runtime import RunSettings, get_run_settings
+from linkedin_news_post.research import format_candidate
 
 from langchain_core.messages import HumanMessage
-from langgraph.types import Command
-from typing import Literal
+from langchain_core.runnables import RunnableConfig
+from langgraph.types import Command, Send
+from typing import Literal, Optional
 
 # Define the research prompt template
-RESEARCH_PROMPT_TEMPLATE = "Tell me news about {domain} picking a topic of your choice"
+RESEARCH_PROMPT_TEMPLATE = "Tell me news about {domain} picking {count} distinct topics of your choice"
 
-def researcher_node(state: State) -> Command[Literal["tool_node"]]:
+def _from_pool(state: State) -> Optional[Command]:
+    """Hand on the next pooled candidate, if earlier research left any."""
+    pool = state.get("research_pool") or []
+    if not pool:
+        return None
+    candidate, remaining = pool[0], pool[1:]
+    logger.info(f"Using pooled research candidate, {len(remaining)} left in the pool")
+    return Command(
+        goto="supervisor_node",
+        update={
+            "research_pool": remaining,
+            "messages": [HumanMessage(
+                content=f"Next research candidate from earlier searches ({len(remaining)} more in the pool):\n\n{format_candidate(candidate)}",
+                name="researcher_node"
+            )]
+        }
+    )
+
+def _research_input(state: State, settings: RunSettings) -> dict:
+    # Create the research prompt using the domain focus
+    research_prompt = RESEARCH_PROMPT_TEMPLATE.format(domain=settings.domain_focus, count=RESEARCH_QUERY_COUNT)
+    logger.info(f"Researching news for tenant {settings.tenant_id}")
+    
+    # Add the research prompt to the messages, and the run's search window to the prompt variables
+    window = settings.search_window
+    return settings.chain_input({
+        "messages": state["messages"] + [HumanMessage(content=research_prompt)],
+        "search_start": window.start_date,
+        "search_end": window.end_date,
+    })
+
+def _fan_out(result) -> Command:
+    logger.info(f"Research produced {len(result.tool_calls)} queries")
+
+    if not result.tool_calls:
+        return Command(
+            goto="supervisor_node",
+            update={"messages": [HumanMessage(
+                content=f"The researcher did not propose any search queries: {result.content}",
+                name="researcher_node"
+            )]}
+        )
+
+    # Fan out one search per query; results from the previous fan-out are cleared
+    return Command(
+        goto=[Send("search_node", {"tool_call": tool_call}) for tool_call in result.tool_calls],
+        update={
+            "messages": [result],
+            "research_results": None
+        }
+    )
+
+def _error(e: Exception, settings: RunSettings) -> Command:
+    error_message = f"Error in researcher node: {str(e)}"
+    logger.error(error_message, exc_info=True)
+    
+    # Return error message
+    return Command(
+        goto="supervisor_node",
+        update={
+            "messages": [HumanMessage(
+                content=f"Error researching {settings.domain_focus} news: {error_message}. Please try again.",
+                name="researcher_node"
+            )]
+        }
+    )
+
+def researcher_node(state: State, config: RunnableConfig) -> Command[Literal["search_node", "supervisor_node"]]:
     """
     Researcher node that finds interesting news in the specified domain.
-    
+
+    When earlier research left candidates in the pool, the next one is handed
+    on without searching again. Otherwise the researcher chain proposes several
+    queries at once and they are fanned out to parallel search nodes.
+
     Args:
         state: The current state of the workflow
+        config: The runtime config carrying the tenant's run settings
         
     Returns:
-        Command to go to the tool node with the research result
+        Command to fan out to the search nodes, or to go to the supervisor
+        node with the next pooled candidate
     """
+    pooled = _from_pool(state)
+    if pooled:
+        return pooled
+
+    settings = get_run_settings(config)
     try:
-        # Create the research prompt using the domain focus
-        research_prompt = RESEARCH_PROMPT_TEMPLATE.format(domain=DOMAIN_FOCUS)
-        logger.info(f"Researching news about {DOMAIN_FOCUS}")
-        
-        # Add the research prompt to the messages
-        new_messages = state["messages"] + [HumanMessage(content=research_prompt)]
-        
         # Invoke the researcher chain
         logger.info("Invoking researcher chain")
-        result = researcher_chain.invoke({
-            "messages": new_messages
-        })
-        logger.info("Research completed successfully")
-        
-        return Command(
-            goto="tool_node",
-            update={
-                "messages": [result]
-            }
-        )
+        return _fan_out(get_chain("researcher_chain").invoke(_research_input(state, settings)))
     except Exception as e:
-        error_message = f"Error in researcher node: {str(e)}"
-        logger.error(error_message, exc_info=True)
-        
-        # Return error message
-        return Command(
-            goto="tool_node",
-            update={
-                "messages": [HumanMessage(
-                    content=f"Error researching {DOMAIN_FOCUS} news: {error_message}. Please try again.",
-                    name="researcher_node"
-                )]
-            }
-        )
+        return _error(e, settings)
+
+async def aresearcher_node(state: State, config: RunnableConfig) -> Command[Literal["search_node", "supervisor_node"]]:
+    """Async variant of :func:`researcher_node`."""
+    pooled = _from_pool(state)
+    if pooled:
+        return pooled
+
+    settings = get_run_settings(config)
+    try:
+        logger.info("Invoking researcher chain")
+        return _fan_out(await get_chain("researcher_chain").ainvoke(_research_input(state, settings)))
+    except Exception as e:
+        return _error(e, settings)
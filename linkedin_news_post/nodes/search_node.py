@@ -0,0 +1,76 @@
+import logging
+
+from linkedin_news_post import SearchTask
+from linkedin_news_post.config import logger
+from linkedin_news_post.clients import get_asearch, get_search
+from linkedin_news_post.research import normalize_results
+from linkedin_news_post.runtime import get_run_settings
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+def _search_args(task: SearchTask, config: RunnableConfig) -> tuple:
+    tool_call = task["tool_call"]
+    args = tool_call.get("args", {})
+    query = args.get("query", "")
+    # The model's dates are kept only where they fall inside the run's window
+    start, end = get_run_settings(config).search_window.clamp(
+        args.get("start_published_date"), args.get("end_published_date")
+    )
+    logger.info(f"Running research query: {query} ({start} to {end})")
+    return (
+        (query,),
+        {"start_published_date": start, "end_published_date": end},
+    )
+
+def _searched(task: SearchTask, response=None, error: Exception = None) -> dict:
+    """Build the state update for one finished search."""
+    tool_call = task["tool_call"]
+    query = tool_call.get("args", {}).get("query", "")
+    try:
+        if error is not None:
+            raise error
+        if isinstance(response, dict) and "error" in response:
+            raise RuntimeError(response["error"])
+
+        results = normalize_results(response, query)
+        logger.info(f"Query '{query}' returned {len(results)} results")
+        content = f"Retrieved {len(results)} results for '{query}'."
+    except Exception as e:
+        error_message = f"Error in search node: {str(e)}"
+        logger.error(error_message, exc_info=True)
+        results = []
+        content = f"Search for '{query}' failed: {error_message}"
+
+    return {
+        "messages": [ToolMessage(content=content, tool_call_id=tool_call["id"], name=tool_call.get("name"))],
+        "research_results": results,
+    }
+
+def search_node(task: SearchTask, config: RunnableConfig) -> dict:
+    """
+    Search node that runs a single query from the researcher's fan-out.
+
+    Several instances run concurrently, one per tool call emitted by the
+    researcher, and their results are merged by the ranker node.
+
+    Args:
+        task: The tool call to execute
+        config: The runtime config carrying the run's search window
+
+    Returns:
+        State update with the tool response and the normalized results
+    """
+    try:
+        args, kwargs = _search_args(task, config)
+        return _searched(task, get_search()(*args, **kwargs))
+    except Exception as e:
+        return _searched(task, error=e)
+
+async def asearch_node(task: SearchTask, config: RunnableConfig) -> dict:
+    """Async variant of :func:`search_node` on the pooled async Exa client and the async search cache."""
+    try:
+        args, kwargs = _search_args(task, config)
+        return _searched(task, await get_asearch()(*args, **kwargs))
+    except Exception as e:
+        return _searched(task, error=e)
@@ -1,20 +1,113 @@
 import logging
 
 from linkedin_news_post import State
-from linkedin_news_post.config import logger, DOMAIN_FOCUS
-from linkedin_news_post.chains import supervisor_chain
+from linkedin_news_post.config import logger
+from linkedin_news_post.chains import get_chain
+from linkedin_news_post.runtime import RunSettings, get_run_settings
+from linkedin_news_post.budget import (
+    approved_draft, exhausted, format_usage, get_run_budget, measure_usage, record_budget
+)
+from linkedin_news_post.metrics import current_run
 
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.constants import END
 from langgraph.types import Command
-from typing import Literal
+from typing import Literal, Optional
 
-def supervisor_node(state: State) -> Command[Literal["publisher_node", "researcher_node", "writer_node", "quality_node", "__end__"]]:
+def _route(result, settings: RunSettings) -> Command:
+    """Turn the supervisor chain's decision into a Command for the next node."""
+    logger.info(f"Supervisor decided next node: {result.next_node}")
+
+    # Route to appropriate node based on supervisor decision
+    if result.next_node == "researcher_node":
+        return Command(
+            goto="researcher_node",
+            update={"messages": [HumanMessage(content=f"Passing to researcher to find news about {settings.domain_focus}...", name="supervisor_node")]}
+        )
+    
+    elif result.next_node == "writer_node":
+        return Command(
+            goto="writer_node",
+            update={"messages": [HumanMessage(content="Passing to writer to create LinkedIn post...", name="supervisor_node")]}
+        )
+    
+    elif result.next_node == "quality_node":
+        return Command(
+            goto="quality_node",
+            update={"messages": [HumanMessage(content="Passing to quality checker to verify uniqueness...", name="supervisor_node")]}
+        )
+    
+    elif result.next_node == "publisher_node":
+        return Command(
+            goto="publisher_node",
+            update={"messages": [HumanMessage(content="Passing to publisher to publish post...", name="supervisor_node")]}
+        )
+    
+    elif result.next_node == "end_node":
+        return Command(
+            goto={END},
+            update={"messages": [HumanMessage(content="Finishing the process...", name="supervisor_node")]}
+        )
+    
+    else:
+        # Handle unexpected node
+        logger.error(f"Unexpected next_node value: {result.next_node}")
+        return Command(
+            goto={END},
+            update={"messages": [HumanMessage(content=f"Error: Unexpected next node '{result.next_node}'", name="supervisor_node")]}
+        )
+
+def _check_budget(state: State, config: RunnableConfig) -> Optional[Command]:
+    """
+    Record the run's budget consumption and stop the loop once a limit is reached.
+
+    An exhausted run publishes the draft approved by the last quality check,
+    if it has not been published yet, and otherwise ends with a report.
+    """
+    budget = get_run_budget(config)
+    run = current_run()
+    usage = measure_usage(state["messages"], state.get("run_usage"))
+    reason = exhausted(budget, usage)
+    record_budget(run, budget, usage, reason)
+    if not reason:
+        return None
+
+    report = f"Run budget exhausted ({reason}). Usage: {format_usage(budget, usage)}."
+    approved = approved_draft(state["messages"])
+    if approved and not approved["published"]:
+        logger.warning(f"{report} Publishing the approved draft.")
+        return Command(
+            goto="publisher_node",
+            update={"messages": [HumanMessage(content=f"{report} Publish the approved draft:\n\n{approved['draft']}", name="supervisor_node")]}
+        )
+
+    logger.warning(f"{report} Stopping the run.")
+    return Command(
+        goto={END},
+        update={"messages": [HumanMessage(content=f"{report} Stopping without publishing further.", name="supervisor_node")]}
+    )
+
+def _error(e: Exception) -> Command:
+    error_message = f"Error in supervisor node: {str(e)}"
+    logger.error(error_message, exc_info=True)
+    
+    # Return error and end workflow
+    return Command(
+        goto={END},
+        update={"messages": [HumanMessage(content=f"Error in workflow: {error_message}", name="supervisor_node")]}
+    )
+
+def supervisor_node(state: State, config: RunnableConfig) -> Command[Literal["publisher_node", "researcher_node", "writer_node", "quality_node", "__end__"]]:
     """
     Supervisor node that coordinates the workflow and decides what to do next.
+
+    Once the run's budget is exhausted it publishes the approved draft, if
+    any, or ends the run with a report instead of looping further.
     
     Args:
         state: The current state of the workflow
+        config: The runtime config carrying the tenant's run settings
         
     Returns:
         Command to go to the next node in the workflow
@@ -23,56 +116,28 @@ def supervisor_node(state: State) -> Command[Literal["publisher_node", "research
         # Log current state for debugging
         logger.debug(f"Current state messages count: {len(state['messages'])}")
         
+        # Enforce the run's budget before spending more on the loop
+        stop = _check_budget(state, config)
+        if stop:
+            return stop
+
         # Invoke supervisor chain to decide next step
         logger.info("Invoking supervisor chain to determine next step")
-        result = supervisor_chain.invoke(state)
-        logger.info(f"Supervisor decided next node: {result.next_node}")
-        
-        # Route to appropriate node based on supervisor decision
-        if result.next_node == "researcher_node":
-            return Command(
-                goto="researcher_node",
-                update={"messages": [HumanMessage(content=f"Passing to researcher to find news about {DOMAIN_FOCUS}...", name="supervisor_node")]}
-            )
-        
-        elif result.next_node == "writer_node":
-            return Command(
-                goto="writer_node",
-                update={"messages": [HumanMessage(content="Passing to writer to create LinkedIn post...", name="supervisor_node")]}
-            )
-        
-        elif result.next_node == "quality_node":
-            return Command(
-                goto="quality_node",
-                update={"messages": [HumanMessage(content="Passing to quality checker to verify uniqueness...", name="supervisor_node")]}
-            )
-        
-        elif result.next_node == "publisher_node":
-            return Command(
-                goto="publisher_node",
-                update={"messages": [HumanMessage(content="Passing to publisher to publish post...", name="supervisor_node")]}
-            )
-        
-        elif result.next_node == "end_node":
-            return Command(
-                goto={END},
-                update={"messages": [HumanMessage(content="Finishing the process...", name="supervisor_node")]}
-            )
-        
-        else:
-            # Handle unexpected node
-            logger.error(f"Unexpected next_node value: {result.next_node}")
-            return Command(
-                goto={END},
-                update={"messages": [HumanMessage(content=f"Error: Unexpected next node '{result.next_node}'", name="supervisor_node")]}
-            )
-            
+        settings = get_run_settings(config)
+        return _route(get_chain("supervisor_chain").invoke(settings.chain_input(state)), settings)
     except Exception as e:
-        error_message = f"Error in supervisor node: {str(e)}"
-        logger.error(error_message, exc_info=True)
-        
-        # Return error and end workflow
-        return Command(
-            goto={END},
-            update={"messages": [HumanMessage(content=f"Error in workflow: {error_message}", name="supervisor_node")]}
-        )
+        return _error(e)
+
+async def asupervisor_node(state: State, config: RunnableConfig) -> Command[Literal["publisher_node", "researcher_node", "writer_node", "quality_node", "__end__"]]:
+    """Async variant of :func:`supervisor_node`."""
+    try:
+        logger.debug(f"Current state messages count: {len(state['messages'])}")
+        stop = _check_budget(state, config)
+        if stop:
+            return stop
+
+        logger.info("Invoking supervisor chain to determine next step")
+        settings = get_run_settings(config)
+        return _route(await get_chain("supervisor_chain").ainvoke(settings.chain_input(state)), settings)
+    except Exception as e:
+        return _error(e)
@@ -1,46 +1,63 @@
 import logging
 
 from linkedin_news_post import State
-from linkedin_news_post.config import logger, DOMAIN_FOCUS
-from linkedin_news_post.chains import writer_chain
+from linkedin_news_post.config import logger
+from linkedin_news_post.chains import get_chain
+from linkedin_news_post.runtime import get_run_settings
 
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
 from typing import Literal
 
-def writer_node(state: State) -> Command[Literal["supervisor_node"]]:
+def _written(result) -> Command:
+    logger.info("Successfully created LinkedIn post")
+    return Command(
+        goto="supervisor_node",
+        update={
+            "messages": [HumanMessage(content=result.content, name="writer_node")]
+        }
+    )
+
+def _error(e: Exception) -> Command:
+    error_message = f"Error in writer node: {str(e)}"
+    logger.error(error_message, exc_info=True)
+    
+    # Return error message to supervisor
+    return Command(
+        goto="supervisor_node",
+        update={
+            "messages": [HumanMessage(
+                content=f"Error creating LinkedIn post: {error_message}. Please try again.",
+                name="writer_node"
+            )]
+        }
+    )
+
+def writer_node(state: State, config: RunnableConfig) -> Command[Literal["supervisor_node"]]:
     """
     Writer node that creates a LinkedIn post based on the research.
     
     Args:
         state: The current state of the workflow
+        config: The runtime config carrying the tenant's run settings
         
     Returns:
         Command to go to the supervisor node with the written post
     """
     try:
         # Invoke writer chain to create LinkedIn post
-        logger.info(f"Creating LinkedIn post about {DOMAIN_FOCUS}")
-        result = writer_chain.invoke(state)
-        logger.info("Successfully created LinkedIn post")
-        
-        return Command(
-            goto="supervisor_node",
-            update={
-                "messages": [HumanMessage(content=result.content, name="writer_node")]
-            }
-        )
+        settings = get_run_settings(config)
+        logger.info(f"Creating LinkedIn post for tenant {settings.tenant_id}")
+        return _written(get_chain("writer_chain").invoke(settings.chain_input(state)))
     except Exception as e:
-        error_message = f"Error in writer node: {str(e)}"
-        logger.error(error_message, exc_info=True)
-        
-        # Return error message to supervisor
-        return Command(
-            goto="supervisor_node",
-            update={
-                "messages": [HumanMessage(
-                    content=f"Error creating LinkedIn post: {error_message}. Please try again.",
-                    name="writer_node"
-                )]
-            }
-        )
+        return _error(e)
+
+async def awriter_node(state: State, config: RunnableConfig) -> Command[Literal["supervisor_node"]]:
+    """Async variant of :func:`writer_node`."""
+    try:
+        settings = get_run_settings(config)
+        logger.info(f"Creating LinkedIn post for tenant {settings.tenant_id}")
+        return _written(await get_chain("writer_chain").ainvoke(settings.chain_input(state)))
+    except Exception as e:
+        return _error(e)
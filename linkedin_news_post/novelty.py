@@ -0,0 +1,91 @@
+"""
+Novelty pre-screen that drops research candidates too similar to past
+articles before the writer spends an LLM call drafting from them.
+"""
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+from langgraph.store.base import BaseStore
+
+from linkedin_news_post.config import logger
+
+
+def candidate_text(candidate: Dict[str, Any]) -> str:
+    """Text used to compare a research candidate with past articles."""
+    return f"{candidate.get('title') or ''} {candidate.get('text') or ''}".strip()
+
+
+def score_candidates(store: BaseStore, namespace: Tuple[str, ...], candidates: List[Dict[str, Any]]) -> List[float]:
+    """
+    Score candidates against the articles stored under ``namespace``.
+
+    Stores that implement ``similarity_scores`` (such as ``MongoDBBaseStore``)
+    embed and compare all candidates in one batch. Other stores fall back to
+    one semantic search per candidate.
+    """
+    texts = [candidate_text(c) for c in candidates]
+    if hasattr(store, "similarity_scores"):
+        return store.similarity_scores(namespace, texts)
+
+    scores = []
+    for text in texts:
+        hits = store.search(namespace, query=text, limit=1)
+        scores.append(max((hit.score or 0.0 for hit in hits), default=0.0))
+    return scores
+
+
+async def ascore_candidates(store: BaseStore, namespace: Tuple[str, ...], candidates: List[Dict[str, Any]]) -> List[float]:
+    """Async variant of :func:`score_candidates`; fallback searches run concurrently."""
+    texts = [candidate_text(c) for c in candidates]
+    if hasattr(store, "asimilarity_scores"):
+        return await store.asimilarity_scores(namespace, texts)
+
+    hits = await asyncio.gather(*(store.asearch(namespace, query=text, limit=1) for text in texts))
+    return [max((hit.score or 0.0 for hit in found), default=0.0) for found in hits]
+
+
+def split_by_similarity(
+    candidates: List[Dict[str, Any]],
+    scores: List[float],
+    threshold: float,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Split candidates into novel ones and near-duplicates of past articles.
+
+    Each candidate is annotated with its ``similarity`` score. Ranking order
+    is preserved within both lists.
+    """
+    novel, duplicates = [], []
+    for candidate, score in zip(candidates, scores):
+        scored = {**candidate, "similarity": round(float(score), 4)}
+        (duplicates if score >= threshold else novel).append(scored)
+
+    logger.info(
+        f"Novelty filter kept {len(novel)} of {len(candidates)} candidates "
+        f"(threshold {threshold})"
+    )
+    return novel, duplicates
+
+
+def filter_novel(
+    store: BaseStore,
+    namespace: Tuple[str, ...],
+    candidates: List[Dict[str, Any]],
+    threshold: float,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Score candidates against past articles and split off the near-duplicates."""
+    if not candidates:
+        return [], []
+    return split_by_similarity(candidates, score_candidates(store, namespace, candidates), threshold)
+
+
+async def afilter_novel(
+    store: BaseStore,
+    namespace: Tuple[str, ...],
+    candidates: List[Dict[str, Any]],
+    threshold: float,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Async variant of :func:`filter_novel`."""
+    if not candidates:
+        return [], []
+    return split_by_similarity(candidates, await ascore_candidates(store, namespace, candidates), threshold)
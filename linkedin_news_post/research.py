@@ -0,0 +1,70 @@
+"""
+Helpers for turning the results of a research fan-out into a ranked
+candidate pool that the writer can draw from across supervisor loops.
+"""
+from typing import Any, Dict, List
+
+from linkedin_news_post.dedup import canonical_url, collapse_near_duplicates
+
+
+def normalize_results(response: Any, query: str) -> List[Dict[str, Any]]:
+    """Convert an Exa search response into plain dictionaries tagged with the query."""
+    results = []
+    for result in getattr(response, "results", None) or []:
+        results.append({
+            "url": result.url,
+            "title": result.title,
+            "published_date": result.published_date,
+            "author": result.author,
+            "text": result.text or "",
+            "score": result.score,
+            "queries": [query],
+        })
+    return results
+
+
+def dedupe_and_rank(results: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """
+    Merge results that report the same story and rank them.
+
+    Results are merged by canonical URL, then near-duplicates (the same story
+    syndicated by several outlets) are collapsed into one representative
+    with a ``sources`` count. Results found by several queries rank first,
+    then those reported by more sources, then by Exa relevance score, then
+    by the most recent publishing date.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        key = canonical_url(result.get("url") or "")
+        if not key:
+            continue
+        if key not in merged:
+            merged[key] = {**result, "queries": list(result.get("queries", []))}
+            continue
+        existing = merged[key]
+        for query in result.get("queries", []):
+            if query not in existing["queries"]:
+                existing["queries"].append(query)
+        if (result.get("score") or 0) > (existing.get("score") or 0):
+            existing["score"] = result["score"]
+        if len(result.get("text") or "") > len(existing.get("text") or ""):
+            existing["text"] = result["text"]
+
+    ranked = sorted(
+        collapse_near_duplicates(list(merged.values())),
+        key=lambda r: (len(r["queries"]), r.get("sources", 1), r.get("score") or 0, r.get("published_date") or ""),
+        reverse=True,
+    )
+    return ranked[:limit]
+
+
+def format_candidate(candidate: Dict[str, Any]) -> str:
+    """Render a research candidate as the article text handed to the writer."""
+    return (
+        f"Title: {candidate.get('title') or 'Untitled'}\n"
+        f"URL: {candidate.get('url')}\n"
+        f"Published: {candidate.get('published_date') or 'Unknown'}\n"
+        f"Author: {candidate.get('author') or 'Unknown'}\n"
+        f"Sources: {candidate.get('sources', 1)}\n\n"
+        f"{candidate.get('text') or ''}"
+    )
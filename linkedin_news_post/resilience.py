@@ -0,0 +1,349 @@
+"""
+Timeouts, retries, hedging and circuit breakers for external calls.
+
+Each dependency ("llm", "embedding", "exa", "mongo", "composio") has a
+``CallPolicy`` in ``config.RESILIENCE_POLICIES``. ``resilient`` applies a
+policy to a blocking call:
+
+    * every attempt is bounded by the policy's timeout; a hung call is
+      abandoned in its worker thread instead of stalling the run
+    * failed attempts are retried with exponential backoff and full jitter
+    * idempotent reads are hedged: if an attempt has not returned after
+      ``hedge_after`` seconds, a second identical request is started and the
+      first response wins
+    * a circuit breaker per dependency fails calls fast once
+      ``breaker_threshold`` consecutive calls have failed, and lets a single
+      trial call through after ``breaker_reset_seconds``
+
+Coroutine functions get the same policy on the event loop: attempts and
+hedged requests are tasks, bounded with ``asyncio.wait``, and a timed-out or
+losing attempt is cancelled rather than left running in a thread.
+
+Chat models time out in the OpenAI SDK but do not retry there: ``retrying_model``
+retries transient API errors as separate model runs, ``retries`` of the "llm"
+policy times, so every failed attempt and every retry reaches the callbacks.
+Each model gets a breaker through ``CircuitBreakerCallback``; an open breaker
+raises before the request is sent, which moves the call on to the model's
+fallbacks. MongoDB takes its timeout and retryable reads and writes from the
+driver.
+"""
+import asyncio
+import functools
+import inspect
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable
+
+from linkedin_news_post.config import RESILIENCE_MAX_WORKERS, RESILIENCE_POLICIES, logger
+from linkedin_news_post.metrics import REGISTRY, record_retry
+
+
+@dataclass(frozen=True)
+class CallPolicy:
+    # Seconds before an attempt is abandoned (None: no limit)
+    timeout: Optional[float] = None
+    # Attempts after the first one
+    retries: int = 0
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    # Seconds before a hedged second request is started (None: no hedging)
+    hedge_after: Optional[float] = None
+    # Consecutive failures that open the breaker (0: no breaker)
+    breaker_threshold: int = 0
+    breaker_reset_seconds: float = 30.0
+
+
+def get_policy(dependency: str) -> CallPolicy:
+    return CallPolicy(**RESILIENCE_POLICIES.get(dependency, {}))
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open trial call."""
+
+    def __init__(self, name: str, threshold: int, reset_seconds: float):
+        self.name = name
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self._opened_at >= self.reset_seconds else "open"
+
+    def allow(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may go through."""
+        if not self.threshold:
+            return
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half_open" and not self._trial:
+                # One trial call decides whether the breaker closes again
+                self._trial = True
+                return
+        REGISTRY.inc("circuit_rejections_total", help="Calls rejected by an open circuit breaker", dependency=self.name)
+        raise CircuitOpenError(f"Circuit breaker for {self.name} is open after {self._failures} consecutive failures")
+
+    def success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit breaker for {self.name} closed")
+            self._failures, self._opened_at, self._trial = 0, None, False
+
+    def failure(self) -> None:
+        if not self.threshold:
+            return
+        with self._lock:
+            self._failures += 1
+            reopen = self._trial
+            self._trial = False
+            if self._failures >= self.threshold and (self._opened_at is None or reopen):
+                self._opened_at = time.monotonic()
+                logger.warning(f"Circuit breaker for {self.name} opened after {self._failures} consecutive failures")
+                REGISTRY.inc("circuit_opened_total", help="Circuit breaker trips", dependency=self.name)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=RESILIENCE_MAX_WORKERS, thread_name_prefix="resilient")
+
+
+def get_breaker(name: str, policy: Optional[CallPolicy] = None) -> CircuitBreaker:
+    """Return the process-wide breaker for a dependency (or a model, for chat models)."""
+    with _breakers_lock:
+        if name not in _breakers:
+            policy = policy or get_policy(name)
+            _breakers[name] = CircuitBreaker(name, policy.breaker_threshold, policy.breaker_reset_seconds)
+        return _breakers[name]
+
+
+def backoff(policy: CallPolicy, attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt`` (from 1)."""
+    return random.uniform(0, min(policy.backoff_max, policy.backoff_base * 2 ** (attempt - 1)))
+
+
+def _attempt(func: Callable, args: tuple, kwargs: dict, policy: CallPolicy, dependency: str, hedge: bool) -> Any:
+    """Run one attempt in a worker thread, bounded by the timeout and hedged if allowed."""
+    # Worker threads do not inherit context variables such as the current run's metrics
+    submit = lambda: _executor.submit(copy_context().run, func, *args, **kwargs)
+    futures = [submit()]
+    deadline = time.monotonic() + policy.timeout if policy.timeout else None
+    if hedge and policy.hedge_after is not None:
+        done, _ = wait(futures, timeout=policy.hedge_after)
+        if not done:
+            REGISTRY.inc("resilience_events_total", help="Retries, timeouts and hedged requests", dependency=dependency, event="hedge")
+            futures.append(submit())
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    pending = set(futures)
+    error = None
+    while pending:
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            if future.exception() is None:
+                if len(futures) > 1 and future is futures[1]:
+                    REGISTRY.inc("resilience_events_total", dependency=dependency, event="hedge_won")
+                return future.result()
+            error = future.exception()
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    if pending:
+        REGISTRY.inc("resilience_events_total", dependency=dependency, event="timeout")
+        raise FutureTimeoutError(f"{dependency} call timed out after {policy.timeout:g}s")
+    raise error
+
+
+async def _aattempt(func: Callable, args: tuple, kwargs: dict, policy: CallPolicy, dependency: str, hedge: bool) -> Any:
+    """Async :func:`_attempt`: the attempt and its hedge are tasks, cancelled once one of them finishes."""
+    loop = asyncio.get_running_loop()
+    tasks = [asyncio.ensure_future(func(*args, **kwargs))]
+    deadline = loop.time() + policy.timeout if policy.timeout else None
+    try:
+        if hedge and policy.hedge_after is not None:
+            done, _ = await asyncio.wait(tasks, timeout=policy.hedge_after)
+            if not done:
+                REGISTRY.inc("resilience_events_total", help="Retries, timeouts and hedged requests", dependency=dependency, event="hedge")
+                tasks.append(asyncio.ensure_future(func(*args, **kwargs)))
+        pending = set(tasks)
+        error = None
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                if task.exception() is None:
+                    if len(tasks) > 1 and task is tasks[1]:
+                        REGISTRY.inc("resilience_events_total", dependency=dependency, event="hedge_won")
+                    return task.result()
+                error = task.exception()
+        if pending:
+            REGISTRY.inc("resilience_events_total", dependency=dependency, event="timeout")
+            raise FutureTimeoutError(f"{dependency} call timed out after {policy.timeout:g}s")
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def resilient(
+    func: Callable,
+    dependency: str,
+    idempotent: bool = False,
+    failed: Optional[Callable[[Any], bool]] = None,
+    policy: Optional[CallPolicy] = None,
+) -> Callable:
+    """
+    Wrap a blocking or async call with the dependency's timeout, retry, hedging and breaker policy.
+
+    Args:
+        func: The call to protect
+        dependency: Policy and breaker name, e.g. "exa"
+        idempotent: Whether the call may be hedged and retried; calls with
+            side effects get the timeout and breaker only
+        failed: Optional check for failures reported in the return value
+            instead of raised; the last such value is returned after the
+            final attempt
+        policy: Overrides the policy from ``config.RESILIENCE_POLICIES``
+    """
+    policy = policy or get_policy(dependency)
+    breaker = get_breaker(dependency, policy)
+    retries = policy.retries if idempotent else 0
+    name = getattr(func, "__name__", dependency)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            for attempt in range(retries + 1):
+                breaker.allow()
+                try:
+                    result = await _aattempt(func, args, kwargs, policy, dependency, hedge=idempotent)
+                except Exception as e:
+                    breaker.failure()
+                    if attempt == retries:
+                        raise
+                    logger.warning(f"{dependency} call failed ({e!r}); retry {attempt + 1} of {retries}")
+                else:
+                    if failed is None or not failed(result):
+                        breaker.success()
+                        return result
+                    breaker.failure()
+                    if attempt == retries:
+                        return result
+                    logger.warning(f"{dependency} call reported a failure; retry {attempt + 1} of {retries}")
+                REGISTRY.inc("resilience_events_total", dependency=dependency, event="retry")
+                record_retry(dependency, name)
+                await asyncio.sleep(backoff(policy, attempt + 1))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(retries + 1):
+            breaker.allow()
+            try:
+                result = _attempt(func, args, kwargs, policy, dependency, hedge=idempotent)
+            except Exception as e:
+                breaker.failure()
+                if attempt == retries:
+                    raise
+                logger.warning(f"{dependency} call failed ({e!r}); retry {attempt + 1} of {retries}")
+            else:
+                if failed is None or not failed(result):
+                    breaker.success()
+                    return result
+                breaker.failure()
+                if attempt == retries:
+                    return result
+                logger.warning(f"{dependency} call reported a failure; retry {attempt + 1} of {retries}")
+            REGISTRY.inc("resilience_events_total", dependency=dependency, event="retry")
+            record_retry(dependency, name)
+            time.sleep(backoff(policy, attempt + 1))
+    return wrapper
+
+
+def retryable_llm_errors() -> tuple:
+    """OpenAI errors worth another attempt: connection failures and timeouts, rate limits and server errors."""
+    import openai
+
+    return openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError
+
+
+def retrying_model(model: Runnable, policy: Optional[CallPolicy] = None) -> Runnable:
+    """
+    Retry a chat model on transient API errors with jittered exponential backoff.
+
+    Each attempt is its own model run, tagged ``retry:attempt:<n>`` from the
+    second on, which ``MetricsCallbackHandler`` counts as a retry. Other
+    errors, such as an open circuit breaker, go straight to the fallbacks.
+    """
+    policy = policy or get_policy("llm")
+    if not policy.retries:
+        return model
+    return model.with_retry(
+        retry_if_exception_type=retryable_llm_errors(), wait_exponential_jitter=True, stop_after_attempt=policy.retries + 1
+    )
+
+
+class CircuitBreakerCallback(BaseCallbackHandler):
+    """
+    Per-model circuit breaker for chat models.
+
+    Raising from ``on_chat_model_start`` aborts the call before any request is
+    sent; ``with_fallbacks`` then moves on to the next model.
+    """
+
+    raise_error = True
+    run_inline = True
+
+    def __init__(self, model: str):
+        self.breaker = get_breaker(f"llm:{model}", get_policy("llm"))
+        self._runs = set()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+        self.breaker.allow()
+        self._runs.add(run_id)
+
+    def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        if run_id in self._runs:
+            self._runs.discard(run_id)
+            self.breaker.success()
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        if run_id in self._runs:
+            self._runs.discard(run_id)
+            self.breaker.failure()
+
+
+def resilient_tools(tools: List[Any], dependency: str) -> List[Any]:
+    """Wrap tools so each call follows the dependency's timeout and breaker (tools are never retried)."""
+    from langchain_core.tools import StructuredTool
+
+    def call(tool, **kwargs):
+        return tool.invoke(kwargs)
+
+    return [
+        StructuredTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            func=resilient(functools.partial(call, tool), dependency),
+        )
+        for tool in tools
+    ]
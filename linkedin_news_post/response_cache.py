@@ -0,0 +1,241 @@
+"""
+Opt-in response cache for deterministic chains.
+
+The supervisor's routing decision and the quality verdict are often computed
+again on effectively identical inputs: a resumed or retried run, or several
+tenants drafting from the same news item. ``cached_chain`` wraps such a chain
+so that a repeated input is answered from the cache without calling the
+model at all.
+
+Entries are keyed on the normalized chain input, restricted to the input
+variables of the chain's prompt (so graph state the prompt never reads, such
+as ``run_usage`` or the research pool, does not split the key), with message
+types, names and contents with whitespace collapsed, message ids and provider
+metadata dropped and store items reduced to their namespace, key and value, together
+with the chain's model settings, so changing a model or its temperature
+never serves a stale answer. Entries expire after a TTL and the least
+recently used ones are evicted once the cache holds ``max_entries``.
+
+Backends: ``SQLiteResponseCache`` (a local file, the default) and
+``MongoResponseCache`` (shared by every worker using the same database).
+"""
+import asyncio
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from pydantic import BaseModel
+
+from linkedin_news_post.config import logger
+from linkedin_news_post.metrics import REGISTRY
+
+
+class ResponseCache(ABC):
+    """Key-value cache of chain outputs with a TTL and a bounded size."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """The unexpired value stored under ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, evicting the least recently used entries beyond ``max_entries``."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Response cache in a local SQLite file, evicting the least recently used entries."""
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        super().__init__(ttl_seconds, max_entries)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now + self.ttl_seconds, now),
+            )
+            self._conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+
+class MongoResponseCache(ResponseCache):
+    """Response cache in a MongoDB collection, expired by a TTL index."""
+
+    def __init__(self, mongo_url: str, db_name: str, collection_name: str, ttl_seconds: float, max_entries: int):
+        import pymongo
+
+        super().__init__(ttl_seconds, max_entries)
+        self._collection = pymongo.MongoClient(mongo_url)[db_name][collection_name]
+        self._collection.create_index("expires", expireAfterSeconds=0)
+        self._collection.create_index("accessed")
+
+    def get(self, key: str) -> Optional[Any]:
+        now = datetime.now(timezone.utc)
+        # The TTL monitor runs once a minute, so check the expiry here as well
+        doc = self._collection.find_one_and_update(
+            {"_id": key, "expires": {"$gt": now}}, {"$set": {"accessed": now}}
+        )
+        return doc["value"] if doc else None
+
+    def set(self, key: str, value: Any) -> None:
+        now = datetime.now(timezone.utc)
+        self._collection.replace_one(
+            {"_id": key},
+            {"_id": key, "value": value, "expires": now + timedelta(seconds=self.ttl_seconds), "accessed": now},
+            upsert=True,
+        )
+        excess = self._collection.estimated_document_count() - self.max_entries
+        if excess > 0:
+            oldest = self._collection.find({}, {"_id": 1}).sort("accessed", 1).limit(excess)
+            self._collection.delete_many({"_id": {"$in": [doc["_id"] for doc in oldest]}})
+
+    def clear(self) -> None:
+        self._collection.delete_many({})
+
+
+def normalize_input(value: Any) -> Any:
+    """Reduce a chain input to the content that determines the model's answer."""
+    if isinstance(value, BaseMessage):
+        return {
+            "type": value.type,
+            "name": value.name,
+            "content": normalize_input(value.content),
+            "tool_calls": [
+                {"name": call["name"], "args": normalize_input(call["args"])}
+                for call in getattr(value, "tool_calls", None) or []
+            ],
+        }
+    if hasattr(value, "namespace") and hasattr(value, "value"):
+        # Store items: timestamps and search scores do not change the verdict
+        return {"namespace": list(value.namespace), "key": value.key, "value": normalize_input(value.value)}
+    if isinstance(value, dict):
+        return {k: normalize_input(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [normalize_input(v) for v in value]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def prompt_variables(chain: Runnable) -> Optional[List[str]]:
+    """Input variables of the prompt a chain starts with, or None if it does not start with one."""
+    first = getattr(chain, "first", chain)
+    variables = getattr(first, "input_variables", None)
+    return sorted(variables) if variables else None
+
+
+def response_key(name: str, params: Dict[str, Any], chain_input: Any, variables: Optional[List[str]] = None) -> str:
+    """Hash the chain's name, model settings and input; with ``variables``, only those keys of a dict input count."""
+    if variables is not None and isinstance(chain_input, dict):
+        chain_input = {k: chain_input[k] for k in variables if k in chain_input}
+    payload = json.dumps([name, params, normalize_input(chain_input)], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def encode_output(output: Any) -> Dict[str, Any]:
+    if isinstance(output, BaseMessage):
+        return {"message": message_to_dict(output)}
+    if isinstance(output, BaseModel):
+        cls = type(output)
+        return {"model": f"{cls.__module__}:{cls.__qualname__}", "data": output.model_dump()}
+    return {"value": output}
+
+
+def decode_output(data: Dict[str, Any]) -> Any:
+    if "message" in data:
+        return messages_from_dict([data["message"]])[0]
+    if "model" in data:
+        module, qualname = data["model"].split(":")
+        return getattr(importlib.import_module(module), qualname)(**data["data"])
+    return data["value"]
+
+
+def cached_chain(chain: Runnable, name: str, cache: ResponseCache, params: Dict[str, Any]) -> Runnable:
+    """
+    Wrap a chain so that repeated inputs are answered from ``cache``.
+
+    Args:
+        chain: The chain to wrap
+        name: Chain name, part of the key and the metric labels
+        cache: The response cache backend
+        params: Model settings of the chain, part of the key
+    """
+    variables = prompt_variables(chain)
+
+    def lookup(chain_input: Any):
+        key = response_key(name, params, chain_input, variables)
+        try:
+            cached = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache lookup for {name} failed: {e}")
+            cached = None
+        hit = cached is not None
+        REGISTRY.inc("response_cache_requests_total", help="Response cache lookups", chain=name, result="hit" if hit else "miss")
+        return key, decode_output(cached) if hit else None
+
+    def store(key: str, output: Any) -> None:
+        try:
+            cache.set(key, encode_output(output))
+        except Exception as e:
+            logger.warning(f"Response cache update for {name} failed: {e}")
+
+    def invoke(chain_input: Any, config: RunnableConfig):
+        key, output = lookup(chain_input)
+        if output is None:
+            output = chain.invoke(chain_input, config)
+            store(key, output)
+        return output
+
+    async def ainvoke(chain_input: Any, config: RunnableConfig):
+        key, output = await asyncio.to_thread(lookup, chain_input)
+        if output is None:
+            output = await chain.ainvoke(chain_input, config)
+            await asyncio.to_thread(store, key, output)
+        return output
+
+    return RunnableLambda(invoke, afunc=ainvoke, name=name)
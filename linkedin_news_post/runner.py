@@ -0,0 +1,130 @@
+"""
+Run many independent post-generation runs concurrently on one event loop.
+
+All runs share one compiled graph (and therefore one set of chains, pooled
+HTTP clients and the MongoDB store); an asyncio semaphore caps how many are
+in flight at once. Multi-tenant batches additionally pass each tenant's
+settings through the runtime config and apply per-tenant rate limits. Each
+run gets its search date window when it is admitted, not when it is queued.
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from linkedin_news_post.config import RUN_CONCURRENCY, SEARCH_WINDOW_STRATEGY, logger
+from linkedin_news_post.metrics import format_report, track_run
+from linkedin_news_post.runtime import release_search_window, with_search_window
+from linkedin_news_post.tenants import TenantConfig, TenantRateLimiter
+
+DEFAULT_INPUT = {"messages": [("user", "Publish a linkedin article")]}
+
+
+async def run_concurrently(
+    graph,
+    inputs: List[Dict[str, Any]],
+    concurrency: int = RUN_CONCURRENCY,
+    configs: Optional[List[Optional[Dict[str, Any]]]] = None,
+    limiters: Optional[List[Any]] = None,
+    window_strategy: str = SEARCH_WINDOW_STRATEGY,
+) -> List[Any]:
+    """
+    Invoke the graph once per input with at most ``concurrency`` runs in flight.
+
+    Args:
+        graph: A compiled graph
+        inputs: One graph input per run
+        concurrency: Maximum number of runs executing at the same time
+        configs: Optional runnable config per run, aligned with ``inputs``
+        limiters: Optional async context manager per run, entered before the
+            run starts (e.g. a per-tenant rate limiter)
+        window_strategy: How runs without a search window in their config get
+            one, "rolling" or "advancing" (see ``search_window.py``)
+
+    Returns:
+        The final state of each run, or the exception it raised, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    configs = configs or [None] * len(inputs)
+    limiters = limiters or [None] * len(inputs)
+
+    async def run_one(index: int, graph_input: Dict[str, Any], config: Optional[Dict[str, Any]], limiter) -> Any:
+        if limiter is not None:
+            async with limiter:
+                return await run_admitted(index, graph_input, config)
+        return await run_admitted(index, graph_input, config)
+
+    async def run_admitted(index: int, graph_input: Dict[str, Any], config: Optional[Dict[str, Any]]) -> Any:
+        async with semaphore:
+            logger.info(f"Starting run {index + 1}/{len(inputs)}")
+            start, claimed = time.perf_counter(), None
+            try:
+                config, claimed = with_search_window(config, window_strategy)
+                with track_run(**(config or {}).get("metadata", {})) as run_metrics:
+                    result = await graph.ainvoke(graph_input, config=config)
+                logger.info(f"Run {index + 1} finished in {time.perf_counter() - start:.1f}s")
+                logger.info(format_report(run_metrics.summary()))
+                return result
+            except Exception as e:
+                logger.error(f"Run {index + 1} failed after {time.perf_counter() - start:.1f}s: {str(e)}", exc_info=True)
+                if claimed is not None:
+                    release_search_window(config, claimed)
+                return e
+
+    return await asyncio.gather(*(
+        run_one(index, graph_input, config, limiter)
+        for index, (graph_input, config, limiter) in enumerate(zip(inputs, configs, limiters))
+    ))
+
+
+async def run_posts(count: int = 1, concurrency: int = RUN_CONCURRENCY) -> List[Any]:
+    """Build the graph once and generate ``count`` posts concurrently."""
+    from linkedin_news_post.graph import make_graph
+
+    async with make_graph() as graph:
+        return await run_concurrently(graph, [DEFAULT_INPUT] * count, concurrency)
+
+
+async def run_tenants(
+    graph,
+    tenants: List[TenantConfig],
+    concurrency: int = RUN_CONCURRENCY,
+) -> Dict[str, List[Any]]:
+    """
+    Run a batch for several tenants concurrently on one shared graph.
+
+    Each tenant's settings travel in its runs' config, so no module-level
+    state is touched. The global ``concurrency`` cap applies across tenants
+    while each tenant's rate limiter bounds its own runs.
+
+    Args:
+        graph: A compiled graph
+        tenants: Tenant configurations; each contributes ``tenant.runs`` runs
+        concurrency: Maximum number of runs executing at the same time overall
+
+    Returns:
+        The final states (or exceptions) of each tenant's runs, keyed by tenant_id
+    """
+    inputs, configs, limiters, owners = [], [], [], []
+    for tenant in tenants:
+        limiter = TenantRateLimiter.for_tenant(tenant)
+        for _ in range(tenant.runs):
+            inputs.append(DEFAULT_INPUT)
+            configs.append(tenant.to_run_config())
+            limiters.append(limiter)
+            owners.append(tenant.tenant_id)
+
+    logger.info(f"Running {len(inputs)} runs for {len(tenants)} tenants with concurrency {concurrency}")
+    results = await run_concurrently(graph, inputs, concurrency, configs, limiters)
+
+    by_tenant: Dict[str, List[Any]] = {tenant.tenant_id: [] for tenant in tenants}
+    for tenant_id, result in zip(owners, results):
+        by_tenant[tenant_id].append(result)
+    return by_tenant
+
+
+async def run_tenant_batch(tenants: List[TenantConfig], concurrency: int = RUN_CONCURRENCY) -> Dict[str, List[Any]]:
+    """Build the graph once and run a batch for every tenant."""
+    from linkedin_news_post.graph import make_graph
+
+    async with make_graph() as graph:
+        return await run_tenants(graph, tenants, concurrency)
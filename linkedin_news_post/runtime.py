@@ -0,0 +1,102 @@
+"""
+Per-run settings read from the graph's runtime config.
+
+Tenant-specific values (organization URN, domain focus, article namespace)
+are passed in ``config["configurable"]`` for each invocation instead of being
+baked into the chains at import time. Keys that are not set fall back to the
+module-level defaults in ``config.py``. The search date window is set when a
+run starts (see ``with_search_window``); without one, the rolling window is
+computed when the settings are read.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, TypedDict
+
+from langchain_core.runnables import RunnableConfig
+
+from linkedin_news_post.config import DOMAIN_FOCUS, ORGANIZATION_URN, SEARCH_WINDOW_STRATEGY
+from linkedin_news_post.search_window import STRATEGIES, SearchWindow, parse_date, rolling_window
+
+DEFAULT_TENANT_ID = "default"
+DEFAULT_ARTICLES_NAMESPACE = ("articles",)
+
+
+class RunConfiguration(TypedDict, total=False):
+    """Configurable keys accepted by the graph, all optional."""
+    tenant_id: str
+    organization_urn: str
+    domain_focus: str
+    articles_namespace: Tuple[str, ...]
+    # Budget overrides, see linkedin_news_post.budget.RunBudget
+    max_node_visits: int
+    max_tokens: int
+    max_seconds: float
+    max_cost_usd: float
+    max_quality_rejections: int
+    # Publishing-date window of the run's searches, ISO 8601
+    search_start_date: str
+    search_end_date: str
+
+
+@dataclass(frozen=True)
+class RunSettings:
+    tenant_id: str = DEFAULT_TENANT_ID
+    organization_urn: str = ORGANIZATION_URN
+    domain_focus: str = DOMAIN_FOCUS
+    articles_namespace: Tuple[str, ...] = DEFAULT_ARTICLES_NAMESPACE
+    search_window: SearchWindow = field(default_factory=rolling_window)
+
+    def chain_input(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the tenant's prompt variables to a chain input."""
+        return {**state, "domain_focus": self.domain_focus, "organization_urn": self.organization_urn}
+
+
+def get_run_settings(config: Optional[RunnableConfig] = None) -> RunSettings:
+    """Read the run settings from ``config["configurable"]``."""
+    configurable = (config or {}).get("configurable", {})
+    return RunSettings(
+        tenant_id=configurable.get("tenant_id", DEFAULT_TENANT_ID),
+        organization_urn=configurable.get("organization_urn", ORGANIZATION_URN),
+        domain_focus=configurable.get("domain_focus", DOMAIN_FOCUS),
+        articles_namespace=tuple(configurable.get("articles_namespace", DEFAULT_ARTICLES_NAMESPACE)),
+        search_window=_configured_window(configurable) or rolling_window(),
+    )
+
+
+def _configured_window(configurable: Dict[str, Any]) -> Optional[SearchWindow]:
+    start, end = parse_date(configurable.get("search_start_date")), parse_date(configurable.get("search_end_date"))
+    return SearchWindow(start, end) if start and end and start < end else None
+
+
+def with_search_window(
+    config: Optional[Dict[str, Any]], strategy: str = SEARCH_WINDOW_STRATEGY
+) -> Tuple[Dict[str, Any], Optional[SearchWindow]]:
+    """
+    Give a run its search window, unless its config already carries one.
+
+    Returns:
+        The config with the window added, and the window if it was claimed
+        from the advancing cursor (hand it to ``release_search_window`` if
+        the run fails)
+    """
+    config = dict(config or {})
+    configurable = config.get("configurable", {})
+    if _configured_window(configurable) is not None:
+        return config, None
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown search window strategy '{strategy}' (expected one of {', '.join(STRATEGIES)})")
+    claimed = None
+    if strategy == "advancing":
+        from linkedin_news_post.clients import get_window_cursor
+
+        window = claimed = get_window_cursor().next_window(configurable.get("tenant_id", DEFAULT_TENANT_ID))
+    else:
+        window = rolling_window()
+    config["configurable"] = {**configurable, **window.configurable()}
+    return config, claimed
+
+
+def release_search_window(config: Optional[Dict[str, Any]], window: SearchWindow) -> None:
+    """Rewind the advancing cursor after a failed run, so the next run searches the window again."""
+    from linkedin_news_post.clients import get_window_cursor
+
+    get_window_cursor().rewind((config or {}).get("configurable", {}).get("tenant_id", DEFAULT_TENANT_ID), window)
@@ -0,0 +1,331 @@
+"""
+Two-tier cache for Exa searches made by the MCP ``search_and_content`` tool.
+
+The researcher re-issues near-identical queries while a draft is rejected
+and re-researched, and concurrent runs search the same day's news, so most
+searches repeat one made minutes earlier. Results are kept in an in-memory
+LRU in front of a local SQLite file that survives restarts and is shared by
+the processes of one host.
+
+Keys normalize the query (case, whitespace and surrounding punctuation) and
+reduce both ends of the date window to the day, together with the category,
+``num_results`` and ``max_characters``. How long an entry stays fresh
+depends on that window: a window that ended before today cannot gain new
+articles and is kept for ``closed_ttl`` seconds, while one that reaches today
+is fresh for only ``open_ttl`` seconds. For ``stale_seconds`` after that the
+stale results are still served, and a background refresh replaces them.
+Concurrent misses for the same key share one Exa call.
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import string
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from linkedin_news_post.config import logger
+from linkedin_news_post.metrics import REGISTRY
+
+# (encoded response, fresh until, stale until)
+Entry = Tuple[Dict[str, Any], float, float]
+
+
+@dataclass
+class CachedResult:
+    url: str
+    title: Optional[str] = None
+    published_date: Optional[str] = None
+    author: Optional[str] = None
+    text: Optional[str] = None
+    score: Optional[float] = None
+    id: Optional[str] = None
+    highlights: Optional[List[str]] = None
+    summary: Optional[str] = None
+
+
+@dataclass
+class CachedResponse:
+    """An Exa search response served from the cache; reads like ``SearchResponse``."""
+    results: List[CachedResult] = field(default_factory=list)
+    from_cache: bool = True
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split()).strip(string.punctuation + " ")
+
+
+def _day(value: Optional[str]) -> Optional[str]:
+    # "2026-10-19T08:15:00.000Z" and "2026-10-19" cover the same day of news
+    return value[:10] if value else None
+
+
+def search_key(params: Dict[str, Any]) -> str:
+    normalized = {
+        **params,
+        "query": normalize_query(params["query"]),
+        "start_published_date": _day(params.get("start_published_date")),
+        "end_published_date": _day(params.get("end_published_date")),
+    }
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def encode_response(response: Any) -> Dict[str, Any]:
+    fields = CachedResult.__dataclass_fields__
+    return {"results": [
+        {name: getattr(result, name) for name in fields if getattr(result, name, None) is not None}
+        for result in response.results
+    ]}
+
+
+def decode_response(data: Dict[str, Any]) -> CachedResponse:
+    return CachedResponse(results=[CachedResult(**result) for result in data["results"]])
+
+
+class SearchCache:
+    """
+    In-memory LRU plus optional SQLite tier with window-dependent TTLs.
+
+    Args:
+        path: SQLite file for the disk tier (None or "" keeps entries in memory only)
+        memory_entries: Size of the in-memory LRU
+        disk_entries: Entries kept on disk, most recently fetched first
+        open_ttl: Seconds a search whose window reaches today stays fresh
+        closed_ttl: Seconds a search over a window that has ended stays fresh
+        stale_seconds: Seconds past freshness during which results are
+            served while being refreshed in the background
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        memory_entries: int = 256,
+        disk_entries: int = 5000,
+        open_ttl: float = 3600,
+        closed_ttl: float = 7 * 24 * 3600,
+        stale_seconds: float = 6 * 3600,
+    ):
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.open_ttl = open_ttl
+        self.closed_ttl = closed_ttl
+        self.stale_seconds = stale_seconds
+        self._memory: "OrderedDict[str, Entry]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+        # Background refreshes on the async path, referenced until they finish
+        self._tasks: Set[asyncio.Task] = set()
+        self._conn = None
+        self._db_lock = threading.Lock()
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, fetched REAL NOT NULL, "
+                "fresh_until REAL NOT NULL, stale_until REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS searches_fetched ON searches (fetched)")
+
+    def ttl(self, end_published_date: Optional[str]) -> float:
+        end = _day(end_published_date)
+        return self.closed_ttl if end and end < date.today().isoformat() else self.open_ttl
+
+    # Tiers
+
+    def _read(self, key: str) -> Tuple[Optional[Entry], str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry, "memory"
+        if self._conn is None:
+            return None, "none"
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT value, fresh_until, stale_until FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None, "none"
+        entry = (json.loads(row[0]), row[1], row[2])
+        self._remember(key, entry)
+        return entry, "disk"
+
+    def _remember(self, key: str, entry: Entry) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _write(self, key: str, params: Dict[str, Any], response: Any) -> None:
+        now = time.time()
+        fresh_until = now + self.ttl(params.get("end_published_date"))
+        entry = (encode_response(response), fresh_until, fresh_until + self.stale_seconds)
+        self._remember(key, entry)
+        if self._conn is None:
+            return
+        try:
+            with self._db_lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO searches (key, value, fetched, fresh_until, stale_until) VALUES (?, ?, ?, ?, ?)",
+                    (key, json.dumps(entry[0]), now, entry[1], entry[2]),
+                )
+                self._conn.execute("DELETE FROM searches WHERE stale_until <= ?", (now,))
+                self._conn.execute(
+                    "DELETE FROM searches WHERE key IN ("
+                    "SELECT key FROM searches ORDER BY fetched DESC LIMIT -1 OFFSET ?)",
+                    (self.disk_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    # Lookups
+
+    def _count(self, tier: str, result: str) -> None:
+        with self._lock:
+            self._counts[result] = self._counts.get(result, 0) + 1
+        REGISTRY.inc("search_cache_requests_total", help="Search cache lookups", tier=tier, result=result)
+
+    def _lookup(self, key: str) -> Tuple[Optional[CachedResponse], Optional[Future], bool]:
+        """
+        Return ``(cached response, future, leader)`` for a key.
+
+        A fresh entry comes without a future. For a stale entry the first
+        caller also gets a new future and leads its refresh. On a miss the
+        first caller leads the fetch and later ones get its future to wait on.
+        """
+        entry, tier = self._read(key)
+        now = time.time()
+        if entry is not None and now < entry[2]:
+            future = None
+            if now >= entry[1]:
+                with self._lock:
+                    if key not in self._inflight:
+                        future = self._inflight[key] = Future()
+                self._count(tier, "stale")
+            else:
+                self._count(tier, "hit")
+            return decode_response(entry[0]), future, future is not None
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        self._count("none", "miss" if leader else "coalesced")
+        return None, future, leader
+
+    def _settle(self, key: str, params: Dict[str, Any], future: Future, response: Any = None, error: BaseException = None) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+            return
+        try:
+            self._write(key, params, response)
+        finally:
+            future.set_result(response)
+
+    def _fetch(self, key: str, params: Dict[str, Any], fetch: Callable[[], Any], future: Future) -> Any:
+        try:
+            response = fetch()
+        except BaseException as e:
+            self._settle(key, params, future, error=e)
+            raise
+        self._settle(key, params, future, response)
+        return response
+
+    async def _afetch(self, key: str, params: Dict[str, Any], afetch: Callable[[], Awaitable[Any]], future: Future) -> Any:
+        try:
+            response = await afetch()
+        except BaseException as e:
+            self._settle(key, params, future, error=e)
+            raise
+        self._settle(key, params, future, response)
+        return response
+
+    @staticmethod
+    def _refreshed(params: Dict[str, Any], error: Optional[BaseException]) -> None:
+        if error is not None:
+            logger.warning(f"Refreshing stale search '{params['query']}' failed: {error}")
+        REGISTRY.inc(
+            "search_cache_refreshes_total", help="Background refreshes of stale searches", result="error" if error else "ok"
+        )
+
+    def _refresh(self, key: str, params: Dict[str, Any], fetch: Callable[[], Any], future: Future) -> None:
+        try:
+            self._fetch(key, params, fetch, future)
+        except Exception as e:
+            self._refreshed(params, e)
+        else:
+            self._refreshed(params, None)
+
+    async def _arefresh(self, key: str, params: Dict[str, Any], afetch: Callable[[], Awaitable[Any]], future: Future) -> None:
+        try:
+            await self._afetch(key, params, afetch, future)
+        except Exception as e:
+            self._refreshed(params, e)
+        else:
+            self._refreshed(params, None)
+
+    def get_or_fetch(self, params: Dict[str, Any], fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached response for the search ``params``, calling ``fetch`` on a miss.
+
+        ``fetch`` makes the live search and raises on failure; failures are
+        never cached. Stale entries are returned at once while ``fetch`` runs
+        in the background.
+        """
+        key = search_key(params)
+        response, future, leader = self._lookup(key)
+        if response is not None:
+            if leader:
+                self._refresher.submit(self._refresh, key, params, fetch, future)
+            return response
+        if not leader:
+            return future.result()
+        return self._fetch(key, params, fetch, future)
+
+    async def aget_or_fetch(self, params: Dict[str, Any], afetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Async :meth:`get_or_fetch`; ``afetch`` returns an awaitable live search."""
+        key = search_key(params)
+        # The memory tier and the local SQLite file answer well within a loop tick
+        response, future, leader = self._lookup(key)
+        if response is not None:
+            if leader:
+                task = asyncio.get_running_loop().create_task(self._arefresh(key, params, afetch, future))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return response
+        if not leader:
+            return await asyncio.wrap_future(future)
+        return await self._afetch(key, params, afetch, future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup counts since start and the share answered without waiting for Exa."""
+        with self._lock:
+            counts = dict(self._counts)
+            memory = len(self._memory)
+        total = sum(counts.values())
+        served = counts.get("hit", 0) + counts.get("stale", 0)
+        return {
+            **counts,
+            "lookups": total,
+            "hit_rate": round(served / total, 4) if total else 0.0,
+            "memory_entries": memory,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._conn is not None:
+            with self._db_lock:
+                self._conn.execute("DELETE FROM searches")
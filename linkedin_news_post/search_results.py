@@ -0,0 +1,106 @@
+"""
+Compact, typed output of the MCP search tools.
+
+Tool output is pasted into the transcript and re-sent with every later
+prompt, so the search tools return only the fields a caller asks for, cut
+each snippet to a character budget at a word boundary, trim publishing
+timestamps to the date, and leave out empty values. Each response reports
+an estimate of the tokens it adds to a prompt (four characters per token).
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from linkedin_news_post.config import SEARCH_RESULT_FIELDS, SEARCH_SNIPPET_CHARS
+
+
+class SearchHit(BaseModel):
+    """One story returned by a search tool."""
+
+    url: str
+    title: Optional[str] = None
+    published: Optional[str] = Field(default=None, description="Publishing date, YYYY-MM-DD")
+    author: Optional[str] = None
+    snippet: Optional[str] = None
+    score: Optional[float] = Field(default=None, description="Relevance, higher is better")
+    sources: Optional[int] = Field(default=None, description="Outlets that reported the story")
+    queries: Optional[List[str]] = Field(default=None, description="Queries that found the story")
+
+
+class SearchPayload(BaseModel):
+    results: List[Dict[str, Any]]
+    errors: Optional[Dict[str, str]] = None
+    token_estimate: int = 0
+
+
+FIELDS = tuple(SearchHit.model_fields)
+
+
+def clip(text: Optional[str], budget: int) -> Optional[str]:
+    """Cut ``text`` to at most ``budget`` characters, at a word boundary where possible."""
+    if not text:
+        return None
+    text = " ".join(text.split())
+    if len(text) <= budget:
+        return text
+    cut = text[:budget - 1]
+    if " " in cut[budget // 2:]:
+        cut = cut[:cut.rindex(" ")]
+    return cut.rstrip(" ,;:.") + "…"
+
+
+def to_hit(result: Dict[str, Any], snippet_chars: int) -> SearchHit:
+    """Build a hit from a normalized result (see ``research.normalize_results``)."""
+    score = result.get("score")
+    return SearchHit(
+        url=result["url"],
+        title=result.get("title"),
+        published=(result.get("published_date") or "")[:10] or None,
+        author=result.get("author"),
+        snippet=clip(result.get("text"), snippet_chars),
+        score=round(score, 3) if score is not None else None,
+        sources=result.get("sources"),
+        queries=result.get("queries"),
+    )
+
+
+def select_fields(fields: Optional[Iterable[str]]) -> List[str]:
+    """Validate a field selection; None selects the configured default."""
+    selected = list(fields) if fields else SEARCH_RESULT_FIELDS
+    unknown = [name for name in selected if name not in FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown result fields {unknown}; choose from {list(FIELDS)}")
+    return selected
+
+
+def estimate_tokens(payload: Dict[str, Any]) -> int:
+    return len(json.dumps(payload, ensure_ascii=False, separators=(",", ":"))) // 4
+
+
+def shape_results(
+    results: List[Dict[str, Any]],
+    fields: Optional[Iterable[str]] = None,
+    snippet_chars: Optional[int] = None,
+    errors: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Shape normalized results into a compact payload.
+
+    Args:
+        results: Normalized, deduplicated results
+        fields: Fields to keep per result (default ``SEARCH_RESULT_FIELDS``)
+        snippet_chars: Snippet budget per result (default ``SEARCH_SNIPPET_CHARS``)
+        errors: Error message per failed query, if any
+
+    Returns:
+        A ``SearchPayload`` as a dict, with ``token_estimate`` covering the
+        whole payload
+    """
+    include = set(select_fields(fields))
+    budget = snippet_chars or SEARCH_SNIPPET_CHARS
+    hits = [to_hit(result, budget).model_dump(include=include, exclude_none=True) for result in results]
+    payload = SearchPayload(results=hits, errors=errors or None).model_dump(exclude_none=True)
+    # The estimate's own digits are a rounding error
+    payload["token_estimate"] = estimate_tokens(payload)
+    return payload
@@ -0,0 +1,168 @@
+"""
+Publishing-date windows for the news searches, computed per run.
+
+The window used to be computed once, when ``config.py`` was imported, so a
+long-lived process kept searching the month before it started. Each run now
+gets its own window. It is computed when the run starts and passed in the
+runtime config as ``search_start_date`` and ``search_end_date``. Searches made
+outside a run compute one at call time.
+
+Two strategies choose the window:
+
+- ``rolling``: the last ``SEARCH_DAYS_BACK`` days up to now. Every run covers
+  the same stretch of news, which suits one-shot runs.
+- ``advancing``: a tenant's window starts where its previous one ended, so a
+  persistent worker steps through fresh, non-overlapping ranges instead of
+  paying for news it has already covered. The window never reaches back
+  more than ``SEARCH_DAYS_BACK`` days. It spans at least
+  ``SEARCH_WINDOW_MIN_HOURS``, so a run that follows the previous one closely
+  overlaps it rather than searching a few minutes of news. The cursors live
+  in ``SEARCH_WINDOW_STATE_PATH`` and survive restarts.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from linkedin_news_post.config import (
+    SEARCH_DAYS_BACK,
+    SEARCH_WINDOW_MIN_HOURS,
+    SEARCH_WINDOW_STATE_PATH,
+    logger,
+)
+
+STRATEGIES = ("rolling", "advancing")
+
+
+def format_date(moment: datetime) -> str:
+    """ISO 8601 in UTC with millisecond precision, as Exa expects."""
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def parse_date(text: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO date or timestamp; naive values are taken as UTC, unparsable ones as None."""
+    if not text:
+        return None
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class SearchWindow:
+    start: datetime
+    end: datetime
+
+    @property
+    def start_date(self) -> str:
+        return format_date(self.start)
+
+    @property
+    def end_date(self) -> str:
+        return format_date(self.end)
+
+    def configurable(self) -> Dict[str, str]:
+        """The window as runtime config keys."""
+        return {"search_start_date": self.start_date, "search_end_date": self.end_date}
+
+    def clamp(self, start: Optional[str], end: Optional[str]) -> Tuple[str, str]:
+        """
+        Limit a requested range to this window.
+
+        Missing or unparsable ends are replaced by the window's; a range that
+        does not overlap the window becomes the whole window.
+        """
+        first = max(parse_date(start) or self.start, self.start)
+        last = min(parse_date(end) or self.end, self.end)
+        if first >= last:
+            return self.start_date, self.end_date
+        return format_date(first), format_date(last)
+
+
+def rolling_window(now: Optional[datetime] = None, days_back: float = SEARCH_DAYS_BACK) -> SearchWindow:
+    """The last ``days_back`` days up to ``now``."""
+    now = now or datetime.now(timezone.utc)
+    return SearchWindow(now - timedelta(days=days_back), now)
+
+
+class WindowCursor:
+    """
+    Per-tenant cursor for advancing windows, persisted to a JSON file.
+
+    Args:
+        path: JSON file mapping each tenant to the end of its last window
+            (None or empty keeps the cursors in memory only)
+        days_back: Furthest a window reaches back from now
+        min_hours: Shortest window handed out
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = SEARCH_WINDOW_STATE_PATH,
+        days_back: float = SEARCH_DAYS_BACK,
+        min_hours: float = SEARCH_WINDOW_MIN_HOURS,
+    ):
+        self.path = path
+        self.days_back = days_back
+        self.min_span = timedelta(hours=min_hours)
+        self._ends: Dict[str, str] = self._load()
+        # Cursor position before each tenant's latest claim, for rewind
+        self._previous: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        if not self.path:
+            return {}
+        try:
+            with open(self.path) as f:
+                return dict(json.load(f))
+        except FileNotFoundError:
+            return {}
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable search window state {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._ends, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def next_window(self, tenant_id: str, now: Optional[datetime] = None) -> SearchWindow:
+        """Claim the tenant's next window: from the end of its last one up to now."""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            previous = self._ends.get(tenant_id)
+            oldest = now - timedelta(days=self.days_back)
+            start = min(max(parse_date(previous) or oldest, oldest), now - self.min_span)
+            window = SearchWindow(start, now)
+            self._previous[tenant_id] = (window.end_date, previous)
+            self._ends[tenant_id] = window.end_date
+            self._save()
+        logger.info(f"Search window for {tenant_id}: {window.start_date} to {window.end_date}")
+        return window
+
+    def rewind(self, tenant_id: str, window: SearchWindow) -> None:
+        """Give back a window whose run failed, unless a later window was claimed since."""
+        with self._lock:
+            claimed_end, previous = self._previous.get(tenant_id, (None, None))
+            if claimed_end != window.end_date or self._ends.get(tenant_id) != claimed_end:
+                return
+            if previous is None:
+                self._ends.pop(tenant_id, None)
+            else:
+                self._ends[tenant_id] = previous
+            del self._previous[tenant_id]
+            self._save()
+        logger.info(f"Search window for {tenant_id} rewound to {previous or 'the default'}")
+
+    def positions(self) -> Dict[str, str]:
+        """End of the last window claimed by each tenant."""
+        with self._lock:
+            return dict(self._ends)
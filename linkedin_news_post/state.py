@@ -1,10 +1,33 @@
-
-
-from typing import TypedDict, Annotated
+from typing import TypedDict, Annotated, Optional
 from langchain_core.messages import AnyMessage
 from langgraph.graph import add_messages
 
 
+def merge_research_results(left: Optional[list[dict]], right: Optional[list[dict]]) -> list[dict]:
+    """Append results from parallel search tasks; ``None`` clears them before a new fan-out."""
+    if right is None:
+        return []
+    return (left or []) + right
+
+
+def merge_usage(left: Optional[dict], right: Optional[dict]) -> dict:
+    """Add up the usage reported by each node; the run started with its first node."""
+    left, right = left or {}, right or {}
+    merged = {key: left.get(key, 0) + right.get(key, 0) for key in ("node_visits", "tokens", "cost_usd")}
+    starts = [usage["started_at"] for usage in (left, right) if usage.get("started_at") is not None]
+    merged["started_at"] = min(starts) if starts else None
+    return merged
+
 
 class State(TypedDict):
     messages: Annotated[list[AnyMessage], add_messages]
+    # Raw results collected from the current research fan-out
+    research_results: Annotated[list[dict], merge_research_results]
+    # Deduplicated, ranked candidates that later loops draw from without searching again
+    research_pool: list[dict]
+    # Node visits, tokens, cost and start time so far, reported by every node (see metrics.instrument_node)
+    run_usage: Annotated[dict, merge_usage]
+
+
+class SearchTask(TypedDict):
+    tool_call: dict
@@ -0,0 +1,142 @@
+"""
+Stream progress from a graph run instead of waiting for the final state.
+
+``stream_run`` turns ``graph.astream_events`` into a small set of progress
+events: node start/finish with timings and visit counts, and the tokens of
+selected nodes (the writer by default) as the model generates them. Other
+LangGraph stream modes (``updates``, ``values``, ``messages``, ...) are
+passed straight through ``graph.astream`` by ``stream_graph``.
+"""
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+from linkedin_news_post.config import logger
+
+# Nodes whose model tokens are streamed by default
+DEFAULT_TOKEN_NODES = ("writer_node",)
+
+STREAM_MODES = ("events", "updates", "values", "messages", "debug")
+
+
+@dataclass
+class RunEvent:
+    """One progress event from a streamed run."""
+    # "node_start", "node_end", "token" or "run_end"
+    kind: str
+    # Seconds since the run started
+    elapsed: float
+    node: Optional[str] = None
+    # Number of times the node has started in this run, counting this one
+    visit: int = 0
+    # Wall time of the finished node, for "node_end"
+    duration: Optional[float] = None
+    # Generated text, for "token"
+    text: str = ""
+    # Final graph state, for "run_end"
+    output: Any = None
+    # Node visit counts over the whole run, for "run_end"
+    visits: Dict[str, int] = field(default_factory=dict)
+    # Seconds from the run start to the first streamed token, for "run_end"
+    first_token: Optional[float] = None
+
+
+def _is_graph_node(event: Dict[str, Any]) -> bool:
+    """True for the run of a top-level graph node (not a nested chain or subgraph node)."""
+    metadata = event.get("metadata", {})
+    name = event["name"]
+    return (
+        name == metadata.get("langgraph_node")
+        and not name.startswith("__")
+        and len(event.get("parent_ids", ())) == 1
+    )
+
+
+def _token_text(chunk: Any) -> str:
+    content = getattr(chunk, "content", "")
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content or ""
+
+
+async def stream_run(
+    graph,
+    graph_input: Dict[str, Any],
+    config: Optional[Dict[str, Any]] = None,
+    token_nodes: Iterable[str] = DEFAULT_TOKEN_NODES,
+) -> AsyncIterator[RunEvent]:
+    """
+    Run the graph and yield progress events as they happen.
+
+    Args:
+        graph: A compiled graph
+        graph_input: The graph input
+        config: Optional runnable config for the run
+        token_nodes: Nodes whose chat model tokens are streamed
+
+    Yields:
+        RunEvent objects, ending with a single "run_end" event
+    """
+    token_nodes = set(token_nodes)
+    start = time.perf_counter()
+    started: Dict[str, float] = {}
+    visits: Counter = Counter()
+    first_token = None
+    output = None
+
+    async for event in graph.astream_events(graph_input, config=config, version="v2"):
+        kind = event["event"]
+        now = time.perf_counter()
+
+        if kind == "on_chain_start" and _is_graph_node(event):
+            node = event["name"]
+            visits[node] += 1
+            started[event["run_id"]] = now
+            yield RunEvent("node_start", now - start, node=node, visit=visits[node])
+
+        elif kind == "on_chain_end" and event["run_id"] in started:
+            node = event["name"]
+            duration = now - started.pop(event["run_id"])
+            yield RunEvent("node_end", now - start, node=node, visit=visits[node], duration=duration)
+
+        elif kind == "on_chat_model_stream":
+            node = event.get("metadata", {}).get("langgraph_node")
+            text = _token_text(event["data"].get("chunk"))
+            if node in token_nodes and text:
+                if first_token is None:
+                    first_token = now - start
+                    logger.info(f"First token from {node} after {first_token:.2f}s")
+                yield RunEvent("token", now - start, node=node, text=text)
+
+        elif kind == "on_chain_end" and not event.get("parent_ids"):
+            output = event["data"].get("output")
+
+    yield RunEvent(
+        "run_end", time.perf_counter() - start,
+        output=output, visits=dict(visits), first_token=first_token
+    )
+
+
+async def stream_graph(
+    graph,
+    graph_input: Dict[str, Any],
+    config: Optional[Dict[str, Any]] = None,
+    stream_mode: str = "updates",
+) -> AsyncIterator[Any]:
+    """Yield the chunks of ``graph.astream`` for one of LangGraph's stream modes."""
+    async for chunk in graph.astream(graph_input, config=config, stream_mode=stream_mode):
+        yield chunk
+
+
+def format_event(event: RunEvent) -> str:
+    """Render a progress event as one console line (tokens are returned bare)."""
+    if event.kind == "token":
+        return event.text
+    if event.kind == "node_start":
+        return f"[{event.elapsed:7.2f}s] > {event.node} (visit {event.visit})"
+    if event.kind == "node_end":
+        return f"[{event.elapsed:7.2f}s] < {event.node} done in {event.duration:.2f}s"
+    visits = ", ".join(f"{node}={count}" for node, count in sorted(event.visits.items()))
+    first_token = f"{event.first_token:.2f}s" if event.first_token is not None else "n/a"
+    return f"[{event.elapsed:7.2f}s] run finished; time to first token {first_token}; visits: {visits}"
@@ -0,0 +1,114 @@
+"""
+Tenant configurations for multi-organization batch runs.
+
+Each tenant publishes for its own LinkedIn organization with its own domain
+focus and keeps its past articles in a separate store namespace. Tenant
+settings reach the nodes through the graph's runtime config (see
+``linkedin_news_post.runtime``), so one compiled graph serves every tenant.
+"""
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from linkedin_news_post.config import DOMAIN_FOCUS, TENANT_MAX_CONCURRENT_RUNS, TENANT_MIN_INTERVAL_SECONDS
+
+
+@dataclass
+class TenantConfig:
+    tenant_id: str
+    organization_urn: str
+    domain_focus: str = DOMAIN_FOCUS
+    # Store namespace holding the tenant's past articles
+    namespace: Tuple[str, ...] = ()
+    # Cron expression for scheduled runs, e.g. "0 9 * * 1-5"
+    schedule: Optional[str] = None
+    # Number of posts to generate per batch
+    runs: int = 1
+    max_concurrent_runs: int = TENANT_MAX_CONCURRENT_RUNS
+    min_interval_seconds: float = TENANT_MIN_INTERVAL_SECONDS
+    # Per-run budget overrides, e.g. {"max_cost_usd": 0.5}
+    budget: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.namespace = tuple(self.namespace) or ("tenants", self.tenant_id, "articles")
+
+    def to_run_config(self, **configurable: Any) -> Dict[str, Any]:
+        """Build the runnable config that carries this tenant's settings into the graph."""
+        return {
+            "configurable": {
+                "tenant_id": self.tenant_id,
+                "organization_urn": self.organization_urn,
+                "domain_focus": self.domain_focus,
+                "articles_namespace": self.namespace,
+                **self.budget,
+                **configurable,
+            },
+            "tags": [f"tenant:{self.tenant_id}"],
+            "metadata": {"tenant_id": self.tenant_id},
+        }
+
+
+def load_tenants(path: str) -> List[TenantConfig]:
+    """
+    Load tenant configurations from a JSON file holding a list of objects.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The tenant configurations in file order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"Tenant file {path} must contain a JSON list")
+
+    tenants = [TenantConfig(**entry) for entry in entries]
+    seen = set()
+    for tenant in tenants:
+        if tenant.tenant_id in seen:
+            raise ValueError(f"Duplicate tenant_id '{tenant.tenant_id}' in {path}")
+        seen.add(tenant.tenant_id)
+    return tenants
+
+
+@dataclass
+class TenantRateLimiter:
+    """
+    Per-tenant admission control for concurrent runs.
+
+    Caps how many of a tenant's runs are in flight and spaces out their
+    start times by at least ``min_interval_seconds``.
+    """
+    max_concurrent_runs: int = TENANT_MAX_CONCURRENT_RUNS
+    min_interval_seconds: float = TENANT_MIN_INTERVAL_SECONDS
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _start_lock: asyncio.Lock = field(init=False, repr=False)
+    _last_start: float = field(default=float("-inf"), init=False, repr=False)
+
+    def __post_init__(self):
+        self._semaphore = asyncio.Semaphore(max(1, self.max_concurrent_runs))
+        self._start_lock = asyncio.Lock()
+
+    @classmethod
+    def for_tenant(cls, tenant: TenantConfig) -> "TenantRateLimiter":
+        return cls(tenant.max_concurrent_runs, tenant.min_interval_seconds)
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        try:
+            async with self._start_lock:
+                wait = self._last_start + self.min_interval_seconds - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_start = time.monotonic()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+        return False
@@ -0,0 +1,252 @@
+"""
+Disk-cached registry of the Composio LinkedIn tools.
+
+Every graph build used to fetch the LinkedIn tool schemas from Composio, the
+``main.py`` connection check fetched them a second time and the ghostwriter
+launcher looked the connected account up again in a subprocess. The registry
+makes one round trip for all of them: it fetches the app's action schemas
+together with its connected accounts and keeps both in ``TOOL_REGISTRY_PATH``
+for ``TOOL_REGISTRY_TTL_SECONDS``. Graph builds and connection checks, in
+every process of the host, read that file and only go back to Composio once
+it is stale. If that refresh fails, the stale copy is used.
+
+Tools built from cached schemas call ``ComposioToolSet.execute_action``; the
+toolset is created at the first tool call, not at graph build.
+
+Offline (``COMPOSIO_OFFLINE``, or no ``COMPOSIO_API_KEY``) nothing is
+fetched. The tools come from the cached schemas or, without a cache, from a
+local stub of ``COMPOSIO_LINKEDIN_TOOL`` with the publisher chain's schema, so
+the graph still builds and runs. Offline tool calls return a failed result;
+nothing is published.
+
+    python -m linkedin_news_post.tool_registry refresh
+    python -m linkedin_news_post.tool_registry status
+"""
+import argparse
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from linkedin_news_post.config import (
+    COMPOSIO_LINKEDIN_APP,
+    COMPOSIO_LINKEDIN_TOOL,
+    COMPOSIO_OFFLINE,
+    TOOL_REGISTRY_PATH,
+    TOOL_REGISTRY_TTL_SECONDS,
+    logger,
+)
+from linkedin_news_post.metrics import REGISTRY
+
+# Connection states
+ACTIVE, MISSING, UNKNOWN = "active", "missing", "unknown"
+
+
+@dataclass
+class ToolSnapshot:
+    """Tool schemas and connection status of one app, as fetched at ``fetched_at``."""
+    app: str
+    fetched_at: float
+    schemas: List[Dict[str, Any]]
+    connection: str = UNKNOWN
+    accounts: List[Dict[str, Any]] = field(default_factory=list)
+    stub: bool = False
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def connected(self) -> bool:
+        return self.connection == ACTIVE
+
+
+def stub_snapshot(app: str = COMPOSIO_LINKEDIN_APP) -> ToolSnapshot:
+    """The post tool alone, with the schema the publisher chain binds to the model."""
+    from linkedin_news_post.chains.publisher_chain import LINKEDIN_CREATE_LINKED_IN_POST
+
+    schema = {
+        "name": COMPOSIO_LINKEDIN_TOOL,
+        "description": "Create a LinkedIn post (local stub of the Composio action)",
+        "parameters": LINKEDIN_CREATE_LINKED_IN_POST.model_json_schema(),
+    }
+    return ToolSnapshot(app, time.time(), [schema], stub=True)
+
+
+class ToolRegistry:
+    """
+    Composio tool schemas and connection status, cached on disk.
+
+    Args:
+        path: JSON file holding the cached snapshot
+        ttl: Seconds a snapshot stays fresh
+        app: Composio app whose tools are registered
+        api_key: Composio API key, by default ``COMPOSIO_API_KEY``
+        offline: Never call Composio (also implied by a missing API key)
+    """
+
+    def __init__(
+        self,
+        path: str = TOOL_REGISTRY_PATH,
+        ttl: float = TOOL_REGISTRY_TTL_SECONDS,
+        app: str = COMPOSIO_LINKEDIN_APP,
+        api_key: Optional[str] = None,
+        offline: bool = COMPOSIO_OFFLINE,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.app = app
+        self.api_key = api_key or os.getenv("COMPOSIO_API_KEY")
+        self.offline = offline or not self.api_key
+        self._snapshot: Optional[ToolSnapshot] = None
+        self._toolset = None
+        self._lock = threading.Lock()
+
+    def toolset(self):
+        with self._lock:
+            if self._toolset is None:
+                from composio_langchain import ComposioToolSet
+
+                self._toolset = ComposioToolSet(api_key=self.api_key)
+            return self._toolset
+
+    def load(self) -> Optional[ToolSnapshot]:
+        """The snapshot on disk, or None if there is none for this app."""
+        try:
+            with open(self.path) as f:
+                snapshot = ToolSnapshot(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable tool registry {self.path}: {e}")
+            return None
+        return snapshot if snapshot.app == self.app else None
+
+    def save(self, snapshot: ToolSnapshot) -> None:
+        # Write then rename, so concurrent readers never see half a file
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(asdict(snapshot), f, indent=2)
+        os.replace(tmp, self.path)
+
+    def fetch(self) -> ToolSnapshot:
+        """Fetch the app's action schemas and connected accounts from Composio."""
+        from linkedin_news_post.resilience import resilient
+
+        toolset = self.toolset()
+        accounts = [
+            {"id": a.id, "status": a.status, "entity_id": a.entityId, "updated_at": a.updatedAt}
+            for a in resilient(toolset.get_connected_accounts, "composio", idempotent=True)()
+            if (a.appName or "").lower() == self.app.lower()
+        ]
+        # Schemas are cached even without a connection, so the graph can build once one exists
+        actions = resilient(toolset.get_action_schemas, "composio", idempotent=True)(
+            apps=[self.app], check_connected_accounts=False
+        )
+        schemas = [
+            {key: schema[key] for key in ("name", "description", "parameters")}
+            for schema in (action.model_dump(exclude_none=True) for action in actions)
+        ]
+        connection = ACTIVE if any(a["status"] == "ACTIVE" for a in accounts) else MISSING
+        return ToolSnapshot(self.app, time.time(), schemas, connection, accounts)
+
+    def refresh(self) -> ToolSnapshot:
+        """Fetch from Composio now and replace the cached snapshot."""
+        if self.offline:
+            raise RuntimeError("Cannot refresh the tool registry offline (COMPOSIO_OFFLINE or no COMPOSIO_API_KEY)")
+        try:
+            snapshot = self.fetch()
+        except Exception:
+            REGISTRY.inc("tool_registry_fetches_total", help="Composio tool registry fetches", outcome="error")
+            raise
+        REGISTRY.inc("tool_registry_fetches_total", help="Composio tool registry fetches", outcome="ok")
+        self.save(snapshot)
+        self._snapshot = snapshot
+        logger.info(
+            f"Tool registry refreshed: {len(snapshot.schemas)} {self.app} tools, connection {snapshot.connection}"
+        )
+        return snapshot
+
+    def snapshot(self) -> ToolSnapshot:
+        """
+        The cached snapshot, refreshed first if it is stale and Composio is reachable.
+
+        Offline, or when the refresh fails, a stale snapshot is returned as is;
+        offline without any cache, the stub.
+
+        Raises:
+            Exception: The refresh's error, when online with nothing cached
+        """
+        cached = self._snapshot or self.load()
+        if cached is not None and (self.offline or cached.age < self.ttl):
+            source = "cache"
+        elif self.offline:
+            cached, source = stub_snapshot(self.app), "stub"
+        else:
+            try:
+                cached, source = self.refresh(), "composio"
+            except Exception as e:
+                if cached is None:
+                    raise
+                logger.warning(f"Tool registry refresh failed ({e}); using the copy from {cached.age / 3600:.1f}h ago")
+                source = "stale"
+        REGISTRY.inc("tool_registry_lookups_total", help="Tool registry lookups by where they were answered", source=source)
+        self._snapshot = cached
+        return cached
+
+    def _execute(self, action: str, **params) -> Dict[str, Any]:
+        if self.offline:
+            # The same shape as a failed Composio action, so the graph reports it rather than crashing
+            return {"successful": False, "data": None, "error": f"{action} not run: Composio is offline"}
+        return self.toolset().execute_action(action=action, params=params)
+
+    def tools(self) -> List[Any]:
+        """LangChain tools built from the snapshot, falling back to the stub if nothing can be fetched."""
+        from langchain_core.tools import StructuredTool
+
+        try:
+            snapshot = self.snapshot()
+        except Exception as e:
+            logger.error(f"Failed to get tools for app '{self.app}': {e}; using the local stub", exc_info=True)
+            snapshot = stub_snapshot(self.app)
+        if not snapshot.connected and not snapshot.stub:
+            logger.warning(f"No active Composio connection for {self.app}; tool calls will fail")
+        return [
+            StructuredTool(
+                name=schema["name"],
+                description=schema["description"],
+                args_schema=schema["parameters"],
+                func=functools.partial(self._execute, schema["name"]),
+            )
+            for schema in snapshot.schemas
+        ]
+
+
+def describe(snapshot: ToolSnapshot) -> str:
+    origin = "local stub" if snapshot.stub else f"fetched {snapshot.age / 3600:.1f}h ago"
+    names = ", ".join(schema["name"] for schema in snapshot.schemas) or "none"
+    return f"{snapshot.app}: connection {snapshot.connection}, {origin}; tools: {names}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Show or refresh the cached Composio tool schemas and connection.")
+    parser.add_argument("command", choices=("status", "refresh"), nargs="?", default="status")
+    parser.add_argument("--path", default=TOOL_REGISTRY_PATH)
+    args = parser.parse_args(argv)
+
+    registry = ToolRegistry(args.path)
+    try:
+        snapshot = registry.refresh() if args.command == "refresh" else registry.snapshot()
+    except Exception as e:
+        logger.error(f"Tool registry {args.command} failed: {e}")
+        return 1
+    print(describe(snapshot))
+    return 0 if snapshot.connected or registry.offline else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
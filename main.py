@@ -1,76 +1,165 @@
+import argparse
 import asyncio
-import os               # Added import
 import sys              # Added import
 from dotenv import load_dotenv # Added import
-from composio_langchain import ComposioToolSet, App # Added import
 
+from linkedin_news_post import clients
+from linkedin_news_post.cassette import Cassette
+from linkedin_news_post.config import RUN_CONCURRENCY
 from linkedin_news_post.graph import make_graph
+from linkedin_news_post.metrics import format_report, set_export_dir, track_run
+from linkedin_news_post.runner import DEFAULT_INPUT, run_posts, run_tenant_batch
+from linkedin_news_post.runtime import release_search_window, with_search_window
+from linkedin_news_post.streaming import STREAM_MODES, format_event, stream_graph, stream_run
+from linkedin_news_post.tenants import load_tenants
 
 
-# Define the check function (adapted from previous attempt in run_app.py)
 def check_composio_connection():
-    """Check if the Composio LinkedIn connection is active."""
+    """Check the Composio LinkedIn connection, from the tool registry's cache while it is fresh."""
     print("Checking Composio LinkedIn connection...")
-    try:
-        # Ensure COMPOSIO_API_KEY is set (should be loaded by load_dotenv)
-        api_key = os.getenv("COMPOSIO_API_KEY")
-        if not api_key:
-             print("[ERROR] COMPOSIO_API_KEY environment variable not set.")
-             print("Please set your Composio API key in the .env file and try again.")
-             return False
-
-        # Pass the API key explicitly if needed, though ToolSet might pick it up from env
-        composio_toolset = ComposioToolSet(api_key=api_key)
-        # Attempt to get tools for LinkedIn. This implicitly checks the connection.
-        # Use App.LINKEDIN (adjust if Composio uses a different enum name)
-        tools = composio_toolset.get_tools(apps=[App.LINKEDIN])
-        if not tools:
-             print("[WARN] Composio returned no tools for LinkedIn, but no error. Connection might be present but inactive or misconfigured.")
-             print("[INFO] Proceeding, but verify LinkedIn connection in Composio dashboard if issues arise.")
-             # Consider returning False here if having tools is strictly required for the app to function.
-             return True
-
-        print("[INFO] Composio LinkedIn connection appears active.")
+    registry = clients.get_tool_registry()
+    if registry.offline:
+        print("[WARN] Composio is offline (COMPOSIO_OFFLINE or no COMPOSIO_API_KEY); posts will not be published.")
         return True
+    try:
+        snapshot = registry.snapshot()
     except Exception as e:
-        error_message = str(e)
-        # Check for the specific connection error message
-        if "Could not find a connection" in error_message or "No active connection found" in error_message:
-            print("\n[ERROR] Active Composio connection for LinkedIn not found.")
-            print("Please set up the connection using the Composio CLI:")
-            print("  1. Log in: `composio login`")
-            print("  2. Add LinkedIn: `composio add linkedin` (and complete browser authorization)")
-            print("Exiting application.\n")
-            return False
-        else:
-            # Handle other potential errors during tool retrieval
-            print(f"[ERROR] Failed to check Composio connection: {error_message}")
-            print("Please ensure your Composio API key is correct and Composio services are reachable.")
-            return False
+        print(f"[ERROR] Failed to check Composio connection: {e}")
+        print("Please ensure your Composio API key is correct and Composio services are reachable.")
+        return False
+    if not snapshot.connected:
+        print("\n[ERROR] Active Composio connection for LinkedIn not found.")
+        print("Please set up the connection using the Composio CLI:")
+        print("  1. Log in: `composio login`")
+        print("  2. Add LinkedIn: `composio add linkedin` (and complete browser authorization)")
+        print("  3. Refresh the cached status: `python -m linkedin_news_post.tool_registry refresh`")
+        print("Exiting application.\n")
+        return False
+    if not snapshot.schemas:
+        print("[WARN] Composio returned no tools for LinkedIn. Verify the connection in the Composio dashboard if issues arise.")
+    print(f"[INFO] Composio LinkedIn connection is active (checked {snapshot.age / 60:.0f} min ago).")
+    return True
 
 async def run_graph():
     # The connection check is now done before this function is called
     async with make_graph() as graph:
         print("[INFO] Invoking LangGraph...") # Added info message
-        await graph.ainvoke({"messages": [
-            ("user", "Publish a linkedin article")
-        ]})
+        config, claimed = with_search_window(None)
+        try:
+            with track_run() as run_metrics:
+                await graph.ainvoke({"messages": [
+                    ("user", "Publish a linkedin article")
+                ]}, config=config)
+        except Exception:
+            if claimed is not None:
+                release_search_window(config, claimed)
+            raise
         print("[INFO] LangGraph invocation complete.") # Added info message
+        print(format_report(run_metrics.summary()))
+
+
+async def _print_events(graph, config):
+    in_tokens = False
+    async for event in stream_run(graph, DEFAULT_INPUT, config):
+        if event.kind == "token":
+            print(format_event(event), end="", flush=True)
+            in_tokens = True
+            continue
+        if in_tokens:
+            print()
+            in_tokens = False
+        print(format_event(event))
+
+
+async def run_graph_streaming(stream_mode="events"):
+    """Run the graph once, printing progress as it happens."""
+    async with make_graph() as graph:
+        print(f"[INFO] Streaming LangGraph run ({stream_mode})...")
+        config, claimed = with_search_window(None)
+        try:
+            with track_run() as run_metrics:
+                if stream_mode == "events":
+                    await _print_events(graph, config)
+                else:
+                    async for chunk in stream_graph(graph, DEFAULT_INPUT, config, stream_mode=stream_mode):
+                        print(chunk)
+        except Exception:
+            if claimed is not None:
+                release_search_window(config, claimed)
+            raise
+        print(format_report(run_metrics.summary()))
+
+
+async def run_many(runs, concurrency):
+    """Generate several posts concurrently on one event loop."""
+    print(f"[INFO] Invoking LangGraph {runs} times with concurrency {concurrency}...")
+    results = await run_posts(runs, concurrency)
+    failed = [r for r in results if isinstance(r, Exception)]
+    print(f"[INFO] {runs - len(failed)} of {runs} runs completed successfully.")
+    if failed:
+        raise RuntimeError(f"{len(failed)} runs failed; first error: {failed[0]}")
+
+
+async def run_for_tenants(path, concurrency):
+    """Generate posts for every tenant in a JSON tenants file."""
+    tenants = load_tenants(path)
+    print(f"[INFO] Invoking LangGraph for {len(tenants)} tenants with concurrency {concurrency}...")
+    results = await run_tenant_batch(tenants, concurrency)
+    failures = 0
+    for tenant_id, runs in results.items():
+        failed = [r for r in runs if isinstance(r, Exception)]
+        failures += len(failed)
+        print(f"[INFO] Tenant {tenant_id}: {len(runs) - len(failed)} of {len(runs)} runs completed successfully.")
+    if failures:
+        raise RuntimeError(f"{failures} tenant runs failed")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate and publish LinkedIn posts.")
+    parser.add_argument("--runs", type=int, default=1, help="Number of independent posts to generate")
+    parser.add_argument("--concurrency", type=int, default=RUN_CONCURRENCY, help="Maximum runs executing at once")
+    parser.add_argument(
+        "--stream", nargs="?", const="events", choices=STREAM_MODES,
+        help="Stream progress while running: node events with timings and writer tokens (default), or a LangGraph stream mode"
+    )
+    parser.add_argument("--metrics-dir", help="Write a JSON metrics summary per run and a Prometheus snapshot to this directory")
+    parser.add_argument("--tenants", help="JSON file with a list of tenant configs to run as one batch")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="PATH", help="Record every model, search, embedding and tool call to this cassette")
+    cassette.add_argument("--replay", metavar="PATH", help="Replay a recorded cassette offline instead of calling live services")
+    parser.add_argument("--realtime", action="store_true", help="When replaying, wait for each call's recorded duration")
+    args = parser.parse_args()
+    if args.stream and (args.runs > 1 or args.tenants):
+        parser.error("--stream follows a single run and cannot be combined with --runs or --tenants")
+    return args
 
 
 # --- Main execution block ---
 if __name__ == "__main__":
+    args = parse_args()
+    if args.metrics_dir:
+        set_export_dir(args.metrics_dir)
+    if args.record or args.replay:
+        clients.override("cassette", Cassette(args.record or args.replay, "record" if args.record else "replay", args.realtime))
+
     # Load environment variables from .env file first
     load_dotenv()
     print("[INFO] Loaded environment variables from .env file.")
 
-    # Perform Composio connection check
-    if not check_composio_connection():
+    # Perform Composio connection check (replayed runs never reach Composio)
+    if not args.replay and not check_composio_connection():
         sys.exit(1) # Exit if connection check fails
 
     # Run the main async function
     try:
-        asyncio.run(run_graph())
+        if args.tenants:
+            asyncio.run(run_for_tenants(args.tenants, args.concurrency))
+        elif args.runs > 1:
+            asyncio.run(run_many(args.runs, args.concurrency))
+        elif args.stream:
+            asyncio.run(run_graph_streaming(args.stream))
+        else:
+            asyncio.run(run_graph())
     except Exception as e:
         print(f"[ERROR] An error occurred during graph execution: {e}")
         sys.exit(1)
\ No newline at end of file
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Script to run the MCP server as a module.
+
+Arguments are passed on to the server, e.g. ``--transport sse --port 8000``.
 """
 
 import os
@@ -17,7 +19,7 @@ def main():
     
     # Run the MCP server as a module
     subprocess.run(
-        ["python", "-m", "linkedin_news_post.mcp_server"],
+        ["python", "-m", "linkedin_news_post.mcp_server", *sys.argv[1:]],
         env=env,
         cwd=current_dir,
     )
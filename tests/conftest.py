@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_news_post import clients  # noqa: E402
+
+
+@pytest.fixture
+def fresh_clients():
+    """Drop every cached client before and after the test."""
+    clients.reset()
+    yield clients
+    clients.reset()
@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.types import Command
+
+from linkedin_news_post.budget import (
+    RunBudget, approved_draft, exhausted, get_run_budget, is_approval, measure_usage, quality_rejections
+)
+from linkedin_news_post.chains.quality_chain import parse_verdict, verdict_message
+from linkedin_news_post.config import COMPOSIO_LINKEDIN_TOOL
+from linkedin_news_post.metrics import _record_call, instrument_node
+from linkedin_news_post.state import merge_usage
+
+
+def quality(content):
+    return HumanMessage(content=content, name="quality_node")
+
+
+def writer(content):
+    return AIMessage(content=content, name="writer_node")
+
+
+@pytest.mark.parametrize("reply, approved", [
+    ("APPROVE: it covers a new EASA rule.", True),
+    ("Approved: the article offers a new angle.", True),
+    ("**Approve** - distinct news", True),
+    ("REJECT: same FAA directive as a past article.", False),
+    ("Rejected: same news.", False),
+    ("Not ready for approval: the hook is weak.", None),
+    ("The draft needs work before I can approve it.", None),
+    ("", None),
+])
+def test_parse_verdict(reply, approved):
+    assert parse_verdict(reply)[0] is approved
+
+
+@pytest.mark.parametrize("reply", [
+    "Not ready for approval: the hook is weak.",
+    "The draft needs work before I can approve it.",
+    "REJECT: same FAA directive.",
+])
+def test_replies_without_an_approve_verdict_are_rejections(reply):
+    message = verdict_message(reply)
+    assert message.startswith("Rejected:")
+    assert not is_approval(message)
+
+
+def test_approve_verdict_is_an_approval():
+    assert is_approval(verdict_message("APPROVE: new angle on predictive maintenance"))
+
+
+def test_quality_rejections_counts_only_rejected_verdicts():
+    messages = [
+        writer("draft 1"),
+        quality(verdict_message("Not ready for approval: the hook is weak.")),
+        writer("draft 2"),
+        quality("Error checking article uniqueness: timeout."),
+        writer("draft 3"),
+        quality(verdict_message("REJECT: same FAA directive.")),
+        writer("draft 4"),
+        quality(verdict_message("APPROVE: distinct news")),
+    ]
+    assert quality_rejections(messages) == 2
+
+
+def test_approved_draft_ignores_a_rejected_latest_check():
+    messages = [
+        writer("draft 1"),
+        quality(verdict_message("APPROVE: distinct")),
+        writer("draft 2"),
+        quality(verdict_message("The draft needs work before I can approve it.")),
+    ]
+    assert approved_draft(messages) is None
+
+
+def test_approved_draft_returns_the_last_draft_and_whether_it_was_published():
+    messages = [writer("draft 1"), writer("draft 2"), quality(verdict_message("APPROVE: distinct"))]
+    assert approved_draft(messages) == {"draft": "draft 2", "published": False}
+
+    messages.append(ToolMessage(content="{}", tool_call_id="1", name=COMPOSIO_LINKEDIN_TOOL))
+    assert approved_draft(messages)["published"] is True
+
+
+@pytest.mark.parametrize("result", [
+    ToolMessage(content="[]", tool_call_id="1", name="search_and_content"),
+    ToolMessage(content='{"successful": false, "data": null, "error": "offline"}', tool_call_id="1", name=COMPOSIO_LINKEDIN_TOOL),
+    ToolMessage(content='{"data": null, "error": "401 Unauthorized"}', tool_call_id="1", name=COMPOSIO_LINKEDIN_TOOL),
+    ToolMessage(content="Error: ValueError('bad request')", tool_call_id="1", name=COMPOSIO_LINKEDIN_TOOL),
+    ToolMessage(content='{"successful": true}', tool_call_id="1", name=COMPOSIO_LINKEDIN_TOOL, status="error"),
+])
+def test_approved_draft_is_not_published_by_other_tools_or_failed_posts(result):
+    messages = [writer("draft 1"), quality(verdict_message("APPROVE: distinct")), result]
+    assert approved_draft(messages)["published"] is False
+
+
+def test_exhausted_reports_the_first_limit_reached():
+    budget = RunBudget(max_node_visits=10, max_tokens=1000, max_seconds=60, max_cost_usd=1.0, max_quality_rejections=2)
+    assert exhausted(budget, {"node_visits": 9, "tokens": 999, "quality_rejections": 1}) is None
+    assert exhausted(budget, {"node_visits": 3, "tokens": 1200, "quality_rejections": 2}) == "tokens 1200/1000"
+
+
+def test_get_run_budget_reads_overrides_from_the_config():
+    budget = get_run_budget({"configurable": {"max_tokens": 500, "max_seconds": None}})
+    assert budget.max_tokens == 500
+    assert budget.max_seconds == RunBudget().max_seconds
+
+
+def test_merge_usage_adds_up_nodes_and_keeps_the_earliest_start():
+    first = {"node_visits": 1, "tokens": 100, "cost_usd": 0.01, "started_at": 200.0}
+    second = {"node_visits": 1, "tokens": 50, "cost_usd": 0.02, "started_at": 100.0}
+    merged = merge_usage(merge_usage({}, first), second)
+    assert merged == {"node_visits": 2, "tokens": 150, "cost_usd": pytest.approx(0.03), "started_at": 100.0}
+    assert merge_usage(None, None)["started_at"] is None
+
+
+def test_instrumented_nodes_report_their_usage_in_the_update():
+    def writer_node(state):
+        _record_call("llm", "model", 0.1, None, prompt_tokens=30, completion_tokens=20, cost=0.5)
+        return {"messages": []}
+
+    async def supervisor_node(state):
+        return Command(goto="writer_node")
+
+    update = instrument_node(writer_node)({})
+    assert update["run_usage"]["node_visits"] == 1
+    assert update["run_usage"]["tokens"] == 50
+    assert update["run_usage"]["cost_usd"] == 0.5
+    command = asyncio.run(instrument_node(supervisor_node)({}))
+    assert command.goto == "writer_node"
+    assert command.update["run_usage"]["tokens"] == 0
+
+
+def test_measure_usage_reads_the_usage_in_state_without_a_tracked_run():
+    run_usage = {"node_visits": 4, "tokens": 1200, "cost_usd": 0.25, "started_at": time.time() - 90}
+    usage = measure_usage([quality("Rejected: same news.")], run_usage)
+    assert usage["node_visits"] == 4
+    assert usage["tokens"] == 1200
+    assert usage["cost_usd"] == 0.25
+    assert usage["seconds"] >= 90
+    assert usage["quality_rejections"] == 1
+    assert exhausted(RunBudget(max_tokens=1000), usage) == "tokens 1200/1000"
+
+
+def test_measure_usage_counts_named_messages_without_usage_in_state():
+    usage = measure_usage([writer("draft"), quality("Approved: new."), HumanMessage(content="hi")])
+    assert usage == {"quality_rejections": 0, "node_visits": 2}
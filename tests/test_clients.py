@@ -0,0 +1,64 @@
+import pymongo
+import pytest
+
+from linkedin_news_post.response_cache import MongoResponseCache, SQLiteResponseCache
+
+
+class FakeCollection:
+    def __init__(self):
+        self.indexes = []
+
+    def create_index(self, key, **options):
+        self.indexes.append(key)
+
+
+class FakeMongoClient:
+    def __init__(self, url):
+        self.url = url
+        self.collections = {}
+
+    def __getitem__(self, db_name):
+        return _FakeDatabase(self, db_name)
+
+
+class _FakeDatabase:
+    def __init__(self, client, name):
+        self.client, self.name = client, name
+
+    def __getitem__(self, collection_name):
+        return self.client.collections.setdefault((self.name, collection_name), FakeCollection())
+
+
+@pytest.fixture
+def response_cache_settings(fresh_clients, monkeypatch):
+    fresh_clients.override("cassette", None)
+    monkeypatch.setattr(fresh_clients, "RESPONSE_CACHE_CHAINS", ["supervisor_chain"])
+    return fresh_clients
+
+
+def test_mongo_response_cache_is_built_from_the_registry(response_cache_settings, monkeypatch):
+    monkeypatch.setattr(pymongo, "MongoClient", FakeMongoClient)
+    monkeypatch.setattr(response_cache_settings, "RESPONSE_CACHE_BACKEND", "mongo")
+    monkeypatch.setattr(response_cache_settings, "MONGODB_URI", "mongodb://cache.invalid")
+    monkeypatch.setattr(response_cache_settings, "DB_NAME", "db")
+    monkeypatch.setattr(response_cache_settings, "RESPONSE_CACHE_COLLECTION", "responses")
+
+    cache = response_cache_settings.get("response_cache")
+
+    assert isinstance(cache, MongoResponseCache)
+    assert cache._collection.indexes == ["expires", "accessed"]
+
+
+def test_mongo_response_cache_needs_a_uri(response_cache_settings, monkeypatch):
+    monkeypatch.setattr(response_cache_settings, "RESPONSE_CACHE_BACKEND", "mongo")
+    monkeypatch.setattr(response_cache_settings, "MONGODB_URI", None)
+
+    with pytest.raises(ValueError):
+        response_cache_settings.get("response_cache")
+
+
+def test_sqlite_response_cache_is_built_from_the_registry(response_cache_settings, monkeypatch, tmp_path):
+    monkeypatch.setattr(response_cache_settings, "RESPONSE_CACHE_BACKEND", "sqlite")
+    monkeypatch.setattr(response_cache_settings, "RESPONSE_CACHE_PATH", str(tmp_path / "responses.sqlite"))
+
+    assert isinstance(response_cache_settings.get("response_cache"), SQLiteResponseCache)
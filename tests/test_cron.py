@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import pytest
+
+from linkedin_news_post.cron import CronSchedule
+
+
+def test_parse_expands_lists_ranges_and_steps():
+    schedule = CronSchedule.parse("*/15 9-17/4 1,15 * *")
+    assert schedule.minutes == {0, 15, 30, 45}
+    assert schedule.hours == {9, 13, 17}
+    assert schedule.days == {1, 15}
+    assert schedule.months == set(range(1, 13))
+
+
+def test_parse_steps_from_a_single_value():
+    assert CronSchedule.parse("5/20 * * * *").minutes == {5, 25, 45}
+
+
+def test_parse_accepts_month_and_weekday_names():
+    schedule = CronSchedule.parse("0 9 * JAN-mar mon,Fri")
+    assert schedule.months == {1, 2, 3}
+    assert schedule.weekdays == {1, 5}
+
+
+def test_sunday_is_zero_or_seven():
+    assert CronSchedule.parse("0 9 * * 7").weekdays == {0}
+    assert CronSchedule.parse("0 9 * * 5-7").weekdays == {5, 6, 0}
+
+
+@pytest.mark.parametrize("expression", [
+    "* * * *",
+    "60 * * * *",
+    "* 24 * * *",
+    "* * 0 * *",
+    "* * * 13 *",
+    "* * * * 8",
+    "*/0 * * * *",
+    "10-5 * * * *",
+    "* * * foo *",
+])
+def test_parse_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule.parse(expression)
+
+
+def test_next_after_is_strictly_later():
+    schedule = CronSchedule.parse("30 9 * * *")
+    assert schedule.next_after(datetime(2026, 10, 1, 9, 30)) == datetime(2026, 10, 2, 9, 30)
+    assert schedule.next_after(datetime(2026, 10, 1, 9, 29, 59)) == datetime(2026, 10, 1, 9, 30)
+
+
+def test_next_after_rolls_over_months_and_years():
+    schedule = CronSchedule.parse("0 0 1 jan *")
+    assert schedule.next_after(datetime(2026, 10, 1, 12)) == datetime(2027, 1, 1)
+
+
+def test_restricted_day_fields_match_if_either_matches():
+    # The 13th of the month or any Friday; 2026-10-02 and 2026-10-09 are Fridays
+    schedule = CronSchedule.parse("0 9 13 * fri")
+    assert schedule.next_after(datetime(2026, 10, 1, 10)) == datetime(2026, 10, 2, 9)
+    assert schedule.next_after(datetime(2026, 10, 9, 10)) == datetime(2026, 10, 13, 9)
+
+
+def test_a_wildcard_day_field_defers_to_the_other():
+    # Fridays only: "*" in day of month does not match every day
+    assert CronSchedule.parse("0 9 * * fri").next_after(datetime(2026, 10, 3)) == datetime(2026, 10, 9, 9)
+    # The 13th only: "*" in day of week does not match every day
+    assert CronSchedule.parse("0 9 13 * *").next_after(datetime(2026, 10, 3)) == datetime(2026, 10, 13, 9)
+
+
+def test_next_after_raises_when_nothing_ever_matches():
+    with pytest.raises(ValueError):
+        CronSchedule.parse("0 0 31 feb *").next_after(datetime(2026, 1, 1))
@@ -0,0 +1,50 @@
+import pytest
+from starlette.testclient import TestClient
+
+from linkedin_news_post.daemon import PostDaemon, parse_job_request
+from linkedin_news_post.tenants import TenantConfig
+
+
+@pytest.fixture
+def client():
+    daemon = PostDaemon([TenantConfig(tenant_id="acme", organization_urn="urn:li:organization:1")], queue_size=5)
+    return TestClient(daemon.api())
+
+
+def test_submit_queues_the_requested_runs(client):
+    response = client.post("/jobs", json={"tenant_id": "acme", "runs": 2})
+    assert response.status_code == 202
+    assert [job["tenant_id"] for job in response.json()] == ["acme", "acme"]
+    assert client.get("/health").json()["queued"] == 2
+
+
+def test_submit_without_a_body_queues_one_default_run(client):
+    response = client.post("/jobs")
+    assert response.status_code == 202
+    assert [job["tenant_id"] for job in response.json()] == [None]
+
+
+@pytest.mark.parametrize("content", [
+    "[1, 2]",
+    "not json",
+    '{"runs": "many"}',
+    '{"runs": 0}',
+    '{"runs": -3}',
+    '{"runs": 1.5}',
+    '{"runs": true}',
+    '{"tenant_id": ["acme"]}',
+])
+def test_submit_rejects_malformed_requests(client, content):
+    response = client.post("/jobs", content=content, headers={"content-type": "application/json"})
+    assert response.status_code == 400
+    assert "error" in response.json()
+    assert client.get("/health").json()["queued"] == 0
+
+
+def test_submit_reports_unknown_tenants_and_a_full_queue(client):
+    assert client.post("/jobs", json={"tenant_id": "globex"}).status_code == 404
+    assert client.post("/jobs", json={"runs": 6}).status_code == 503
+
+
+def test_parse_job_request_accepts_integer_strings():
+    assert parse_job_request({"runs": "3"}) == (None, 3)
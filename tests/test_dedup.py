@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from linkedin_news_post.dedup import (
+    canonical_url, cluster_near_duplicates, collapse_near_duplicates, minhash_signatures
+)
+
+STORY = (
+    "The European Union Aviation Safety Agency has proposed new rules for the certification of "
+    "electric vertical takeoff aircraft, setting noise and battery safety limits for air taxis "
+    "that could begin passenger service in Paris and Milan within two years"
+)
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.example.com/news/easa-evtol?utm_source=x&fbclid=abc",
+    "http://m.example.com/news/easa-evtol/amp",
+    "https://example.com/news/easa-evtol/#comments",
+    "HTTPS://WWW.EXAMPLE.COM/news/easa-evtol/index.html",
+])
+def test_canonical_url_merges_tracking_mobile_and_amp_variants(url):
+    assert canonical_url(url) == "https://example.com/news/easa-evtol"
+
+
+def test_canonical_url_keeps_meaningful_query_parameters_in_order():
+    assert canonical_url("https://example.com/a?page=2&id=7&utm_medium=mail") == "https://example.com/a?id=7&page=2"
+    assert canonical_url("") == ""
+
+
+def test_identical_texts_have_identical_signatures():
+    signatures = minhash_signatures([STORY, STORY.upper(), "Boeing delivers 40 jets"])
+    assert signatures.shape[0] == 3
+    assert np.array_equal(signatures[0], signatures[1])
+    assert not np.array_equal(signatures[0], signatures[2])
+
+
+def test_syndicated_rewordings_are_clustered():
+    reworded = STORY.replace("has proposed", "proposed").replace("within two years", "in about two years")
+    other = (
+        "Boeing delivered forty commercial jets in September as production of the 737 MAX recovered "
+        "after the FAA lifted its cap on the monthly output of the narrowbody line in Renton"
+    )
+    assert cluster_near_duplicates([STORY, other, reworded]) == [0, 1, 0]
+
+
+def test_clusters_are_transitive():
+    a = STORY
+    b = STORY + " according to the agency"
+    c = b + " in a statement on Monday"
+    labels = cluster_near_duplicates([c, "unrelated short text", a, b], threshold=0.8)
+    assert labels[0] == labels[2] == labels[3] == 0
+    assert labels[1] == 1
+
+
+def test_empty_and_single_word_texts_never_match_others():
+    assert cluster_near_duplicates(["", "", "word", STORY]) == [0, 1, 2, 3]
+
+
+def test_collapse_keeps_the_best_result_with_the_cluster_queries_and_sources():
+    results = [
+        {"url": "https://a.com/1", "title": "EASA", "text": STORY, "score": 0.4, "queries": ["easa"]},
+        {"url": "https://b.com/2", "title": "EASA", "text": STORY + " today", "score": 0.9, "queries": ["evtol"]},
+        {"url": "https://c.com/3", "title": "Boeing", "text": "Boeing delivered forty jets", "score": 0.5, "queries": ["boeing"]},
+    ]
+    collapsed = collapse_near_duplicates(results)
+    assert [r["url"] for r in collapsed] == ["https://b.com/2", "https://c.com/3"]
+    assert collapsed[0]["queries"] == ["easa", "evtol"]
+    assert collapsed[0]["sources"] == 2
+    assert collapsed[1]["sources"] == 1
@@ -0,0 +1,31 @@
+import asyncio
+import json
+import threading
+
+from linkedin_news_post import mcp_server
+from linkedin_news_post.news_corpus import NewsCorpus
+
+
+def test_search_corpus_queries_the_corpus_off_the_event_loop(fresh_clients, tmp_path):
+    corpus = NewsCorpus(str(tmp_path / "corpus.sqlite"))
+    corpus.add([{
+        "url": "https://news.example/easa", "title": "EASA proposes eVTOL rules", "published_date": "2026-10-01",
+        "author": None, "text": "EASA proposed certification rules for air taxis.", "score": 0.9,
+    }], "easa evtol")
+    loop_threads = []
+    search = corpus.search
+
+    def recording_search(*args, **kwargs):
+        loop_threads.append(threading.current_thread() is threading.main_thread())
+        return search(*args, **kwargs)
+
+    corpus.search = recording_search
+    fresh_clients.override("news_corpus", corpus)
+
+    async def call():
+        return await mcp_server.mcp.call_tool("search_corpus", {"query": "EASA eVTOL"})
+
+    payload = json.loads(asyncio.run(call())[0].text)
+    assert [result["url"] for result in payload["results"]] == ["https://news.example/easa"]
+    assert payload["corpus"]["articles"] == 1
+    assert loop_threads == [False]
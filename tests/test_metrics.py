@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from typing import Any, List
+
+import httpx
+import openai
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from linkedin_news_post.metrics import METRICS_CALLBACK, REGISTRY, MetricsRegistry, track_run
+from linkedin_news_post.resilience import CallPolicy, resilient, retrying_model
+
+
+class FlakyChatModel(BaseChatModel):
+    """Fails with the given errors, one per call, then answers."""
+
+    errors: List[Any] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "flaky"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.errors:
+            raise self.errors.pop(0)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+
+def connection_error():
+    return openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    import tenacity.nap
+
+    monkeypatch.setattr(tenacity.nap, "time", SimpleNamespace(sleep=lambda seconds: None))
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+def counter(metric):
+    return REGISTRY._counters[metric]
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.inc("searches_total", help="Searches", query='say "hi"\\\nnow')
+    assert 'linkedin_news_post_searches_total{query="say \\"hi\\"\\\\\\nnow"} 1' in registry.prometheus_text()
+
+
+def test_llm_retries_and_errors_are_separate_series():
+    model = FlakyChatModel(errors=[connection_error()], callbacks=[METRICS_CALLBACK])
+    with track_run() as run:
+        assert retrying_model(model, CallPolicy(retries=2)).invoke("hi").content == "ok"
+    totals = run.summary()["dependencies"]["llm"]
+    assert (totals["calls"], totals["errors"], totals["retries"]) == (2, 1, 1)
+    assert sum(counter("call_retries_total").values()) == 1
+    assert sum(counter("call_errors_total").values()) == 1
+
+
+def test_the_last_failed_llm_attempt_is_an_error_but_not_a_retry():
+    model = FlakyChatModel(errors=[connection_error(), connection_error()], callbacks=[METRICS_CALLBACK])
+    with track_run() as run:
+        with pytest.raises(openai.APIConnectionError):
+            retrying_model(model, CallPolicy(retries=1)).invoke("hi")
+    totals = run.summary()["dependencies"]["llm"]
+    assert (totals["errors"], totals["retries"]) == (2, 1)
+
+
+def test_non_transient_llm_errors_are_not_retried():
+    model = FlakyChatModel(errors=[ValueError("bad request")], callbacks=[METRICS_CALLBACK])
+    with pytest.raises(ValueError):
+        retrying_model(model, CallPolicy(retries=2)).invoke("hi")
+    assert not counter("call_retries_total")
+
+
+def test_resilient_calls_count_their_retries():
+    attempts = []
+
+    def search():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("reset")
+        return "ok"
+
+    with track_run() as run:
+        assert resilient(search, "test-count", idempotent=True, policy=CallPolicy(retries=1, backoff_base=0))() == "ok"
+    assert run.summary()["dependencies"]["test-count"]["retries"] == 1
+    assert counter("call_retries_total") == {(("kind", "test-count"), ("name", "search")): 1}
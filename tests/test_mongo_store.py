@@ -0,0 +1,63 @@
+import pymongo
+import pytest
+
+from linkedin_news_post.mongo_store import MongoDBBaseStore
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction):
+        self.docs = sorted(self.docs, key=lambda doc: doc[key], reverse=direction == pymongo.DESCENDING)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    def __iter__(self):
+        return iter(self.docs)
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def create_index(self, key, **options):
+        pass
+
+    def find(self, query, projection=None):
+        return FakeCursor([
+            doc for doc in self.docs
+            if all(doc["namespace"][int(k.split(".")[1])] == v for k, v in query.items() if k.startswith("namespace."))
+        ])
+
+
+@pytest.fixture
+def store(monkeypatch):
+    # Two old articles about the query's topic, then newer unrelated ones
+    docs = [
+        {"namespace": ["articles"], "created": 1, "embedding": [1.0, 0.0]},
+        {"namespace": ["articles"], "created": 2, "embedding": [1.0, 0.1]},
+        {"namespace": ["articles"], "created": 3, "embedding": [0.0, 1.0]},
+        {"namespace": ["articles"], "created": 4, "embedding": [-1.0, 0.0]},
+        {"namespace": ["drafts"], "created": 5, "embedding": [1.0, 0.0]},
+    ]
+    collection = FakeCollection(docs)
+    monkeypatch.setattr(pymongo, "MongoClient", lambda url, **options: {"db": {"articles": collection}})
+    return MongoDBBaseStore("mongodb://store.invalid", "db", "articles", index_config={
+        "embed": lambda text: [1.0, 0.0], "embed_batch": lambda texts: [[1.0, 0.0] for _ in texts],
+    })
+
+
+def test_similarity_scores_match_the_atlas_cosine_scale(store):
+    assert store.similarity_scores(("articles",), ["easa"]) == pytest.approx([1.0])
+    assert store.similarity_scores(("missing",), ["easa", "faa"]) == [0.0, 0.0]
+    assert store.similarity_scores(("articles",), []) == []
+
+
+def test_similarity_scores_compare_only_the_most_recent_documents(store):
+    # The two newest articles are orthogonal to and opposite the text
+    assert store.similarity_scores(("articles",), ["easa"], max_stored=2) == pytest.approx([0.5])
+    assert store.similarity_scores(("articles",), ["easa"], max_stored=3) == pytest.approx([(1 + 1 / 1.01 ** 0.5) / 2])
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+
+from linkedin_news_post.chains.supervisor_chain import systemPrompt
+from linkedin_news_post.response_cache import (
+    ResponseCache, SQLiteResponseCache, cached_chain, prompt_variables, response_key
+)
+
+
+def supervisor_input(started_at, messages=("Publish a linkedin article",)):
+    return {
+        "messages": [HumanMessage(content=m) for m in messages],
+        "domain_focus": "Aviation maintenance",
+        "organization_urn": "urn:li:organization:1",
+        "research_pool": [{"url": f"https://news.example/{started_at}"}],
+        "run_usage": {"node_visits": 3, "tokens": 1200, "cost_usd": 0.01, "started_at": started_at},
+    }
+
+
+def test_keys_depend_only_on_the_prompt_variables():
+    variables = prompt_variables(systemPrompt | RunnableLambda(lambda value: value))
+    assert variables == ["domain_focus", "messages"]
+    first = response_key("supervisor_chain", {}, supervisor_input(time.time()), variables)
+    assert response_key("supervisor_chain", {}, supervisor_input(time.time() + 60), variables) == first
+    assert response_key("supervisor_chain", {}, supervisor_input(0, ("Another request",)), variables) != first
+
+
+def test_runs_with_the_same_messages_share_one_cached_response(tmp_path):
+    calls = []
+
+    def model(prompt_value):
+        calls.append(prompt_value)
+        return AIMessage(content="writer_node")
+
+    cache = SQLiteResponseCache(str(tmp_path / "responses.sqlite"), ttl_seconds=60, max_entries=10)
+    chain = cached_chain(systemPrompt | RunnableLambda(model), "supervisor_chain", cache, {"model": "fake"})
+    assert chain.invoke(supervisor_input(100.0)).content == "writer_node"
+    assert chain.invoke(supervisor_input(200.0)).content == "writer_node"
+    assert len(calls) == 1
+
+
+def test_incomplete_backends_fail_when_instantiated():
+    class GetOnly(ResponseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly(60, 10)
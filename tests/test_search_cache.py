@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin_news_post import search_cache
+from linkedin_news_post.search_cache import SearchCache, search_key
+
+TODAY = date.today().isoformat()
+LAST_WEEK = (date.today() - timedelta(days=7)).isoformat()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(search_cache, "time", clock)
+    return clock
+
+
+def params(query="EASA eVTOL rules", end=TODAY):
+    return {"query": query, "num_results": 5, "start_published_date": "2026-09-01", "end_published_date": end}
+
+
+class Exa:
+    """Counts searches and answers each with its own result."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return SimpleNamespace(results=[SimpleNamespace(url=f"https://news.example/{self.calls}", title="EASA")])
+
+
+def urls(response):
+    return [result.url for result in response.results]
+
+
+def test_keys_ignore_query_formatting_and_time_of_day():
+    assert search_key(params("  easa   eVTOL rules! ")) == search_key(params())
+    assert search_key({**params(), "end_published_date": f"{TODAY}T08:15:00.000Z"}) == search_key(params())
+    assert search_key(params(end=LAST_WEEK)) != search_key(params())
+
+
+def test_windows_that_have_ended_stay_fresh_longer():
+    cache = SearchCache(None, open_ttl=60, closed_ttl=3600)
+    assert cache.ttl(TODAY) == 60
+    assert cache.ttl(None) == 60
+    assert cache.ttl(f"{LAST_WEEK}T00:00:00.000Z") == 3600
+
+
+def test_fresh_entries_are_served_without_searching(clock):
+    cache, exa = SearchCache(None, open_ttl=60), Exa()
+    first = cache.get_or_fetch(params(), exa)
+    clock.now += 59
+    assert urls(cache.get_or_fetch(params(), exa)) == urls(first)
+    assert exa.calls == 1
+    assert cache.stats()["hit"] == 1
+
+
+def test_open_windows_expire_before_closed_ones(clock):
+    cache, exa = SearchCache(None, open_ttl=60, closed_ttl=3600, stale_seconds=0), Exa()
+    cache.get_or_fetch(params(), exa)
+    cache.get_or_fetch(params(end=LAST_WEEK), exa)
+    clock.now += 61
+    cache.get_or_fetch(params(), exa)
+    cache.get_or_fetch(params(end=LAST_WEEK), exa)
+    assert exa.calls == 3
+
+
+def test_stale_entries_are_served_while_refreshed_in_the_background(clock):
+    cache, exa = SearchCache(None, open_ttl=60, stale_seconds=600), Exa()
+    cache.get_or_fetch(params(), exa)
+    clock.now += 120
+    assert urls(cache.get_or_fetch(params(), exa)) == ["https://news.example/1"]
+    cache._refresher.shutdown(wait=True)
+    assert exa.calls == 2
+    assert urls(cache.get_or_fetch(params(), exa)) == ["https://news.example/2"]
+    assert cache.stats()["stale"] == 1
+
+
+def test_entries_past_the_stale_window_are_searched_again(clock):
+    cache, exa = SearchCache(None, open_ttl=60, stale_seconds=600), Exa()
+    cache.get_or_fetch(params(), exa)
+    clock.now += 661
+    assert urls(cache.get_or_fetch(params(), exa)) == ["https://news.example/2"]
+    assert cache.stats()["miss"] == 2
+
+
+def test_failed_searches_are_not_cached():
+    cache, exa = SearchCache(None), Exa()
+
+    def failing():
+        raise RuntimeError("Exa is down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch(params(), failing)
+    cache.get_or_fetch(params(), exa)
+    assert exa.calls == 1
+
+
+def test_concurrent_misses_share_one_search():
+    cache, exa, release = SearchCache(None), Exa(), threading.Event()
+
+    def slow():
+        release.wait(5)
+        return exa()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch(params(), slow))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats()["lookups"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert exa.calls == 1
+    assert {tuple(urls(r)) for r in results} == {("https://news.example/1",)}
+    assert cache.stats()["coalesced"] == 3
+
+
+def test_concurrent_async_misses_share_one_search():
+    cache, exa = SearchCache(None), Exa()
+
+    async def afetch():
+        await asyncio.sleep(0.01)
+        return exa()
+
+    async def main():
+        return await asyncio.gather(*(cache.aget_or_fetch(params(), afetch) for _ in range(4)))
+
+    results = asyncio.run(main())
+    assert exa.calls == 1
+    assert len({id(r) for r in results}) == 1
+
+
+def test_the_disk_tier_survives_a_restart(tmp_path):
+    path, exa = str(tmp_path / "searches.sqlite"), Exa()
+    SearchCache(path).get_or_fetch(params(), exa)
+    restarted = SearchCache(path)
+    assert urls(restarted.get_or_fetch(params(), exa)) == ["https://news.example/1"]
+    assert exa.calls == 1
+    assert restarted.stats()["hit"] == 1
@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin_news_post.nodes.search_node import asearch_node
+from linkedin_news_post.resilience import CallPolicy, resilient
+
+
+def task(query="EASA eVTOL rules"):
+    return {"tool_call": {"id": "call-1", "name": "search_and_content", "args": {"query": query}}}
+
+
+def test_asearch_node_awaits_the_async_search(fresh_clients):
+    calls = []
+
+    async def asearch(query, **kwargs):
+        calls.append((query, kwargs))
+        return SimpleNamespace(results=[SimpleNamespace(
+            url="https://news.example/1", title="EASA", published_date="2026-10-01", author=None, text="rules", score=0.5
+        )])
+
+    def search(*args, **kwargs):
+        raise AssertionError("the async node must not use the blocking search")
+
+    fresh_clients.override("asearch", asearch)
+    fresh_clients.override("search", search)
+    update = asyncio.run(asearch_node(task(), {"configurable": {}}))
+    assert [query for query, _ in calls] == ["EASA eVTOL rules"]
+    assert set(calls[0][1]) == {"start_published_date", "end_published_date"}
+    assert [r["url"] for r in update["research_results"]] == ["https://news.example/1"]
+
+
+def test_async_calls_are_retried_on_the_event_loop():
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("reset")
+        return "ok"
+
+    call = resilient(flaky, "test-retry", idempotent=True, policy=CallPolicy(retries=2, backoff_base=0, backoff_max=0))
+    assert asyncio.run(call()) == "ok"
+    assert len(attempts) == 3
+
+
+def test_async_calls_time_out_and_are_cancelled():
+    cancelled = []
+
+    async def hung():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    call = resilient(hung, "test-timeout", policy=CallPolicy(timeout=0.05))
+    with pytest.raises(TimeoutError):
+        asyncio.run(call())
+    assert cancelled == [True]
+
+
+def test_slow_async_calls_are_hedged():
+    delays = [1.0, 0.0]
+
+    async def search():
+        await asyncio.sleep(delays.pop(0))
+        return "hedge"
+
+    call = resilient(search, "test-hedge", idempotent=True, policy=CallPolicy(hedge_after=0.02))
+    assert asyncio.run(call()) == "hedge"
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from linkedin_news_post.runtime import release_search_window, with_search_window
+from linkedin_news_post.search_window import SearchWindow, WindowCursor, rolling_window
+
+NOW = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def cursor(tmp_path):
+    return WindowCursor(str(tmp_path / "windows.json"), days_back=30, min_hours=24)
+
+
+def test_first_window_reaches_back_days_back(cursor):
+    window = cursor.next_window("acme", NOW)
+    assert window == SearchWindow(NOW - timedelta(days=30), NOW)
+
+
+def test_next_window_starts_where_the_previous_one_ended(cursor):
+    cursor.next_window("acme", NOW)
+    window = cursor.next_window("acme", NOW + timedelta(days=3))
+    assert window == SearchWindow(NOW, NOW + timedelta(days=3))
+
+
+def test_next_window_spans_at_least_min_hours(cursor):
+    cursor.next_window("acme", NOW)
+    later = NOW + timedelta(hours=2)
+    assert cursor.next_window("acme", later).start == later - timedelta(hours=24)
+
+
+def test_next_window_never_reaches_back_more_than_days_back(cursor):
+    cursor.next_window("acme", NOW)
+    later = NOW + timedelta(days=90)
+    assert cursor.next_window("acme", later).start == later - timedelta(days=30)
+
+
+def test_tenants_advance_independently(cursor):
+    cursor.next_window("acme", NOW)
+    assert cursor.next_window("globex", NOW + timedelta(days=3)).start == NOW + timedelta(days=3) - timedelta(days=30)
+
+
+def test_rewind_restores_the_previous_end(cursor):
+    cursor.next_window("acme", NOW)
+    failed = cursor.next_window("acme", NOW + timedelta(days=3))
+    cursor.rewind("acme", failed)
+    assert cursor.next_window("acme", NOW + timedelta(days=4)).start == NOW
+
+
+def test_rewind_of_the_first_window_forgets_the_tenant(cursor):
+    cursor.rewind("acme", cursor.next_window("acme", NOW))
+    assert cursor.positions() == {}
+
+
+def test_rewind_is_ignored_once_a_later_window_was_claimed(cursor):
+    stale = cursor.next_window("acme", NOW)
+    cursor.next_window("acme", NOW + timedelta(days=3))
+    cursor.rewind("acme", stale)
+    assert cursor.positions() == {"acme": "2026-10-04T12:00:00.000Z"}
+
+
+def test_cursors_survive_a_restart(cursor):
+    cursor.next_window("acme", NOW)
+    reloaded = WindowCursor(cursor.path, days_back=30, min_hours=24)
+    assert reloaded.next_window("acme", NOW + timedelta(days=2)).start == NOW
+
+
+def test_clamp_limits_a_requested_range_to_the_window():
+    window = rolling_window(NOW, days_back=7)
+    assert window.clamp("2026-09-28", None) == ("2026-09-28T00:00:00.000Z", window.end_date)
+    assert window.clamp("2020-01-01", "2030-01-01") == (window.start_date, window.end_date)
+    assert window.clamp("2020-01-01", "2020-02-01") == (window.start_date, window.end_date)
+    assert window.clamp("not a date", None) == (window.start_date, window.end_date)
+
+
+def test_with_search_window_keeps_a_configured_window():
+    configurable = {"search_start_date": "2026-09-01", "search_end_date": "2026-09-10"}
+    config, claimed = with_search_window({"configurable": configurable}, "advancing")
+    assert config["configurable"] == configurable
+    assert claimed is None
+
+
+def test_with_search_window_claims_and_releases_an_advancing_window(fresh_clients, cursor):
+    fresh_clients.override("window_cursor", cursor)
+    config, claimed = with_search_window({"configurable": {"tenant_id": "acme"}}, "advancing")
+    assert config["configurable"]["search_end_date"] == claimed.end_date
+    assert "acme" in cursor.positions()
+    release_search_window(config, claimed)
+    assert cursor.positions() == {}
+
+
+def test_with_search_window_rejects_unknown_strategies():
+    with pytest.raises(ValueError):
+        with_search_window(None, "sideways")